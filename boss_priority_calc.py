@@ -1,11 +1,37 @@
 from enum import IntEnum
 import collections
-import matplotlib.pyplot as plt
+import contextlib
+import io
 import numpy as np
 import math
-
-verbose = True
+import concurrent.futures
+import csv
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+verbose = False # print every upgrade found during loop calc when no event sink is given
 SCORE_SF = 100
+ZG_ENCHANTS_TRGT = 2 # each character expected to get x enchants
+SIM_BLOCK = 100000 # simulated lockouts per worker task
+SIM_CHUNK = 10000 # simulated lockouts rolled per vectorized batch
+SIM_BINS = 1000 # histogram bins per boss used for simulated percentiles
+NUMPY_BLOCK_CELLS = 1 << 23 # character x item cells per column block of the numpy engine, bounds its peak memory
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),"data") # default bosses, loot and roster files
+CACHE_VERSION = 2 # bump when the pickled BossPrioCalc layout changes
+RESULT_VERSION = 1 # bump when calc results change for the same inputs, invalidates ResultCache entries
+RESULT_CACHE_DIR = os.path.join(DATA_DIR,".results") # default ResultCache directory
+RESULT_CACHE_BYTES = 64*1024*1024 # default ResultCache size bound
+PROFILE_METHODS = [ # BossPrioCalc phases and helpers timed by enableProfiling
+    "calc","recalc","plot","simulate","projectWeeks","optimizeRoute",
+    "_calcLoop","_buildCurrentCache","_buildCharCurrent","_getCharCurrent","_calcBossCharUpgrade","_describeUpgrade","_calcBossEnu",
+    "_calcNumpy","_buildLootArrays","_buildCharArrays","_fillCharRow","_calcUpgradeMatrix","_creditUpgrade",
+]
+PROFILE_FUNCTIONS = ["loadBossPrioCalc","printUpgrade"] # module functions timed by enableProfiling
 
 class SpecClass(IntEnum):
     NONE = 0
@@ -52,6 +78,27 @@ class Raid(IntEnum):
     AQ40 = 5
     SIZE = 6
 
+class Role(IntEnum):
+    NONE = 0
+    TANK = 1
+    HEALER = 2
+    MELEE = 3
+    RANGED = 4
+    SIZE = 5
+
+SpecToRole = [Role.NONE]*SpecClass.SIZE
+SpecToRole[SpecClass.RESTO_DRUID] = Role.HEALER
+SpecToRole[SpecClass.FERAL_TANK_DRUID] = Role.TANK
+SpecToRole[SpecClass.MARKS_HUNTER] = Role.RANGED
+SpecToRole[SpecClass.FIRE_MAGE] = Role.RANGED
+SpecToRole[SpecClass.HOLY_PALADIN] = Role.HEALER
+SpecToRole[SpecClass.HOLY_PRIEST] = Role.HEALER
+SpecToRole[SpecClass.COMBAT_ROGUE] = Role.MELEE
+SpecToRole[SpecClass.RESTO_SHAMAN] = Role.HEALER
+SpecToRole[SpecClass.ANY_WARLOCK] = Role.RANGED
+SpecToRole[SpecClass.PROT_THREAT_WARRIOR] = Role.TANK
+SpecToRole[SpecClass.FURY_WARRIOR] = Role.MELEE
+
 RaidToBossMap = [[]]*Raid.SIZE
 RaidToBossMap[Raid.ONY] = ["Onyxia"]
 RaidToBossMap[Raid.MC] = ["Lucifron","Magmadar","Gehennas","Garr","Baron Geddon","Shazzrah","Golemagg the Incinerator","Sulfuron Harbinger","Majordomo Executus","Ragnaros","MC Trash"]
@@ -60,6 +107,49 @@ RaidToBossMap[Raid.ZG] = ["Jin'do the Hexxer","High Priest Thekal","Bloodlord Ma
 RaidToBossMap[Raid.AQ20] = ["Kurinnaxx","General Rajaxx","Moam","Buru the Gorger","Ayamiss the Hunter","Ossirian the Unscarred","AQ20 Trash"]
 RaidToBossMap[Raid.AQ40] = ["The Prophet Skeram","Vem","Princess Yauj","Lord Kri","Battleguard Sartura","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro","C'Thun","AQ40 Trash"]
 
+# map from Raid to days between lockout resets
+RaidResetDays = [7]*Raid.SIZE
+RaidResetDays[Raid.ONY] = 5
+RaidResetDays[Raid.ZG] = 3
+RaidResetDays[Raid.AQ20] = 3
+
+# map from boss name to names of bosses of the same raid that must be killed first, bosses not listed are optional and free to kill
+# RaidToBossMap order is a valid kill order
+RaidBossDeps = [{} for raid in range(Raid.SIZE)]
+RaidBossDeps[Raid.MC] = {
+    "Magmadar":["Lucifron"],
+    "Majordomo Executus":["Magmadar","Gehennas","Garr","Baron Geddon","Shazzrah","Golemagg the Incinerator","Sulfuron Harbinger"], # runes doused
+    "Ragnaros":["Majordomo Executus"],
+}
+RaidBossDeps[Raid.BWL] = {
+    "Vaelastrasz the Corrupt":["Razorgore the Untamed"],
+    "Broodlord Lashlayer":["Vaelastrasz the Corrupt"],
+    "Firemaw":["Broodlord Lashlayer"],
+    "Ebonroc":["Broodlord Lashlayer"],
+    "Flamegor":["Broodlord Lashlayer"],
+    "Chromaggus":["Firemaw","Ebonroc","Flamegor"],
+    "Nefarian":["Chromaggus"],
+}
+RaidBossDeps[Raid.AQ20] = {
+    "General Rajaxx":["Kurinnaxx"],
+    "Moam":["Kurinnaxx"],
+    "Buru the Gorger":["Kurinnaxx"],
+    "Ayamiss the Hunter":["Kurinnaxx"],
+    "Ossirian the Unscarred":["Kurinnaxx"],
+}
+RaidBossDeps[Raid.AQ40] = {
+    "Vem":["The Prophet Skeram"], # bug trio is optional, Vem, Yauj and Kri are one encounter
+    "Princess Yauj":["Vem"],
+    "Lord Kri":["Vem"],
+    "Battleguard Sartura":["The Prophet Skeram"],
+    "Fankriss the Unyielding":["Battleguard Sartura"],
+    "Viscidus":["Fankriss the Unyielding"],
+    "Princess Huhuran":["Fankriss the Unyielding"],
+    "Twin Emperors":["Princess Huhuran"],
+    "Ouro":["Twin Emperors"],
+    "C'Thun":["Twin Emperors"],
+}
+
 class Character:
 
     def __init__(self,name,spec_class,head,neck,shoulder,chest,waist,legs,feet,wrist,hands,fingers,trinkets,back,mh,oh,th,ranged,zg_enchants):
@@ -86,11 +176,16 @@ class Character:
         self.gear[Slot.TWO_HAND] = th
         self.gear[Slot.RANGED] = ranged
         self.gear[Slot.ZG_ENCHANTS] = zg_enchants #count
+        # map from slot to array of integer ids of items that character has (filled by BossPrioCalc)
+        self.gear_ids = [np.zeros(0,dtype=int)]*Slot.SIZE
+        # map from slot to set of integer ids of items that character has, a handful per slot so membership is O(1)
+        self.gear_set = [frozenset()]*Slot.SIZE
         
 class Loot:
 
     def __init__(self,name,slot):
-        self.name = None # string name
+        self.name = name # string name
+        self.id = None # dense integer item id
         self.slot = slot # Slot enum
         self.ep_map = [0]*SpecClass.SIZE # map from SpecClass to ep value
 
@@ -105,16 +200,104 @@ class Boss:
         self.clear_time = clear_time # minutes to clear boss from previous boss
         self.loot_table = [] # array of names of items dropped by this boss
         self.loot_drop_chance = {} # map from loot name to drop chance of the item in %
+        self.spec_loot_table = [[] for spec_class in range(SpecClass.SIZE)] # map from SpecClass to (item id, drop chance fraction) of loot_table items with nonzero ep for it
         self.enu = {} # expected normalized upgrade for a raid from this boss (map from character name to enu)
         self.mean_enu = 0 # mean expected normalized upgrade for boss
         self.mean_enupm = 0 # mean_enu per minute (marginal time)
 
+class LootSnapshot:
+
+    def __init__(self,path):
+        # open loot database arrays written by BossPrioCalc.exportSnapshot as read-only memory maps
+        self.path = path # snapshot directory
+        self.item_names = self._load("item_names") # map from item id to item name
+        self.item_slot = self._load("item_slot") # map from item id to Slot
+        self.item_ep = self._load("item_ep") # item id x SpecClass ep matrix
+        self.boss_names = self._load("boss_names") # map from boss index to boss name
+        self.boss_raid = self._load("boss_raid") # map from boss index to Raid
+        self.boss_clear_time = self._load("boss_clear_time") # map from boss index to clear time
+        self.drop_chance = self._load("drop_chance") # boss x item id drop chance fraction matrix
+        self.ep_bis = self._load("ep_bis") # map from SpecClass to BiS ep
+
+    def _load(self,name):
+        return(np.load(os.path.join(self.path,name + ".npy"),mmap_mode="r"))
+
+class CharCurrent:
+
+    def __init__(self):
+        self.slot = [("NONE",0)]*Slot.SIZE # map from slot to (item name, ep) of best item (worst item for FINGER/TRINKET)
+        self.weapon_item = "NONE" # name of best current weapon combo (MH + OH or 2H)
+        self.weapon_ep = 0 # ep of best current weapon combo
+
+class ResultCache:
+
+    def __init__(self,path=RESULT_CACHE_DIR,max_bytes=RESULT_CACHE_BYTES):
+        # calc results stored on disk as one pickle per input key, least recently used entries evicted beyond max_bytes
+        self.path = path # cache directory
+        self.max_bytes = max_bytes # size bound of all entries
+
+    def _entryPath(self,key):
+        return(os.path.join(self.path,key + ".pkl"))
+
+    def get(self,key):
+        # returns cached results of key or None, a hit marks the entry as recently used
+        entry_path = self._entryPath(key)
+        try:
+            with open(entry_path,"rb") as f:
+                results = pickle.load(f)
+            os.utime(entry_path)
+        except (OSError,EOFError,pickle.UnpicklingError,AttributeError,ValueError):
+            return(None)
+        return(results)
+
+    def put(self,key,results):
+        # store results of key and evict least recently used entries until the cache fits max_bytes
+        try:
+            os.makedirs(self.path,exist_ok=True)
+            entry_path_tmp = self._entryPath(key) + ".tmp"
+            with open(entry_path_tmp,"wb") as f:
+                pickle.dump(results,f,protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(entry_path_tmp,self._entryPath(key))
+            self._evict()
+        except OSError:
+            # cache is only an optimization
+            pass
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns,stat.st_size,entry.path))
+        entries.sort()
+        total = sum(size for mtime , size , entry_path in entries)
+        for mtime , size , entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(entry_path)
+            total -= size
+
+# upgrade found by loop calc, enu is None when character already has the item
+# item_new / item_current are display names (weapon combos joined with " +", ZG enchants prefixed with count)
+UpgradeEvent = collections.namedtuple("UpgradeEvent",["boss","char","item_new","item_current","slot","ep_new","ep_current","enu"])
+
+def printUpgrade(event):
+    # event sink printing upgrades in the original verbose format
+    if event.enu is None:
+        print("{}: {} already has {}".format(event.boss,event.char,event.item_new))
+    else:
+        print("{}: {} ({}) is a {} slot upgrade over {} ({}) for {}, enu: {:0.2f}".format(event.boss,event.item_new,event.ep_new,event.slot.name,event.item_current,event.ep_current,event.char,event.enu))
+
 class BossPrioCalc:
 
     def __init__(self):
         self.loot_db = {} # map of loot name to Loot object
         self.bosses = {} # map of boss names to Boss object
         self.raid = {} # map of character names to Character object 
+        self.loot_bosses = {} # map of loot name to list of names of bosses that drop it
+        self.item_ids = {} # map of item name to dense integer item id
+        self.item_names = [] # map of item id to item name
+        self.loot_by_id = [] # map of item id to Loot object (None for items not in loot_db)
         self.ep_bis = { # map from SpecClass enum to BiS ep possible in P6 for that SpecClass
             SpecClass.RESTO_DRUID:1685,
             SpecClass.FERAL_TANK_DRUID:3586,
@@ -128,10 +311,33 @@ class BossPrioCalc:
             SpecClass.PROT_THREAT_WARRIOR:2858,
             SpecClass.FURY_WARRIOR:3873,
         }
+        self._calc_chars = None # set of character names in raid at last calc
+        self._calc_contention = True # contention mode of last calc
+        self._upgrades = None # map from boss name to map from character name to loot upgrades of last calc
+        self._snapshot = None # attached LootSnapshot used instead of loot_db
+        self._dirty = set() # set of character names whose gear changed since last calc
+        self._dirty_bosses = set() # set of boss names whose loot changed since last calc
 
     def addBoss(self,name,raid,clear_time):
         self.bosses[name] = Boss(name,raid,clear_time)
 
+    def _internItem(self,item_name):
+        # returns dense integer id of item name, assigning the next id on first sight
+        if item_name not in self.item_ids:
+            self.item_ids[item_name] = len(self.item_names)
+            self.item_names.append(item_name)
+            self.loot_by_id.append(None)
+        return(self.item_ids[item_name])
+
+    def _internGear(self,char_name,slot):
+        # resolve character item names of slot to integer ids and id set
+        char = self.raid[char_name]
+        if slot == Slot.ZG_ENCHANTS:
+            return
+        item_ids = [self._internItem(item_name) for item_name in char.gear[slot]]
+        char.gear_ids[slot] = np.array(item_ids,dtype=int)
+        char.gear_set[slot] = frozenset(item_ids)
+
     def addLoot(self,boss_list,loot_name,slot,drop_chance_list,ep_map):
         # add actual object to loot_db
         loot = Loot(loot_name,slot)
@@ -145,6 +351,9 @@ class BossPrioCalc:
             raise RuntimeError("Duplicate loot_name found")
 
         self.loot_db[loot_name] = loot
+        self.loot_bosses[loot_name] = []
+        loot.id = self._internItem(loot_name)
+        self.loot_by_id[loot.id] = loot
 
         # add to bosses
         # check that same length arrays
@@ -159,25 +368,159 @@ class BossPrioCalc:
                 # add data to boss
                 self.bosses[boss].loot_drop_chance[loot_name] = drop_chance
                 self.bosses[boss].loot_table.append(loot_name)
+                self.loot_bosses[loot_name].append(boss)
+                for spec_class in ep_map:
+                    if ep_map[spec_class] != 0:
+                        self.bosses[boss].spec_loot_table[spec_class].append((loot.id,drop_chance/100.0))
         
+    def loadBosses(self,path):
+        # add bosses from json list of addBoss arguments, raid given by Raid name
+        with open(path,encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            self.addBoss(entry["name"],Raid[entry["raid"]],entry["clear_time"])
+
+    def loadLoot(self,path):
+        # add loot from json list of addLoot arguments, slot and ep_map keys given by Slot and SpecClass names
+        with open(path,encoding="utf-8") as f:
+            entries = json.load(f)
+        for entry in entries:
+            ep_map = {}
+            for spec_name in entry["ep_map"]:
+                ep_map[SpecClass[spec_name]] = entry["ep_map"][spec_name]
+            self.addLoot(entry["boss_list"],entry["loot_name"],Slot[entry["slot"]],entry["drop_chance_list"],ep_map)
+
+    def loadRoster(self,path):
+        # add characters from json list of addChar arguments, spec_class given by SpecClass name
+        with open(path,encoding="utf-8") as f:
+            self.addRoster(json.load(f))
+
+    def addRoster(self,entries):
+        # add characters from list of addChar argument maps, spec_class given by SpecClass name
+        for entry in entries:
+            char_args = dict(entry)
+            char_args["spec_class"] = SpecClass[entry["spec_class"]]
+            self.addChar(**char_args)
+
+    def setLootEP(self,loot_name,ep_map):
+        # replace ep values of loot and mark bosses that drop it and characters that have it for recalc
+        if loot_name not in self.loot_db:
+            print("{} is not in loot_db".format(loot_name))
+            raise RuntimeError("Unknown loot_name")
+
+        loot = self.loot_db[loot_name]
+        loot.ep_map = [0]*SpecClass.SIZE
+        for spec_class in ep_map:
+            loot.addEP(spec_class,ep_map[spec_class])
+
+        for boss in self.loot_bosses[loot_name]:
+            self._indexBossLoot(boss)
+        self._dirty_bosses.update(self.loot_bosses[loot_name])
+        for char_name in self.raid:
+            # current ep of every character depends on ZG enchant ep
+            # worn items count in the slot they are listed under, which need not be loot.slot, so check every slot
+            if loot.slot == Slot.ZG_ENCHANTS or any(loot.id in item_ids for item_ids in self.raid[char_name].gear_set):
+                self._dirty.add(char_name)
+
+    def setLootDropChance(self,loot_name,boss_list,drop_chance_list):
+        # replace drop chance of loot for given bosses and mark those bosses for recalc
+        if loot_name not in self.loot_db:
+            print("{} is not in loot_db".format(loot_name))
+            raise RuntimeError("Unknown loot_name")
+        if len(boss_list) != len(drop_chance_list):
+            print("{} has inconsistent length arrays".format(loot_name))
+            raise RuntimeError("Array lengths")
+
+        for i in range(len(boss_list)):
+            boss = boss_list[i]
+            if boss == "CURRENT":
+                # worn before raids, no boss to update like in addLoot
+                continue
+            if loot_name not in self.bosses[boss].loot_drop_chance:
+                self.bosses[boss].loot_table.append(loot_name)
+                self.loot_bosses[loot_name].append(boss)
+            self.bosses[boss].loot_drop_chance[loot_name] = drop_chance_list[i]
+            self._indexBossLoot(boss)
+            self._dirty_bosses.add(boss)
+
+    def _indexBossLoot(self,boss_name):
+        # rebuild per SpecClass loot tables of boss, keeping loot_table order
+        boss = self.bosses[boss_name]
+        for spec_class in range(SpecClass.SIZE):
+            boss.spec_loot_table[spec_class] = []
+            for loot_name in boss.loot_table:
+                loot = self.loot_db[loot_name]
+                if loot.ep_map[spec_class] != 0:
+                    boss.spec_loot_table[spec_class].append((loot.id,boss.loot_drop_chance[loot_name]/100.0))
+
     def addChar(self,name,spec_class,head,neck,shoulder,chest,waist,legs,feet,wrist,hands,fingers,trinkets,back,mh,oh,th,ranged,zg_enchants):
         if name in self.raid:
             print("{} is already in raid".format(name))
             raise RuntimeError("Duplicate name in raid")
 
         self.raid[name] = Character(name,spec_class,head,neck,shoulder,chest,waist,legs,feet,wrist,hands,fingers,trinkets,back,mh,oh,th,ranged,zg_enchants)
-    
-    def _checkCharHas(self,char_name,spec_class,slot,item_name_trgt):
-        # checks if character has the given item
+        for slot in Slot:
+            if slot != Slot.NONE and slot != Slot.SIZE:
+                self._internGear(name,slot)
+
+    def clearRaid(self):
+        # remove all characters and calc state, keeping bosses and loot
+        self.raid = {}
+        self._calc_chars = None
+        self._upgrades = None
+        self._dirty = set()
+        self._dirty_bosses = set()
+        if self._snapshot is not None:
+            # forget gear items interned beyond the snapshot so item ids match the snapshot arrays again
+            n_items = len(self._snapshot.item_names)
+            for item_name in self.item_names[n_items:]:
+                del self.item_ids[item_name]
+            del self.item_names[n_items:]
+            del self.loot_by_id[n_items:]
+
+    def setGear(self,char_name,slot,items):
+        # replace character items for given slot (count for ZG_ENCHANTS) and mark character for recalc
+        if char_name not in self.raid:
+            print("{} is not in raid".format(char_name))
+            raise RuntimeError("Unknown character")
+
+        self.raid[char_name].gear[slot] = items
+        self._internGear(char_name,slot)
+        self._dirty.add(char_name)
+
+    def equipItem(self,char_name,item_name):
+        # give item to character, replacing worst ring or trinket when both are already filled
+        if char_name not in self.raid:
+            print("{} is not in raid".format(char_name))
+            raise RuntimeError("Unknown character")
+
+        slot = self.loot_db[item_name].slot
+        char = self.raid[char_name]
         if slot == Slot.ZG_ENCHANTS:
-            return(False)
+            items = char.gear[slot] + 1
+        elif (slot == Slot.FINGER or slot == Slot.TRINKET) and len(char.gear[slot]) >= 2:
+            item_name_worst , _ = self._getCharCurrent(char_name,char.spec_class,slot)
+            items = list(char.gear[slot])
+            items[items.index(item_name_worst)] = item_name
+        else:
+            items = char.gear[slot] + [item_name]
+        self.setGear(char_name,slot,items)
 
-        for item_name in self.raid[char_name].gear[slot]:
-                if item_name == item_name_trgt:
-                    return(True)
+    def _checkCharHas(self,char_name,spec_class,slot,item_id_trgt):
+        # checks if character has the given item id
+        if slot == Slot.ZG_ENCHANTS:
+            return(False)
 
-        return(False)
+        return(item_id_trgt in self.raid[char_name].gear_set[slot])
     
+    def _getItemEP(self,item_id,spec_class):
+        # returns ep of item id for given SpecClass
+        loot = self.loot_by_id[item_id]
+        if loot is None:
+            print("{} is not in loot_db".format(self.item_names[item_id]))
+            raise RuntimeError("Unknown item")
+        return(loot.ep_map[spec_class])
+
     def _getCharCurrent(self,char_name,spec_class,slot):
         # returns the current item for given slot that player has
         
@@ -188,18 +531,20 @@ class BossPrioCalc:
             # get min ep (replace worst of the two)
             ep = math.inf
             item_name_print = "NONE"
-            for item_name in self.raid[char_name].gear[slot]:
-                if self.loot_db[item_name].ep_map[spec_class] <= ep:
-                    ep = self.loot_db[item_name].ep_map[spec_class]
-                    item_name_print = item_name
+            for item_id in self.raid[char_name].gear_ids[slot]:
+                ep_item = self._getItemEP(item_id,spec_class)
+                if ep_item <= ep:
+                    ep = ep_item
+                    item_name_print = self.item_names[item_id]
         else:
             # get max ep
             ep = 0
             item_name_print = "NONE"
-            for item_name in self.raid[char_name].gear[slot]:
-                if self.loot_db[item_name].ep_map[spec_class] >= ep:
-                    ep = self.loot_db[item_name].ep_map[spec_class]
-                    item_name_print = item_name
+            for item_id in self.raid[char_name].gear_ids[slot]:
+                ep_item = self._getItemEP(item_id,spec_class)
+                if ep_item >= ep:
+                    ep = ep_item
+                    item_name_print = self.item_names[item_id]
 
         if ep == 0 and item_name_print != "NONE" and slot != slot.ZG_ENCHANTS:
             print("item_name_print: {}, char_name: {}".format(item_name_print,char_name))
@@ -207,75 +552,1059 @@ class BossPrioCalc:
 
         return(item_name_print,ep)
 
-    def calc(self):
-        # calculate metrics and plot
+    def _buildCharCurrent(self,char_name):
+        # scans each gear slot of character once and caches current item and ep
+        spec_class = self.raid[char_name].spec_class
+        current = CharCurrent()
+        for slot in Slot:
+            if slot == Slot.NONE or slot == Slot.SIZE:
+                continue
+            current.slot[slot] = self._getCharCurrent(char_name,spec_class,slot)
+
+        # determine best current weapons
+        item_name_mh_curr , ep_mh_curr = current.slot[Slot.MAIN_HAND]
+        item_name_oh_curr , ep_oh_curr = current.slot[Slot.OFF_HAND]
+        item_name_2h_curr , ep_2h_curr = current.slot[Slot.TWO_HAND]
+        if (ep_mh_curr + ep_oh_curr) >= ep_2h_curr:
+            current.weapon_ep = ep_mh_curr + ep_oh_curr
+            current.weapon_item = item_name_mh_curr + " + " + item_name_oh_curr
+        else:
+            current.weapon_ep = ep_2h_curr
+            current.weapon_item = item_name_2h_curr
+
+        return(current)
+
+    def _buildCurrentCache(self):
+        # build current gear cache for every character in raid
+        self._current = {}
+        for char_name in self.raid:
+            self._current[char_name] = self._buildCharCurrent(char_name)
+
+    def _calcBossCharUpgrade(self,boss_name,char_name,sink=None):
+        # calculate expected normalized upgrade of character from every loot of boss
+        # returns map from loot id to enu for loot that is an upgrade
+        # sink is called with an UpgradeEvent for every upgrade and already owned item, display names are only built when given
+        boss = self.bosses[boss_name]
+        spec_class = self.raid[char_name].spec_class
+        upgrade = {}
+        gear_set = self.raid[char_name].gear_set
+        # loot worth 0 ep for the spec can never be an upgrade
+        for loot_id , drop_chance in boss.spec_loot_table[spec_class]:
+            # fetch loot
+            loot_new = self.loot_by_id[loot_id]
+            slot = loot_new.slot
+
+            # check if character already has the item
+            if loot_id in gear_set[slot]:
+                if sink is not None:
+                    sink(UpgradeEvent(boss_name,char_name,loot_new.name,loot_new.name,slot,0,0,None))
+                continue
+
+            ep_new , ep_current = self._compareLoot(char_name,spec_class,loot_new)
+
+            # calculate ep upgrade
+            if ep_new > ep_current:
+                enu = SCORE_SF*((ep_new - ep_current)*drop_chance)/self.ep_bis[spec_class] # expected normallized upgrade
+                upgrade[loot_id] = enu
+                if sink is not None:
+                    item_new , item_current = self._describeUpgrade(char_name,loot_new)
+                    sink(UpgradeEvent(boss_name,char_name,item_new,item_current,slot,ep_new,ep_current,enu))
+
+        return(upgrade)
+
+    def _compareLoot(self,char_name,spec_class,loot_new):
+        # returns (ep_new, ep_current) of loot for character, the ep it would have and the current ep it replaces
+        current = self._current[char_name]
+        slot = loot_new.slot
+        ep_new = loot_new.ep_map[spec_class]
+        ep_current = current.slot[slot][1]
+
+        # handle special cases
+        if slot == Slot.ZG_ENCHANTS:
+            # each character expected to get x enchants
+            ep_new *= ZG_ENCHANTS_TRGT
+            ep_current *= self.raid[char_name].gear[slot]
+
+        elif slot == Slot.MAIN_HAND or slot == Slot.OFF_HAND or slot == Slot.TWO_HAND:
+            # best current weapon combo vs new item paired with current other hand
+            ep_current = current.weapon_ep
+            if slot == Slot.MAIN_HAND:
+                ep_new += current.slot[Slot.OFF_HAND][1]
+            elif slot == Slot.OFF_HAND:
+                ep_new += current.slot[Slot.MAIN_HAND][1]
+        return(ep_new,ep_current)
+
+    def _describeUpgrade(self,char_name,loot_new):
+        # display names of new and current item for upgrade events, matching how ep_new and ep_current are combined
+        current = self._current[char_name]
+        slot = loot_new.slot
+        item_new = loot_new.name
+        item_current = current.slot[slot][0]
+        if slot == Slot.ZG_ENCHANTS:
+            item_new = "{}x {}".format(ZG_ENCHANTS_TRGT,loot_new.name)
+            item_current = "{}x {}".format(self.raid[char_name].gear[slot],loot_new.name)
+        elif slot == Slot.MAIN_HAND or slot == Slot.OFF_HAND or slot == Slot.TWO_HAND:
+            item_current = current.weapon_item
+            if slot == Slot.MAIN_HAND:
+                item_new = item_new + " + " + current.slot[Slot.OFF_HAND][0]
+            elif slot == Slot.OFF_HAND:
+                item_new = current.slot[Slot.MAIN_HAND][0] + " + " + item_new
+        return(item_new,item_current)
+
+    def _calcBossEnu(self,boss_name,char_names,contention):
+        # combine cached loot upgrades of given characters into map from character name to enu for boss
+        # with contention each drop only goes to its best recipient (split evenly on ties)
+        boss = self.bosses[boss_name]
+        upgrades = self._upgrades[boss_name]
+        enu = {}
+        for char_name in char_names:
+            enu[char_name] = 0
+        if not contention:
+            for char_name in char_names:
+                for loot_name in upgrades[char_name]:
+                    enu[char_name] += upgrades[char_name][loot_name]
+            return(enu)
+
+        for loot_name in boss.loot_table:
+            # find best recipient(s) of loot
+            loot_id = self.loot_db[loot_name].id
+            enu_best = 0
+            winners = []
+            for char_name in char_names:
+                enu_char = upgrades[char_name].get(loot_id,0)
+                if enu_char > enu_best:
+                    enu_best = enu_char
+                    winners = [char_name]
+                elif enu_char == enu_best and enu_char > 0:
+                    winners.append(char_name)
+            for char_name in winners:
+                enu[char_name] += enu_best/len(winners)
+
+        return(enu)
+
+    def _calcLoop(self,contention,sink=None):
+        # calculate metrics by looping over every boss, character and loot
+        for boss_name in self._iterCalcLoop(contention,sink):
+            pass
+
+    def _iterCalcLoop(self,contention,sink):
+        # generator doing _calcLoop one boss at a time, yields boss name once its metrics are filled
+        if self._snapshot is not None:
+            print("loop engine needs loot_db, use engine=\"numpy\" with an attached snapshot")
+            raise RuntimeError("No loot_db")
+        self._buildCurrentCache()
+        self._upgrades = {} # map from boss name to map from character name to loot upgrades
         for boss_name in self.bosses:
-            self.bosses[boss_name].mean_enu = 0.0
-            self.bosses[boss_name].mean_enupm = 0.0
+            self._upgrades[boss_name] = {}
             for char_name in self.raid:
-                spec_class = self.raid[char_name].spec_class
-                # init total expected upgrade
-                self.bosses[boss_name].enu[char_name] = 0
-                for loot_name in self.bosses[boss_name].loot_table:
-                    # fetch loot
-                    loot_new = self.loot_db[loot_name]
-                    slot = loot_new.slot
-                    drop_chance = self.bosses[boss_name].loot_drop_chance[loot_name]/100.0 # convert to fraction
-
-                    # check if character already has the item
-                    if self._checkCharHas(char_name,spec_class,slot,loot_name):
-                        print("{}: {} already has {}".format(boss_name,char_name,loot_name))
-                        continue
+                self._upgrades[boss_name][char_name] = self._calcBossCharUpgrade(boss_name,char_name,sink)
+            self.bosses[boss_name].enu = self._calcBossEnu(boss_name,self.raid,contention)
 
-                    # get current item
-                    item_new_print = loot_name
-                    ep_new = self.loot_db[loot_name].ep_map[spec_class]
-                    item_current_print , ep_current = self._getCharCurrent(char_name,spec_class,slot)
-
-                    # handle special cases
-                    if slot == Slot.ZG_ENCHANTS:
-                        # each character expected to get x enchants
-                        ZG_ENCHANTS_TRGT = 2
-                        item_new_print = "{}x {}".format(ZG_ENCHANTS_TRGT,loot_name)
-                        current_cnt = self.raid[char_name].gear[slot]
-                        item_current_print = "{}x {}".format(current_cnt,loot_name)
-                        ep_new *= ZG_ENCHANTS_TRGT
-                        ep_current *= current_cnt
-                        
-                    elif slot == Slot.MAIN_HAND or slot == Slot.OFF_HAND or slot == Slot.TWO_HAND:
-                        # get current items / ep values for weapons
-                        item_name_mh_curr , ep_mh_curr = self._getCharCurrent(char_name,spec_class,Slot.MAIN_HAND)
-                        item_name_oh_curr , ep_oh_curr = self._getCharCurrent(char_name,spec_class,Slot.OFF_HAND)
-                        item_name_2h_curr , ep_2h_curr = self._getCharCurrent(char_name,spec_class,Slot.TWO_HAND)
-                        # determine best current
-                        if (ep_mh_curr + ep_oh_curr) >= ep_2h_curr:
-                            ep_current = ep_mh_curr + ep_oh_curr
-                            item_current_print = item_name_mh_curr + " + " + item_name_oh_curr
-                        else:
-                            ep_current = ep_2h_curr
-                            item_current_print = item_name_2h_curr
-                        # determine best new
-                        if slot == Slot.MAIN_HAND:
-                            ep_new += ep_oh_curr
-                            item_new_print = item_new_print + " + " + item_name_oh_curr
-                        elif slot == Slot.OFF_HAND:
-                            ep_new += ep_mh_curr
-                            item_new_print = item_name_mh_curr + " + " + item_new_print
-
-                    # calculate ep upgrade
-                    if ep_new > ep_current:
-                        enu = SCORE_SF*((ep_new - ep_current)*drop_chance)/self.ep_bis[spec_class] # expected normallized upgrade
-                        self.bosses[boss_name].enu[char_name] += enu
-                        if verbose:
-                            print("{}: {} ({}) is a {} slot upgrade over {} ({}) for {}, enu: {:0.2f}".format(boss_name,item_new_print,ep_new,slot.name,item_current_print,ep_current,char_name,enu))
-            
-                # Loot loop done, sum character mean enu 
+            # sum character enu and calculate average enu for whole raid
+            self.bosses[boss_name].mean_enu = 0.0
+            for char_name in self.raid:
                 self.bosses[boss_name].mean_enu += self.bosses[boss_name].enu[char_name]
-
-            # Character loop done, calculate average enu for whole raid
             self.bosses[boss_name].mean_enu /= len(self.raid)
             self.bosses[boss_name].mean_enupm = self.bosses[boss_name].mean_enu/self.bosses[boss_name].clear_time
-        
+            yield boss_name
+
+        self._calc_chars = set(self.raid)
+        self._calc_contention = contention
+        self._dirty = set()
+        self._dirty_bosses = set()
+
+    def recalc(self,sink=None):
+        # recalculate only characters whose gear changed and bosses whose loot changed since last calc,
+        # adjusting boss means by the difference
+        # sink gets UpgradeEvents of the recalculated characters only
+        sink = self._eventSink(sink)
+        if self._calc_chars != set(self.raid) or self._upgrades is None:
+            # raid changed or last calc kept no loop state, full recalculation needed
+            self._calcLoop(self._calc_contention,sink)
+            return
+
+        contention = self._calc_contention
+        dirty = [char_name for char_name in self.raid if char_name in self._dirty]
+        n_chars = len(self.raid)
+        for char_name in dirty:
+            self._current[char_name] = self._buildCharCurrent(char_name)
+        for boss_name in self.bosses:
+            boss = self.bosses[boss_name]
+            if boss_name in self._dirty_bosses:
+                char_names = list(self.raid)
+            else:
+                char_names = dirty
+            if len(char_names) == 0:
+                continue
+            for char_name in char_names:
+                self._upgrades[boss_name][char_name] = self._calcBossCharUpgrade(boss_name,char_name,sink)
+            if contention:
+                # any character can lose or win a drop, recombine whole boss from cached upgrades
+                char_names = list(self.raid)
+            enu = self._calcBossEnu(boss_name,char_names,contention)
+            for char_name in char_names:
+                boss.mean_enu += (enu[char_name] - boss.enu[char_name])/n_chars
+                boss.enu[char_name] = enu[char_name]
+            boss.mean_enupm = boss.mean_enu/boss.clear_time
+
+        self._dirty = set()
+        self._dirty_bosses = set()
+
+    def _eventSink(self,sink):
+        # sink to pass to loop calc, module verbose flag falls back to printing
+        if sink is None and verbose:
+            return(printUpgrade)
+        return(sink)
+
+    def iterUpgrades(self,contention=True):
+        # run full loop calc and yield UpgradeEvent for every upgrade and already owned item as each boss finishes
+        # boss metrics are filled the same as calc(engine="loop") once the generator is exhausted
+        events = collections.deque()
+        for boss_name in self._iterCalcLoop(contention,events.append):
+            while events:
+                yield events.popleft()
+
+    def _buildLootArrays(self):
+        # build item x SpecClass EP matrix with per SpecClass sparse index, item slot vector and boss x item drop chance matrix
+        # items are indexed by their integer id, ids of items not in loot_db get Slot.NONE and no ep
+        if self._snapshot is not None:
+            self._loadSnapshotArrays()
+            return
+
+        self._item_names = list(self.item_names)
+        n_items = len(self._item_names)
+        self._item_slot = np.zeros(n_items,dtype=int)
+        self._item_ep = np.zeros((n_items,SpecClass.SIZE))
+        for i in range(n_items):
+            loot = self.loot_by_id[i]
+            if loot is None:
+                continue
+            self._item_slot[i] = loot.slot
+            self._item_ep[i,:] = loot.ep_map
+        self._indexSpecItems()
+
+        self._boss_names = list(self.bosses)
+        self._drop_chance = np.zeros((len(self._boss_names),n_items))
+        for b,boss_name in enumerate(self._boss_names):
+            boss = self.bosses[boss_name]
+            for loot_name in boss.loot_table:
+                self._drop_chance[b,self.loot_db[loot_name].id] = boss.loot_drop_chance[loot_name]/100.0 # convert to fraction
+        self._clear_time = np.array([self.bosses[boss_name].clear_time for boss_name in self._boss_names],dtype=float)
+
+        self._ep_bis = np.zeros(SpecClass.SIZE)
+        for spec_class in self.ep_bis:
+            self._ep_bis[spec_class] = self.ep_bis[spec_class]
+
+    def _indexSpecItems(self):
+        # map from SpecClass to indices and ep of items with nonzero ep for it
+        self._spec_items = [np.nonzero(self._item_ep[:,spec_class])[0] for spec_class in range(SpecClass.SIZE)]
+        self._spec_ep = [np.asarray(self._item_ep[self._spec_items[spec_class],spec_class],dtype=float) for spec_class in range(SpecClass.SIZE)]
+
+    def exportSnapshot(self,path):
+        # write loot database as flat .npy arrays in directory path, to be shared read-only through LootSnapshot
+        self._buildLootArrays()
+        os.makedirs(path,exist_ok=True)
+        raid = np.array([self.bosses[boss_name].raid for boss_name in self._boss_names],dtype=int)
+        arrays = {
+            "item_names":np.array(self._item_names,dtype=str),
+            "item_slot":self._item_slot,
+            "item_ep":self._item_ep,
+            "boss_names":np.array(self._boss_names,dtype=str),
+            "boss_raid":raid,
+            "boss_clear_time":self._clear_time,
+            "drop_chance":self._drop_chance,
+            "ep_bis":self._ep_bis,
+        }
+        for name in arrays:
+            np.save(os.path.join(path,name + ".npy"),arrays[name])
+
+    def attachSnapshot(self,snapshot):
+        # use LootSnapshot arrays as loot database instead of loot_db, so only the numpy engine can run
+        # bosses and item ids are taken from the snapshot, characters are added afterwards as usual
+        if len(self.loot_db) > 0 or len(self.raid) > 0:
+            print("attachSnapshot needs an empty BossPrioCalc")
+            raise RuntimeError("BossPrioCalc not empty")
+
+        self._snapshot = snapshot
+        self.item_names = snapshot.item_names.tolist()
+        self.item_ids = dict(zip(self.item_names,range(len(self.item_names))))
+        self.loot_by_id = [None]*len(self.item_names)
+        self.bosses = {}
+        for b,boss_name in enumerate(snapshot.boss_names.tolist()):
+            self.addBoss(boss_name,Raid(int(snapshot.boss_raid[b])),float(snapshot.boss_clear_time[b]))
+        self.ep_bis = {}
+        for spec_class in SpecClass:
+            if spec_class != SpecClass.NONE and spec_class != SpecClass.SIZE:
+                self.ep_bis[spec_class] = float(snapshot.ep_bis[spec_class])
+
+    def _loadSnapshotArrays(self):
+        # take loot arrays from attached snapshot without copying the memory-mapped data
+        snapshot = self._snapshot
+        self._item_names = self.item_names
+        self._item_slot = snapshot.item_slot
+        self._item_ep = snapshot.item_ep
+        self._indexSpecItems()
+        self._boss_names = list(self.bosses)
+        self._drop_chance = snapshot.drop_chance
+        self._clear_time = np.asarray(snapshot.boss_clear_time)
+        self._ep_bis = np.asarray(snapshot.ep_bis)
+
+    def _buildCharArrays(self):
+        # build character x Slot current EP matrices and per character owned item ids
+        self._char_names = list(self.raid)
+        n_chars = len(self._char_names)
+        self._char_spec = np.array([self.raid[char_name].spec_class for char_name in self._char_names],dtype=int)
+        # current ep to beat when a new item of a given slot drops
+        self._char_current = np.zeros((n_chars,Slot.SIZE))
+        # ep added to a new item of a given slot (other weapon hand kept when replacing MH or OH)
+        self._char_bonus = np.zeros((n_chars,Slot.SIZE))
+        # owned item ids of each character, a dense character x item matrix does not fit for large rosters
+        self._char_has = [None]*n_chars
+        for c in range(n_chars):
+            self._fillCharRow(c)
+
+    def _fillCharRow(self,c):
+        # fill character arrays row c from character gear ids and item EP matrix, same rules as _getCharCurrent
+        char_name = self._char_names[c]
+        char = self.raid[char_name]
+        spec_class = char.spec_class
+        n_items = len(self._item_slot) # items known to the loot arrays, gear interned later is not in loot_db
+        char_has = []
+        for slot in Slot:
+            if slot == Slot.NONE or slot == Slot.SIZE or slot == Slot.ZG_ENCHANTS:
+                continue
+            item_ids = char.gear_ids[slot]
+            if np.any(item_ids >= n_items) or np.any(self._item_slot[item_ids[item_ids < n_items]] == Slot.NONE):
+                print("char_name: {} has items not in loot_db".format(char_name))
+                raise RuntimeError("Unknown item")
+            ep = self._item_ep[item_ids,spec_class]
+            if len(item_ids) == 0:
+                ep_current = math.inf if slot == Slot.FINGER or slot == Slot.TRINKET else 0
+            else:
+                if slot == Slot.FINGER or slot == Slot.TRINKET:
+                    # replace worst of the two
+                    ep_current = ep.min()
+                else:
+                    ep_current = ep.max()
+                if ep_current == 0:
+                    # same item as the loop engine reports, last one worth 0 ep
+                    item_id = item_ids[np.nonzero(ep == 0)[0][-1]]
+                    print("item_name_print: {}, char_name: {}".format(self._item_names[item_id],char_name))
+                    raise RuntimeError("Current EP should not be 0 for item ")
+            self._char_current[c,slot] = ep_current
+            char_has.append(item_ids[self._item_slot[item_ids] == slot])
+        self._char_has[c] = np.concatenate(char_has)
+
+        # each character expected to get x enchants
+        zg_id = self.item_ids["Primal Hakkari Idol"]
+        self._char_current[c,Slot.ZG_ENCHANTS] = self._item_ep[zg_id,spec_class]*char.gear[Slot.ZG_ENCHANTS]
+
+        # weapons compare against best of MH + OH and 2H
+        ep_mh_curr = self._char_current[c,Slot.MAIN_HAND]
+        ep_oh_curr = self._char_current[c,Slot.OFF_HAND]
+        ep_2h_curr = self._char_current[c,Slot.TWO_HAND]
+        self._char_bonus[c,Slot.MAIN_HAND] = ep_oh_curr
+        self._char_bonus[c,Slot.OFF_HAND] = ep_mh_curr
+        self._char_current[c,[Slot.MAIN_HAND,Slot.OFF_HAND,Slot.TWO_HAND]] = max(ep_mh_curr + ep_oh_curr,ep_2h_curr)
+
+    def _calcUpgradeMatrix(self,rows=slice(None),cols=slice(None)):
+        # character x item normalized upgrade if the item drops, i.e. enu before drop chance
+        # rows selects the characters to calculate, all by default, cols the slice of item ids (columns of the result)
+        slot_mult = np.ones(Slot.SIZE)
+        slot_mult[Slot.ZG_ENCHANTS] = ZG_ENCHANTS_TRGT
+        start , stop = cols.indices(len(self._item_names))[:2]
+        char_spec = self._char_spec[rows]
+        char_current = self._char_current[rows]
+        char_bonus = self._char_bonus[rows]
+        upgrade_norm = np.zeros((len(char_spec),stop - start))
+        for spec_class in np.unique(char_spec):
+            # only items with nonzero ep for the spec can be upgrades
+            chars = np.nonzero(char_spec == spec_class)[0]
+            lo , hi = np.searchsorted(self._spec_items[spec_class],[start,stop])
+            items = self._spec_items[spec_class][lo:hi]
+            slots = self._item_slot[items]
+            ep_new = self._spec_ep[spec_class][lo:hi]*slot_mult[slots] + char_bonus[chars][:,slots]
+            ep_current = char_current[chars][:,slots]
+            upgrade = ep_new > ep_current
+            ep_delta = np.where(upgrade,ep_new - ep_current,0.0)
+            upgrade_spec = np.zeros(ep_delta.shape)
+            np.divide(SCORE_SF*ep_delta,self._ep_bis[spec_class],out=upgrade_spec,where=upgrade)
+            upgrade_norm[np.ix_(chars,items - start)] = upgrade_spec
+
+        # items the character already has are never an upgrade
+        char_has = [self._char_has[c] for c in np.arange(len(self._char_names))[rows]]
+        has_row = np.repeat(np.arange(len(char_has)),[len(item_ids) for item_ids in char_has])
+        has_item = np.concatenate(char_has) if len(char_has) > 0 else np.zeros(0,dtype=int)
+        in_cols = (has_item >= start) & (has_item < stop)
+        upgrade_norm[has_row[in_cols],has_item[in_cols] - start] = 0.0
+        return(upgrade_norm)
+
+    def _creditUpgrade(self,upgrade,contention):
+        # character x item upgrade credited to each character, only best recipient(s) get credit with contention
+        if not contention:
+            return(upgrade)
+        upgrade_best = upgrade.max(axis=0)
+        winner = (upgrade == upgrade_best) & (upgrade > 0)
+        return(np.where(winner,upgrade/np.maximum(winner.sum(axis=0),1),0.0))
+
+    def _calcNumpy(self,contention):
+        # calculate metrics with broadcasted array operations over all bosses, characters and loot
+        self._buildLootArrays()
+        self._buildCharArrays()
+        # credit only depends on the item column, so items are done in blocks to bound memory for large rosters
+        n_chars = len(self._char_names)
+        n_items = len(self._item_names)
+        block = max(1,NUMPY_BLOCK_CELLS//max(n_chars,1))
+        enu = np.zeros((len(self._boss_names),n_chars)) # boss x character
+        for start in range(0,n_items,block):
+            cols = slice(start,min(start + block,n_items))
+            upgrade = self._creditUpgrade(self._calcUpgradeMatrix(cols=cols),contention)
+            enu += self._drop_chance[:,cols] @ upgrade.T
+        mean_enu = enu.sum(axis=1)/len(self._char_names)
+        mean_enupm = mean_enu/self._clear_time
+        for b,boss_name in enumerate(self._boss_names):
+            boss = self.bosses[boss_name]
+            boss.enu = dict(zip(self._char_names,enu[b].tolist()))
+            boss.mean_enu = float(mean_enu[b])
+            boss.mean_enupm = float(mean_enupm[b])
+
+        self._upgrades = None
+        self._calc_chars = set(self.raid)
+        self._calc_contention = contention
+        self._dirty = set()
+        self._dirty_bosses = set()
+
+    def upgradeColumns(self,contention=True):
+        # columnar results: one row per (boss, character, item) where the item is an upgrade, followed by one row per boss
+        # returns map from column name to numpy array, text columns are (codes, names) pairs so they stay compact
+        # item rows: ep_new / ep_current as compared by calc, drop_chance as fraction and enu credited to the character
+        # boss rows: char, item and slot empty, enu is mean_enu of the boss and mean_enupm is filled
+        self._buildLootArrays()
+        self._buildCharArrays()
+        slot_mult = np.ones(Slot.SIZE)
+        slot_mult[Slot.ZG_ENCHANTS] = ZG_ENCHANTS_TRGT
+        n_bosses = len(self._boss_names)
+        n_items = len(self._item_names)
+
+        # every (drop, character) pair where the dropped item is an upgrade for the character, one part of rows per
+        # item block like _calcNumpy so the dense character x item matrices never cover all items
+        # rows are ordered by boss, item and character within each item block
+        names = ["row","boss","char","item","slot","ep_new","ep_current","drop_chance","enu","mean_enupm"]
+        parts = {name:[] for name in names}
+        drop_boss_all , drop_item_all = np.nonzero(self._drop_chance)
+        block = max(1,NUMPY_BLOCK_CELLS//max(len(self._char_names),1))
+        enu_boss = np.zeros(n_bosses)
+        for start in range(0,n_items,block):
+            cols = slice(start,min(start + block,n_items))
+            upgrade = self._calcUpgradeMatrix(cols=cols)
+            credit = self._creditUpgrade(upgrade,contention)
+            in_block = (drop_item_all >= cols.start) & (drop_item_all < cols.stop)
+            drop_boss = drop_boss_all[in_block]
+            drop_item = drop_item_all[in_block]
+            drop , char = np.nonzero((upgrade[:,drop_item - start] > 0).T)
+            boss = drop_boss[drop]
+            item = drop_item[drop]
+            slot = np.asarray(self._item_slot)[item]
+            spec = self._char_spec[char]
+            drop_chance = np.asarray(self._drop_chance)[boss,item]
+            parts["row"].append(np.zeros(len(boss),dtype=int))
+            parts["boss"].append(boss)
+            parts["char"].append(char)
+            parts["item"].append(item)
+            parts["slot"].append(slot)
+            parts["ep_new"].append(np.asarray(self._item_ep)[item,spec]*slot_mult[slot] + self._char_bonus[char,slot])
+            parts["ep_current"].append(self._char_current[char,slot])
+            parts["drop_chance"].append(drop_chance)
+            parts["enu"].append(credit[char,item - start]*drop_chance)
+            parts["mean_enupm"].append(np.full(len(boss),np.nan))
+            enu_boss += (self._drop_chance[:,cols] @ credit.T).sum(axis=1)
+        enu_boss /= len(self._char_names)
+
+        # boss rows, code -1 is an empty text field
+        none = np.full(n_bosses,-1)
+        nan = np.full(n_bosses,np.nan)
+        boss_rows = {"row":np.ones(n_bosses,dtype=int),"boss":np.arange(n_bosses),"char":none,"item":none,"slot":none,
+            "ep_new":nan,"ep_current":nan,"drop_chance":nan,"enu":enu_boss,"mean_enupm":enu_boss/self._clear_time}
+        codes = {"row":["item","boss"],"boss":self._boss_names,"char":self._char_names,"item":self._item_names,"slot":[slot.name for slot in Slot]}
+        columns = {}
+        for name in names:
+            # parts of a column are dropped as soon as it is joined to keep the peak near one copy of the table
+            column = np.concatenate(parts.pop(name) + [boss_rows[name]])
+            columns[name] = (column,codes[name]) if name in codes else column
+        return(columns)
+
+    def exportTable(self,path,contention=True):
+        # write upgradeColumns in one go, format from extension: .csv, .parquet or .arrow/.feather (Arrow IPC)
+        # pyarrow is only imported here, it is needed for parquet and arrow and speeds up csv when installed
+        columns = self.upgradeColumns(contention)
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in [".csv",".parquet",".arrow",".feather"]:
+            print("{} is not a valid table format".format(ext))
+            raise RuntimeError("Unknown table format")
+        try:
+            import pyarrow
+        except ImportError:
+            if ext != ".csv":
+                print("writing {} needs pyarrow, use .csv instead".format(ext))
+                raise RuntimeError("pyarrow not installed")
+            _writeCSV(path,columns)
+            return
+
+        arrays = {}
+        for name , column in columns.items():
+            if isinstance(column,tuple):
+                codes , names = column
+                arrays[name] = pyarrow.DictionaryArray.from_arrays(pyarrow.array(codes,type=pyarrow.int32(),mask=codes < 0),pyarrow.array(names,type=pyarrow.string()))
+            else:
+                arrays[name] = pyarrow.array(column,from_pandas=True) # nan as null
+        table = pyarrow.table(arrays)
+        if ext == ".csv":
+            import pyarrow.csv
+            pyarrow.csv.write_csv(table,path)
+        elif ext == ".parquet":
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table,path)
+        else:
+            import pyarrow.feather
+            pyarrow.feather.write_feather(table,path,compression="uncompressed")
+
+    def evaluateRosters(self,rosters,n_workers=None,contention=True):
+        # calc many rosters against this loot database in a process pool, yields (key, result) as rosters finish
+        # rosters maps key to roster (list of addChar argument maps like roster.json, or path of such a file),
+        # a plain list is keyed by index
+        # result maps boss name to (mean_enu, mean_enupm), or is {"error": message} for a roster that failed
+        # workers share the loot database through a memory-mapped snapshot, written to a temporary directory
+        # unless one is attached
+        if isinstance(rosters,dict):
+            rosters = rosters.items()
+        else:
+            rosters = enumerate(rosters)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if self._snapshot is not None:
+                snapshot_path = self._snapshot.path
+            else:
+                snapshot_path = tmp_dir
+                self.exportSnapshot(snapshot_path)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers,initializer=_batchInit,initargs=(snapshot_path,)) as pool:
+                futures = [pool.submit(_batchWorker,key,roster,contention) for key , roster in rosters]
+                for future in concurrent.futures.as_completed(futures):
+                    yield future.result()
+
+    def simulate(self,n_lockouts,n_workers=None,seed=0,percentiles=(5,50,95)):
+        # Monte Carlo simulation of boss kills, each drop going to the raider with the biggest upgrade
+        # returns map from boss name to mean, std and percentiles of realized normalized upgrade per kill
+        if n_lockouts < 1:
+            print("n_lockouts: {} must be at least 1".format(n_lockouts))
+            raise RuntimeError("No lockouts to simulate")
+        self._buildLootArrays()
+        self._buildCharArrays()
+        n_bosses = len(self._boss_names)
+        # normalized upgrade of best recipient for each item, averaged over raid, in item blocks like _calcNumpy
+        n_items = len(self._item_names)
+        block = max(1,NUMPY_BLOCK_CELLS//max(len(self._char_names),1))
+        best = np.concatenate([self._calcUpgradeMatrix(cols=slice(start,start + block)).max(axis=0,initial=0.0)
+            for start in range(0,n_items,block)])/len(self._char_names)
+        drop_boss , drop_item = np.nonzero(self._drop_chance)
+        drop_chance = self._drop_chance[drop_boss,drop_item]
+        drop_value = best[drop_item]
+        boss_max = np.bincount(drop_boss,weights=drop_value,minlength=n_bosses)
+
+        # split lockouts in fixed blocks with own seed so results do not depend on n_workers
+        n_blocks = math.ceil(n_lockouts/SIM_BLOCK)
+        seeds = np.random.SeedSequence(seed).spawn(n_blocks)
+        block_sizes = [min(SIM_BLOCK,n_lockouts - i*SIM_BLOCK) for i in range(n_blocks)]
+        args = [(drop_chance,drop_boss,drop_value,boss_max,block_sizes[i],seeds[i]) for i in range(n_blocks)]
+        if n_workers == 1:
+            results = [_simulateWorker(*arg) for arg in args]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as pool:
+                results = list(pool.map(_simulateWorker,*zip(*args)))
+
+        total = sum(result[0] for result in results)
+        total_sq = sum(result[1] for result in results)
+        hist = sum(result[2] for result in results).reshape(n_bosses,SIM_BINS)
+        mean = total/n_lockouts
+        std = np.sqrt(np.maximum(total_sq/n_lockouts - mean**2,0.0))
+        cdf = np.cumsum(hist,axis=1)/n_lockouts
+        sim = {}
+        for b,boss_name in enumerate(self._boss_names):
+            sim[boss_name] = {"mean":float(mean[b]),"std":float(std[b])}
+            for q in percentiles:
+                idx = min(np.searchsorted(cdf[b],q/100.0),SIM_BINS-1)
+                sim[boss_name]["p{}".format(q)] = float(idx*boss_max[b]/SIM_BINS)
+
+        return(sim)
+
+    def projectWeeks(self,n_weeks,boss_names=None,seed=0):
+        # simulate n_weeks of lockouts of boss_names (all bosses by default), giving each drop to the raider
+        # with the biggest upgrade and equipping it, so Character.gear is changed in place
+        # returns map from boss name to list of mean_enupm at the start of each week
+        if boss_names is None:
+            boss_names = list(self.bosses)
+        contention = self._calc_contention
+        rng = np.random.default_rng(seed)
+        self._buildLootArrays()
+        self._buildCharArrays()
+        upgrade = self._calcUpgradeMatrix()
+        n_chars = len(self._char_names)
+
+        # drop entries of bosses killed each week, in kill order
+        drop_item = []
+        for boss_name in boss_names:
+            for loot_name in self.bosses[boss_name].loot_table:
+                drop_item.append(self.loot_db[loot_name].id)
+        drop_boss = np.repeat([self._boss_names.index(boss_name) for boss_name in boss_names],[len(self.bosses[boss_name].loot_table) for boss_name in boss_names])
+        drop_chance = self._drop_chance[drop_boss,drop_item]
+
+        mean_enupm = np.zeros((n_weeks,len(self._boss_names)))
+        for week in range(n_weeks):
+            enu = self._drop_chance @ self._creditUpgrade(upgrade,contention).T # boss x character
+            mean_enupm[week] = enu.sum(axis=1)/n_chars/self._clear_time
+
+            for d in np.nonzero(rng.random(len(drop_chance)) < drop_chance)[0]:
+                i = drop_item[d]
+                c = int(np.argmax(upgrade[:,i]))
+                if upgrade[c,i] <= 0:
+                    # nobody needs it
+                    continue
+                # equip and update only the winner's row
+                char_name = self._char_names[c]
+                self.equipItem(char_name,self._item_names[i])
+                self._fillCharRow(c)
+                upgrade[c] = self._calcUpgradeMatrix([c])[0]
+
+        # bring boss metrics up to date with the new gear
+        self.recalc()
+
+        projection = {}
+        for b,boss_name in enumerate(self._boss_names):
+            projection[boss_name] = mean_enupm[:,b].tolist()
+        return(projection)
+
+    def _raidRouteOptions(self,raid):
+        # list of (clear time, mean_enu, boss names in kill order) for boss sets of raid that respect RaidBossDeps,
+        # sets that take longer for no more mean_enu are dropped
+        # sets are built in RaidToBossMap order, each boss added to every set that already holds its prerequisites
+        boss_list = RaidToBossMap[raid]
+        index = {boss_name:i for i , boss_name in enumerate(boss_list)}
+        sets = [(0.0,0.0,0)] # (clear time, mean_enu, bitmask of boss_list indices)
+        for i , boss_name in enumerate(boss_list):
+            boss = self.bosses[boss_name]
+            need = 0
+            for dep in RaidBossDeps[raid].get(boss_name,[]):
+                need |= 1 << index[dep]
+            sets += [(clear_time + boss.clear_time,mean_enu + boss.mean_enu,mask | 1 << i) for clear_time , mean_enu , mask in sets if mask & need == need]
+
+        sets.sort(key=lambda boss_set: (boss_set[0],-boss_set[1]))
+        options = []
+        for clear_time , mean_enu , mask in sets:
+            if len(options) == 0 or mean_enu > options[-1][1]:
+                options.append((clear_time,mean_enu,mask))
+        return([(clear_time,mean_enu,self._killOrder(raid,[boss_list[i] for i in range(len(boss_list)) if (mask >> i) & 1])) for clear_time , mean_enu , mask in options])
+
+    def _killOrder(self,raid,boss_names):
+        # order boss set so the most mean_enupm comes first while every boss follows its prerequisites
+        # so the value already gained is high wherever the night gets cut short
+        order = []
+        killed = set()
+        remaining = list(boss_names)
+        while len(remaining) > 0:
+            available = [boss_name for boss_name in remaining if all(dep in killed for dep in RaidBossDeps[raid].get(boss_name,[]))]
+            if len(available) == 0:
+                print("{} misses prerequisites of {}".format(Raid(raid).name,remaining))
+                raise RuntimeError("Boss dependency not met")
+            boss_name = max(available,key=lambda boss_name: self.bosses[boss_name].mean_enupm)
+            order.append(boss_name)
+            killed.add(boss_name)
+            remaining.remove(boss_name)
+        return(order)
+
+    def scheduleRaid(self,raid,time_budget=math.inf,min_enupm=0.0):
+        # best bosses of raid to kill within time_budget minutes, in kill order, using mean_enu of last calc
+        # stops where further kills are worth less than min_enupm per minute, i.e. maximizes mean_enu - min_enupm*clear time
+        # returns (boss names, total mean_enu, total clear time)
+        options = [option for option in self._raidRouteOptions(raid) if option[0] <= time_budget + 1e-9]
+        clear_time , mean_enu , boss_names = max(options,key=lambda option: option[1] - min_enupm*option[0])
+        return(boss_names,mean_enu,clear_time)
+
+    def planLockouts(self,weekly_hours,n_weeks=4,reset_days=None,next_reset=None):
+        # plan which raids and bosses to run each week for n_weeks, maximizing total mean_enu of last calc
+        # weekly_hours is raid hours per week (number, or list with one entry per week)
+        # reset_days maps Raid to lockout length in days (RaidResetDays by default),
+        # next_reset maps Raid to days until its current lockout resets (a fresh lockout at day 0 by default)
+        # each lockout is run at most once, in any week it overlaps, with bosses and kill order as in scheduleRaid
+        # returns list per week of (runs, mean_enu, clear minutes) with runs as (Raid, lockout start day, boss names),
+        # and the total mean_enu
+        if reset_days is None:
+            reset_days = RaidResetDays
+        if next_reset is None:
+            next_reset = {}
+        if not isinstance(weekly_hours,(list,tuple)):
+            weekly_hours = [weekly_hours]*n_weeks
+        options = [self._raidRouteOptions(raid) for raid in range(Raid.SIZE)]
+
+        # lockouts as (raid, start day) overlapping each week, a lockout spans at most two weeks
+        week_lockouts = [[] for week in range(n_weeks + 1)]
+        for raid in range(Raid.SIZE):
+            days = reset_days[raid]
+            start = next_reset.get(raid,days) - days
+            while start < 7*n_weeks:
+                for week in range(max(0,start//7),min(n_weeks,(start + days - 1)//7) + 1):
+                    week_lockouts[week].append((raid,start))
+                start += days
+
+        # dynamic programming from last week back, state is the set of lockouts shared with the previous week
+        # that were already run, each (week, state) is solved once and looked up by the week before
+        best = [{} for week in range(n_weeks + 1)] # map from used shared lockouts to (total mean_enu, plan of remaining weeks)
+        week_memo = {} # map from week pattern relative to its first day to _planWeek result
+        best[n_weeks][frozenset()] = (0.0,[])
+        for week in range(n_weeks - 1,-1,-1):
+            shared_prev = [lockout for lockout in week_lockouts[week] if week > 0 and lockout in week_lockouts[week - 1]]
+            shared_next = set(week_lockouts[week + 1]) if week + 1 < n_weeks else set()
+            for mask in range(1 << len(shared_prev)):
+                used = frozenset(shared_prev[i] for i in range(len(shared_prev)) if (mask >> i) & 1)
+                plan_best = None
+                # weeks with the same lockout pattern relative to their first day share one solution
+                offset = 7*week
+                pattern = (tuple((raid,start - offset) for raid , start in week_lockouts[week]),frozenset((raid,start - offset) for raid , start in used),
+                    weekly_hours[week],frozenset((raid,start - offset) for raid , start in shared_next))
+                if pattern not in week_memo:
+                    week_memo[pattern] = self._planWeek(pattern[0],pattern[1],60*weekly_hours[week],pattern[3],options)
+                for carry , (mean_enu , clear_time , runs) in week_memo[pattern].items():
+                    carry = frozenset((raid,start + offset) for raid , start in carry)
+                    runs = [(raid,start + offset,boss_names) for raid , start , boss_names in runs]
+                    total , plan = best[week + 1][carry]
+                    if plan_best is None or mean_enu + total > plan_best[0]:
+                        plan_best = (mean_enu + total,[(runs,mean_enu,clear_time)] + plan)
+                best[week][used] = plan_best
+
+        total , plan = best[0][frozenset()]
+        return(plan,total)
+
+    def _planWeek(self,lockouts,used,time_budget,shared_next,options):
+        # best runs of one week within time_budget minutes for every set of lockouts shared with next week that gets run
+        # multiple-choice knapsack over lockouts keeping pareto front of (clear time, mean_enu) per shared set
+        # returns map from frozenset of run lockouts shared with next week to (mean_enu, clear time, runs)
+        front = [(0.0,0.0,None,frozenset())] # (clear time, mean_enu, runs as linked (previous runs, run), run lockouts shared with next week)
+        for lockout in lockouts:
+            if lockout in used:
+                continue
+            raid , start = lockout
+            shared = lockout in shared_next
+            routes = list(front)
+            for clear_time , mean_enu , runs , carry in front:
+                carry_new = carry | {lockout} if shared else carry
+                # first option is the empty boss set, same as not running the lockout
+                for option in options[raid][1:]:
+                    if clear_time + option[0] > time_budget + 1e-9:
+                        # options are sorted by clear time
+                        break
+                    routes.append((clear_time + option[0],mean_enu + option[1],(runs,(raid,start,option[2])),carry_new))
+            # keep only routes that are not slower and worse than another route with the same shared lockouts
+            routes.sort(key=lambda route: (route[0],-route[1]))
+            front = []
+            best_enu = {}
+            for route in routes:
+                if route[1] > best_enu.get(route[3],-1.0):
+                    front.append(route)
+                    best_enu[route[3]] = route[1]
+
+        week = {}
+        for clear_time , mean_enu , runs , carry in front:
+            if carry not in week or mean_enu > week[carry][0]:
+                week[carry] = (mean_enu,clear_time,runs)
+        for carry in week:
+            mean_enu , clear_time , runs = week[carry]
+            run_list = []
+            while runs is not None:
+                runs , (raid , start , boss_names) = runs
+                run_list.append((Raid(raid),start,boss_names))
+            week[carry] = (mean_enu,clear_time,run_list[::-1])
+        return(week)
+
+    def selectRoster(self,size=40,boss_names=None,role_min=None,role_max=None,spec_min=None,spec_max=None,fixed=None):
+        # pick size characters of raid (the whole bench) maximizing summed Boss.enu of last calc over boss_names (all bosses by default)
+        # under min/max character counts per Role and per SpecClass, characters in fixed are always picked
+        # greedy start filling minimums first, then best improving swaps scored without recalculating
+        # without contention a character adds its own Boss.enu whoever else is picked,
+        # with contention (as in last calc) each (boss, loot) entry adds the best upgrade among picked characters,
+        # so swaps are scored from per loot upgrades keeping best and second best picked value of each entry
+        # returns (picked character names, mean_enu summed over boss_names for the picked raid)
+        if self._calc_chars != set(self.raid) or len(self._dirty) > 0 or len(self._dirty_bosses) > 0:
+            print("selectRoster needs calc of the whole bench first")
+            raise RuntimeError("No calc")
+        if boss_names is None:
+            boss_names = list(self.bosses)
+        if fixed is None:
+            fixed = []
+        value = {char_name:sum(self.bosses[boss_name].enu[char_name] for boss_name in boss_names) for char_name in self.raid}
+
+        # count bounds per group, every character is in one Role group and one SpecClass group
+        lo = {}
+        hi = {}
+        for group_type , bounds_min , bounds_max in [("role",role_min,role_max),("spec",spec_min,spec_max)]:
+            for key in bounds_min or {}:
+                lo[(group_type,int(key))] = bounds_min[key]
+            for key in bounds_max or {}:
+                hi[(group_type,int(key))] = bounds_max[key]
+        groups = {}
+        for char_name , char in self.raid.items():
+            groups[char_name] = [("role",int(SpecToRole[char.spec_class])),("spec",int(char.spec_class))]
+        count = collections.Counter()
+
+        def add(char_name):
+            picked.add(char_name)
+            count.update(groups[char_name])
+
+        def canAdd(char_name):
+            return(all(count[group] < hi.get(group,size) for group in groups[char_name]))
+
+        picked = set()
+        for char_name in fixed:
+            add(char_name)
+        by_value = sorted(self.raid,key=lambda char_name: value[char_name],reverse=True)
+        for group in lo:
+            for char_name in by_value:
+                if count[group] >= lo[group] or len(picked) >= size:
+                    break
+                if char_name not in picked and group in groups[char_name] and canAdd(char_name):
+                    add(char_name)
+        for char_name in by_value:
+            if len(picked) >= size:
+                break
+            if char_name not in picked and canAdd(char_name):
+                add(char_name)
+        if len(picked) != size or any(count[group] < lo[group] for group in lo):
+            print("no roster of {} characters meets the composition bounds".format(size))
+            raise RuntimeError("No feasible roster")
+
+        if self._calc_contention:
+            # upgrades of last loop calc, redone from current gear when it kept none (numpy engine or result cache)
+            upgrades = self._upgrades
+            if upgrades is None:
+                self._buildCurrentCache()
+                upgrades = {boss_name:{char_name:self._calcBossCharUpgrade(boss_name,char_name) for char_name in self.raid} for boss_name in boss_names}
+            # map from character name to map from (boss, loot) entry index to upgrade, and list of (character, upgrade) per entry
+            entry_index = {}
+            char_entries = {char_name:{} for char_name in self.raid}
+            entry_chars = []
+            for boss_name in boss_names:
+                for char_name in self.raid:
+                    for loot_id , enu in upgrades[boss_name][char_name].items():
+                        if (boss_name,loot_id) not in entry_index:
+                            entry_index[(boss_name,loot_id)] = len(entry_chars)
+                            entry_chars.append([])
+                        e = entry_index[(boss_name,loot_id)]
+                        char_entries[char_name][e] = enu
+                        entry_chars[e].append((char_name,enu))
+
+        def scoreSwaps():
+            # returns swapDelta(char_out, char_in) for the current picked set and the summed value of picked
+            if not self._calc_contention:
+                return(lambda char_out , char_in: value[char_in] - value[char_out],sum(value[char_name] for char_name in picked))
+            best = [0.0]*len(entry_chars)
+            second = [0.0]*len(entry_chars)
+            best_char = [None]*len(entry_chars)
+            for e , chars in enumerate(entry_chars):
+                for char_name , enu in chars:
+                    if char_name not in picked:
+                        continue
+                    if enu > best[e]:
+                        second[e] = best[e]
+                        best[e] = enu
+                        best_char[e] = char_name
+                    elif enu > second[e]:
+                        second[e] = enu
+            # value lost when a picked character leaves and the entries it holds fall to the second best
+            loss = collections.Counter()
+            held = collections.defaultdict(list)
+            for e in range(len(entry_chars)):
+                if best_char[e] is not None:
+                    loss[best_char[e]] += best[e] - second[e]
+                    held[best_char[e]].append(e)
+            # value won when a bench character joins, before the leaving character is taken out
+            gain = {char_name:sum(max(enu - best[e],0.0) for e , enu in char_entries[char_name].items()) for char_name in self.raid if char_name not in picked}
+
+            def swapDelta(char_out,char_in):
+                # entries held by char_out are compared against their second best once char_out left
+                delta = gain[char_in] - loss[char_out]
+                for e in held[char_out]:
+                    enu = char_entries[char_in].get(e,0.0)
+                    delta += max(enu - second[e],0.0) - max(enu - best[e],0.0)
+                return(delta)
+            return(swapDelta,sum(best))
+
+        # best improving swap until none is left, a swap only changes the counts of the two characters' groups
+        while True:
+            swapDelta , total = scoreSwaps()
+            swap_best = None
+            delta_best = 1e-12
+            for char_out in picked:
+                if char_out in fixed:
+                    continue
+                for char_in in self.raid:
+                    if char_in in picked:
+                        continue
+                    delta = swapDelta(char_out,char_in)
+                    if delta <= delta_best:
+                        continue
+                    change = collections.Counter(groups[char_in])
+                    change.subtract(groups[char_out])
+                    if all(lo.get(group,0) <= count[group] + change[group] <= hi.get(group,size) for group in change):
+                        swap_best = (char_out,char_in,change)
+                        delta_best = delta
+            if swap_best is None:
+                break
+            char_out , char_in , change = swap_best
+            picked.remove(char_out)
+            picked.add(char_in)
+            count.update(change)
+
+        char_names = [char_name for char_name in self.raid if char_name in picked]
+        return(char_names,total/size)
+
+    def assignLoot(self,boss_name,drops=None,char_names=None,max_items=1,caps=None):
+        # optimal assignment of the items dropped by one kill of boss to present raiders, maximizing summed normalized upgrade
+        # uses the same ep delta as calc but without drop chance since the items did drop
+        # drops lists dropped item names (whole loot_table by default), char_names the present raiders (whole raid by default)
+        # each character gets at most caps[char_name] items (max_items if not in caps), items that are no upgrade stay unassigned
+        # returns list of (item name, character name or None, normalized upgrade) in drops order and the summed upgrade
+        boss = self.bosses[boss_name]
+        if drops is None:
+            drops = list(boss.loot_table)
+        if char_names is None:
+            char_names = list(self.raid)
+        if caps is None:
+            caps = {}
+        for loot_name in drops:
+            if loot_name not in boss.loot_drop_chance:
+                print("{} does not drop {}".format(boss_name,loot_name))
+                raise RuntimeError("Unknown drop")
+
+        # current gear of last loop calc is reused unless it changed since
+        if self._upgrades is None:
+            self._buildCurrentCache()
+        else:
+            for char_name in char_names:
+                if char_name in self._dirty or char_name not in self._calc_chars:
+                    self._current[char_name] = self._buildCharCurrent(char_name)
+
+        # item x character slot value, every character repeated once per item it may get
+        columns = []
+        for char_name in char_names:
+            columns.extend([char_name]*caps.get(char_name,max_items))
+        value = np.zeros((len(drops),len(columns) + len(drops))) # extra zero columns leave items unassigned
+        col = 0
+        for char_name in char_names:
+            n_cols = caps.get(char_name,max_items)
+            char = self.raid[char_name]
+            for d , loot_name in enumerate(drops):
+                # same rules as _calcBossCharUpgrade, the item did drop so its drop chance (maybe 0) does not matter
+                loot = self.loot_db[loot_name]
+                if loot.ep_map[char.spec_class] == 0 or loot.id in char.gear_set[loot.slot]:
+                    continue
+                ep_new , ep_current = self._compareLoot(char_name,char.spec_class,loot)
+                if ep_new > ep_current:
+                    value[d,col:col+n_cols] = SCORE_SF*(ep_new - ep_current)/self.ep_bis[char.spec_class]
+            col += n_cols
+
+        assignment = []
+        total = 0.0
+        for d , col in enumerate(_solveAssignment(-value)):
+            if col < len(columns) and value[d,col] > 0:
+                assignment.append((drops[d],columns[col],float(value[d,col])))
+                total += value[d,col]
+            else:
+                assignment.append((drops[d],None,0.0))
+        return(assignment,total)
+
+    def optimizeRoute(self,time_budget):
+        # pick bosses giving most total mean_enu of last calc within time_budget minutes, respecting RaidBossDeps
+        # returns (boss names in kill order per raid, total mean_enu, total clear time)
+        # dynamic programming over raids keeping pareto front of (clear time, mean_enu) of partial routes
+        front = [(0.0,0.0,[])]
+        for raid in range(Raid.SIZE):
+            options = self._raidRouteOptions(raid)
+            routes = []
+            for clear_time , mean_enu , boss_names in front:
+                for option_time , option_enu , option_bosses in options:
+                    if clear_time + option_time <= time_budget + 1e-9:
+                        routes.append((clear_time + option_time,mean_enu + option_enu,boss_names + option_bosses))
+            # keep only routes that are not slower and worse than another route
+            routes.sort(key=lambda route: (route[0],-route[1]))
+            front = []
+            for route in routes:
+                if len(front) == 0 or route[1] > front[-1][1]:
+                    front.append(route)
+
+        clear_time , mean_enu , boss_names = max(front,key=lambda route: route[1])
+        return(boss_names,mean_enu,clear_time)
+
+    def resultKey(self,engine="loop",contention=True):
+        # content hash of everything calc results depend on: ep_bis, loot ep and drop chances, boss clear times and character gear
+        key = hashlib.sha256()
+        inputs = [RESULT_VERSION,engine,contention,sorted((int(spec_class),ep) for spec_class , ep in self.ep_bis.items())]
+        if self._snapshot is not None:
+            for name in ["item_names","item_slot","item_ep","boss_names","boss_clear_time","drop_chance"]:
+                key.update(np.ascontiguousarray(getattr(self._snapshot,name)).tobytes())
+        else:
+            inputs.append([(loot.name,loot.slot,loot.ep_map) for loot in self.loot_db.values()])
+        inputs.append([(boss.name,boss.clear_time,[(loot_name,boss.loot_drop_chance[loot_name]) for loot_name in boss.loot_table]) for boss in self.bosses.values()])
+        inputs.append([(char.name,char.spec_class,char.gear) for char in self.raid.values()])
+        key.update(json.dumps(inputs).encode())
+        return(key.hexdigest())
+
+    def calc(self,engine="loop",contention=True,sink=None,cache=None):
+        # calculate metrics, returns map of boss names to Boss object with enu, mean_enu and mean_enupm filled
+        # contention gives each drop to one best recipient, otherwise every character is credited for every drop
+        # sink is called with an UpgradeEvent per upgrade found (loop engine only), e.g. printUpgrade or list.append
+        # cache is a ResultCache to reuse results of identical inputs, not used when upgrade events are wanted
+        if cache is not None and self._eventSink(sink) is None:
+            key = self.resultKey(engine,contention)
+            results = cache.get(key)
+            if results is not None:
+                for boss_name in self.bosses:
+                    boss = self.bosses[boss_name]
+                    boss.enu , boss.mean_enu , boss.mean_enupm = results[boss_name]
+                # no per loot upgrades kept, next recalc is a full calc
+                self._upgrades = None
+                self._calc_chars = set(self.raid)
+                self._calc_contention = contention
+                self._dirty = set()
+                self._dirty_bosses = set()
+                return(self.bosses)
+            self._calcEngine(engine,contention,None)
+            cache.put(key,{boss_name:(boss.enu,boss.mean_enu,boss.mean_enupm) for boss_name , boss in self.bosses.items()})
+            return(self.bosses)
+
+        self._calcEngine(engine,contention,sink)
+        return(self.bosses)
+
+    def _calcEngine(self,engine,contention,sink):
+        # run calc with the given engine, shared by the cached and uncached paths of calc so it is timed once
+        if engine == "loop":
+            self._calcLoop(contention,self._eventSink(sink))
+        elif engine == "numpy":
+            if sink is not None:
+                print("upgrade events need engine=\"loop\"")
+                raise RuntimeError("No events from numpy engine")
+            self._calcNumpy(contention)
+        else:
+            print("{} is not a valid engine".format(engine))
+            raise RuntimeError("Unknown engine")
+
+    def plot(self,path=None):
+        # plot mean_enupm of last calc per boss, shown in a window or written to path (format from extension, e.g. png/svg)
+        # matplotlib is only imported here so calculation works without it
+        if path is None:
+            import matplotlib.pyplot as plt
+            fig = plt.figure()
+        else:
+            # no GUI backend needed to render to file
+            from matplotlib.figure import Figure
+            fig = Figure()
+        ax = fig.subplots()
+
         # define raid color formatting
         raid_color_format = {
             Raid.ONY:"#b3b3b3",
@@ -286,7 +1615,6 @@ class BossPrioCalc:
             Raid.AQ40:"#3366ff",
         }
         # plot
-        plt.figure()
         y_ticks = []
         y_labels = []
         idx = 1
@@ -301,4391 +1629,342 @@ class BossPrioCalc:
 
             # plot given raid
             plt_range = np.arange(idx,idx+len(d))
-            plt.barh(y=plt_range,width=d.values(),color=color_format)
+            ax.barh(y=plt_range,width=list(d.values()),color=color_format)
             y_ticks.extend(plt_range)
             y_labels.extend(d.keys())
             idx = plt_range[-1]+1
         
         # format
-        # plt.xticks(rotation=90)
-        plt.title("Raid Upgrade per Boss")
-        plt.xlabel("Normalized Expected Mean Raid Upgrade per Minute")
-        plt.ylabel("Boss")
-        plt.grid(axis='x')
-        plt.yticks(ticks=y_ticks,labels=y_labels)
-        plt.show()
+        ax.set_title("Raid Upgrade per Boss")
+        ax.set_xlabel("Normalized Expected Mean Raid Upgrade per Minute")
+        ax.set_ylabel("Boss")
+        ax.grid(axis='x')
+        ax.set_yticks(ticks=y_ticks,labels=y_labels)
+        if path is None:
+            plt.show()
+        else:
+            fig.savefig(path,bbox_inches="tight")
 
         return
 
-# instantiate BossPrioCalc
-bpc = BossPrioCalc()
-
-# add bosses
-# ONY
-bpc.addBoss(
-    name="Onyxia",
-    raid=Raid.ONY,
-    clear_time=20,
-    )
-# MC
-MC_clear_time = 75
-bpc.addBoss(
-    name="Lucifron",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Magmadar",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Gehennas",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Garr",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Baron Geddon",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Shazzrah",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Golemagg the Incinerator",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Sulfuron Harbinger",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Majordomo Executus",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="Ragnaros",
-    raid=Raid.MC,
-    clear_time=MC_clear_time/10,
-    )
-bpc.addBoss(
-    name="MC Trash",
-    raid=Raid.MC,
-    clear_time=MC_clear_time,
-    )
-# BWL
-BWL_clear_time = 60
-bpc.addBoss(
-    name="Razorgore the Untamed",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Vaelastrasz the Corrupt",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Broodlord Lashlayer",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Firemaw",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Flamegor",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Ebonroc",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Chromaggus",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="Nefarian",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time/8,
-    )
-bpc.addBoss(
-    name="BWL Trash",
-    raid=Raid.BWL,
-    clear_time=BWL_clear_time,
-    )
-# ZG
-ZG_clear_time = 90
-bpc.addBoss(
-    name="Jin'do the Hexxer",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="High Priest Thekal",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="Bloodlord Mandokir",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="High Priestess Mar'li",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="High Priest Venoxis",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="High Priestess Jeklik",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="Edge of Madness",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="High Priestess Arlokk",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="Hakkar",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-bpc.addBoss(
-    name="Gahz'ranka",
-    raid=Raid.ZG,
-    clear_time=ZG_clear_time/10,
-    )
-# AQ20
-AQ20_clear_time = 90
-bpc.addBoss(
-    name="Kurinnaxx",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="General Rajaxx",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="Moam",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="Buru the Gorger",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="Ayamiss the Hunter",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="Ossirian the Unscarred",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time/6,
-    )
-bpc.addBoss(
-    name="AQ20 Trash",
-    raid=Raid.AQ20,
-    clear_time=AQ20_clear_time,
-    )
-
-# AQ40
-AQ40_clear_time = 240
-bpc.addBoss(
-    name="The Prophet Skeram",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Lord Kri",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Princess Yauj",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Vem",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Battleguard Sartura",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Fankriss the Unyielding",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Viscidus",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Princess Huhuran",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Twin Emperors",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="Ouro",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="C'Thun",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time/9,
-    )
-bpc.addBoss(
-    name="AQ40 Trash",
-    raid=Raid.AQ40,
-    clear_time=AQ40_clear_time,
-    )
-
-# add character to raid data
-# Druid
-bpc.addChar(
-    name="Milku",
-    spec_class=SpecClass.RESTO_DRUID,
-    head=["Stormrage Cover"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Stormrage Pauldrons"],
-    chest=["Stormrage Chestguard"],
-    waist=["Stormrage Belt"],
-    legs=["Stormrage Legguards"],
-    feet=["Stormrage Boots"],
-    wrist=["Stormrage Bracers"],
-    hands=["Stormrage Handguards"],
-    fingers=["Seal of the Archmagus","Band of Sulfuras"],
-    trinkets=["Zandalarian Hero Charm","Royal Seal of Eldre'Thalas"],
-    back=["Hide of the Wild"],
-    mh=["Lok'amir il Romathis"],
-    oh=["Fire Runed Grimoire"],
-    th=[],
-    ranged=["Idol of the Moon"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Eighchbar",
-    spec_class=SpecClass.RESTO_DRUID,
-    head=["Stormrage Cover"],
-    neck=["Jin'do's Evil Eye"],
-    shoulder=["Wild Growth Spaulders"],
-    chest=["Robes of the Exalted"],
-    waist=["Stormrage Belt"],
-    legs=["Empowered Leggings"],
-    feet=["Cenarion Boots"],
-    wrist=["Stormrage Bracers"],
-    hands=["Stormrage Handguards"],
-    fingers=["Pure Elementium Band","Fordring's Seal"],
-    trinkets=["Zandalarian Hero Charm","Rejuvenating Gem"],
-    back=["Hakkari Loa Cloak"],
-    mh=["Jin'do's Hexxer"],
-    oh=["Lei of the Lifegiver"],
-    th=[],
-    ranged=[],
-    zg_enchants=1,
-    )
-bpc.addChar(
-    name="Slecht",
-    spec_class=SpecClass.RESTO_DRUID,
-    head=["Stormrage Cover"],
-    neck=["Amulet of the Shifting Sands"],
-    shoulder=["Wild Growth Spaulders"],
-    chest=["Stormrage Chestguard"],
-    waist=["Corehound Belt"],
-    legs=["Stormrage Legguards"],
-    feet=["Verdant Footpads"],
-    wrist=["Stormrage Bracers"],
-    hands=["Stormrage Handguards"],
-    fingers=["Primalist's Seal","Primalist's Band"],
-    trinkets=["Royal Seal of Eldre'Thalas","Rejuvenating Gem"],
-    back=["Hide of the Wild"],
-    mh=["Lok'amir il Romathis"],
-    oh=["Lei of the Lifegiver"],
-    th=[],
-    ranged=[],
-    zg_enchants=2,
-    )
-# Hunter
-bpc.addChar(
-    name="Jiero",
-    spec_class=SpecClass.MARKS_HUNTER,
-    head=["Dragonstalker's Helm"],
-    neck=["Prestor's Talisman of Connivery"],
-    shoulder=["Dragonstalker's Spaulders"],
-    chest=["Dragonstalker's Breastplate"],
-    waist=["Dragonstalker's Belt"],
-    legs=["Dragonstalker's Legguards"],
-    feet=["Dragonstalker's Greaves"],
-    wrist=["Dragonstalker's Bracers"],
-    hands=["Dragonstalker's Gauntlets"],
-    fingers=["Quick Strike Ring","Master Dragonslayer's Ring"],
-    trinkets=["Devilsaur Eye","Blackhand's Breadth"],
-    back=["Cloak of the Shrouded Mists"],
-    mh=["Warblade of the Hakkari"],
-    oh=["Fang of the Faceless"],
-    th=[],
-    ranged=["Ashjre'thul, Crossbow of Smiting"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Ishney",
-    spec_class=SpecClass.MARKS_HUNTER,
-    head=["Dragonstalker's Helm"],
-    neck=["Prestor's Talisman of Connivery"],
-    shoulder=["Dragonstalker's Spaulders"],
-    chest=["Dragonstalker's Breastplate"],
-    waist=["Dragonstalker's Belt"],
-    legs=["Dragonstalker's Legguards"],
-    feet=["Dragonstalker's Greaves"],
-    wrist=["Dragonstalker's Bracers"],
-    hands=["Dragonstalker's Gauntlets"],
-    fingers=["Don Julio's Band","Master Dragonslayer's Ring"],
-    trinkets=["Royal Seal of Eldre'Thalas","Blackhand's Breadth"],
-    back=["Zulian Tigerhide Cloak"],
-    mh=[],
-    oh=[],
-    th=["Lok'delar, Stave of the Ancient Keepers"],
-    ranged=["Ashjre'thul, Crossbow of Smiting"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Irisviiel",
-    spec_class=SpecClass.MARKS_HUNTER,
-    head=["Dragonstalker's Helm"],
-    neck=["Prestor's Talisman of Connivery"],
-    shoulder=["Dragonstalker's Spaulders"],
-    chest=["Dragonstalker's Breastplate"],
-    waist=["Dragonstalker's Belt"],
-    legs=["Dragonstalker's Legguards"],
-    feet=["Dragonstalker's Greaves"],
-    wrist=["Dragonstalker's Bracers"],
-    hands=["Dragonstalker's Gauntlets"],
-    fingers=["Don Julio's Band","Band of Accuria"],
-    trinkets=["Royal Seal of Eldre'Thalas","Blackhand's Breadth"],
-    back=["Cape of the Black Baron"],
-    mh=[],
-    oh=[],
-    th=["Ashkandi, Greatsword of the Brotherhood"],
-    ranged=["Mandokir's Sting"],
-    zg_enchants=2,
-    )
-# Mage
-bpc.addChar(
-    name="Jax",
-    spec_class=SpecClass.FIRE_MAGE,
-    head=["Arcanist Crown"],
-    neck=["Choker of Enlightenment"],
-    shoulder=["Mantle of the Blackwing Cabal"],
-    chest=["Bloodvine Vest"],
-    waist=["Arcanist Belt"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Netherwind Bindings"],
-    hands=["Arcanist Gloves"],
-    fingers=["Ring of Spell Power","Band of Rumination"],
-    trinkets=["Talisman of Ephemeral Power","Mind Quickening Gem"],
-    back=["Cloak of the Brood Lord"],
-    mh=[],
-    oh=[],
-    th=["Staff of Dominance"],
-    ranged=["Stormrager"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Duhd",
-    spec_class=SpecClass.FIRE_MAGE,
-    head=["Netherwind Crown"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Mantle of the Blackwing Cabal"],
-    chest=["Bloodvine Vest"],
-    waist=["Mana Igniting Cord"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Bracers of Arcane Accuracy"],
-    hands=["Bloodtinged Gloves"],
-    fingers=["Ring of Spell Power","Ring of Spell Power"],
-    trinkets=["Talisman of Ephemeral Power","Mind Quickening Gem"],
-    back=["Cloak of Consumption"],
-    mh=["Claw of Chromaggus"],
-    oh=["Jin'do's Bag of Whammies"],
-    th=[],
-    ranged=["Bonecreeper Stylus"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Parisshelton",
-    spec_class=SpecClass.FIRE_MAGE,
-    head=["Netherwind Crown"],
-    neck=["Jeklik's Opaline Talisman"],
-    shoulder=["Mantle of the Blackwing Cabal"],
-    chest=["Bloodvine Vest"],
-    waist=["Mana Igniting Cord"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Netherwind Bindings"],
-    hands=["Netherwind Gloves"],
-    fingers=["Band of Servitude","Zanzil's Seal"],
-    trinkets=["Talisman of Ephemeral Power","Neltharion's Tear"],
-    back=["Cloak of Consumption"],
-    mh=["Bloodcaller"],
-    oh=["Jin'do's Bag of Whammies"],
-    th=[],
-    ranged=["Touch of Chaos"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Dryrun",
-    spec_class=SpecClass.FIRE_MAGE,
-    head=["Champion's Silk Cowl"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Champion's Silk Mantle"],
-    chest=["Bloodvine Vest"],
-    waist=["Belt of Untapped Power"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Bracers of Arcane Accuracy"],
-    hands=["Arcanist Gloves"],
-    fingers=["Band of Servitude","Dragonslayer's Signet"],
-    trinkets=["Eye of the Beast","Zandalarian Hero Charm"],
-    back=["Sapphiron Drape"],
-    mh=["Bloodcaller"],
-    oh=["Tome of Fiery Arcana"],
-    th=[],
-    ranged=["Touch of Chaos"],
-    zg_enchants=2,
-    )
-# Priest
-bpc.addChar(
-    name="Enders",
-    spec_class=SpecClass.HOLY_PRIEST,
-    head=["Halo of Transcendence"],
-    neck=["Amulet of the Shifting Sands"],
-    shoulder=["Pauldrons of Transcendence"],
-    chest=["Robes of Transcendence"],
-    waist=["Belt of Transcendence"],
-    legs=["Leggings of Transcendence"],
-    feet=["Boots of Transcendence"],
-    wrist=["Bindings of Transcendence"],
-    hands=["Handguards of Transcendence"],
-    fingers=["Fordring's Seal","Cauterizing Band"],
-    trinkets=["Royal Seal of Eldre'Thalas","Rejuvenating Gem"],
-    back=["Hide of the Wild"],
-    mh=[],
-    oh=[],
-    th=["Benediction"],
-    ranged=["Essence Gatherer"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Necrohealya",
-    spec_class=SpecClass.HOLY_PRIEST,
-    head=["Halo of Transcendence"],
-    neck=["Jin'do's Evil Eye"],
-    shoulder=["Pauldrons of Transcendence"],
-    chest=["Robes of Transcendence"],
-    waist=["Belt of Transcendence"],
-    legs=["Leggings of Transcendence"],
-    feet=["Boots of Transcendence"],
-    wrist=["Bindings of Transcendence"],
-    hands=["Handguards of Transcendence"],
-    fingers=["Pure Elementium Band","Ring of Blackrock"],
-    trinkets=["Zandalarian Hero Charm","Darkmoon Card: Blue Dragon"],
-    back=["Hide of the Wild"],
-    mh=["Gavel of Infinite Wisdom"],
-    oh=["Lei of the Lifegiver"],
-    th=[],
-    ranged=["Essence Gatherer"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Pythagorean",
-    spec_class=SpecClass.HOLY_PRIEST,
-    head=["Halo of Transcendence"],
-    neck=["Animated Chain Necklace"],
-    shoulder=["Pauldrons of Transcendence"],
-    chest=["Robes of Transcendence"],
-    waist=["Belt of Transcendence"],
-    legs=["Leggings of Transcendence"],
-    feet=["Boots of Transcendence"],
-    wrist=["Bindings of Transcendence"],
-    hands=["Handguards of Transcendence"],
-    fingers=["Pure Elementium Band","Cauterizing Band"],
-    trinkets=["Zandalarian Hero Charm","Shard of the Scale"],
-    back=["Hide of the Wild"],
-    mh=[],
-    oh=["Lei of the Lifegiver"],
-    th=["Benediction"],
-    ranged=["Glowstar Rod of Healing"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Wangcake",
-    spec_class=SpecClass.HOLY_PRIEST,
-    head=["Halo of Transcendence"],
-    neck=["Jin'do's Evil Eye"],
-    shoulder=["Pauldrons of Transcendence"],
-    chest=["Robes of Transcendence"],
-    waist=["Belt of Transcendence"],
-    legs=["Leggings of Transcendence"],
-    feet=["Boots of Transcendence"],
-    wrist=["Bindings of Transcendence"],
-    hands=["Handguards of Transcendence"],
-    fingers=["Ring of Blackrock","Cauterizing Band"],
-    trinkets=["Zandalarian Hero Charm","Rejuvenating Gem"],
-    back=["Hide of the Wild"],
-    mh=[],
-    oh=["Lei of the Lifegiver"],
-    th=["Benediction"],
-    ranged=["Essence Gatherer"],
-    zg_enchants=2,
-    )
-# Rogue
-bpc.addChar(
-    name="Deadstrike",
-    spec_class=SpecClass.COMBAT_ROGUE,
-    head=["Bloodfang Hood"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Bloodfang Spaulders"],
-    chest=["Nightslayer Chestpiece"],
-    waist=["Nightslayer Belt"],
-    legs=["Bloodfang Pants"],
-    feet=["Bloodfang Boots"],
-    wrist=["Nightslayer Bracelets"],
-    hands=["Bloodfang Gloves"],
-    fingers=["Don Julio's Band","Master Dragonslayer's Ring"],
-    trinkets=["Hand of Justice","Royal Seal of Eldre'Thalas"],
-    back=["Cape of the Black Baron"],
-    mh=["Vis'kag the Bloodletter"],
-    oh=["Brutality Blade"],
-    th=[],
-    ranged=["Heartstriker"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Kirilov",
-    spec_class=SpecClass.COMBAT_ROGUE,
-    head=["Bloodfang Hood"],
-    neck=["Prestor's Talisman of Connivery"],
-    shoulder=["Bloodfang Spaulders"],
-    chest=["Bloodfang Chestpiece"],
-    waist=["Bloodfang Belt"],
-    legs=["Bloodfang Pants"],
-    feet=["Bloodfang Boots"],
-    wrist=["Bloodfang Bracers"],
-    hands=["Bloodfang Gloves"],
-    fingers=["Seal of the Gurubashi Berserker","Master Dragonslayer's Ring"],
-    trinkets=["Hand of Justice","Blackhand's Breadth"],
-    back=["Cloak of Firemaw"],
-    mh=["Chromatically Tempered Sword"],
-    oh=["Maladath, Runed Blade of the Black Flight"],
-    th=[],
-    ranged=["Striker's Mark"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Stankdik",
-    spec_class=SpecClass.COMBAT_ROGUE,
-    head=["Bloodfang Hood"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Bloodfang Spaulders"],
-    chest=["Zandalar Madcap's Tunic"],
-    waist=["Bloodfang Belt"],
-    legs=["Bloodfang Pants"],
-    feet=["Boots of the Shadow Flame"],
-    wrist=["Bloodfang Bracers"],
-    hands=["Aged Core Leather Gloves"],
-    fingers=["Quick Strike Ring","Master Dragonslayer's Ring"],
-    trinkets=["Hand of Justice","Blackhand's Breadth"],
-    back=["Cloak of Firemaw"],
-    mh=["Gutgore Ripper"],
-    oh=["Fang of the Faceless"],
-    th=[],
-    ranged=["Gurubashi Dwarf Destroyer"],
-    zg_enchants=2,
-    )
-# Shaman
-bpc.addChar(
-    name="Deyn",
-    spec_class=SpecClass.RESTO_SHAMAN,
-    head=["Helmet of Ten Storms"],
-    neck=["Jin'do's Evil Eye"],
-    shoulder=["Wild Growth Spaulders"],
-    chest=["Robes of the Exalted"],
-    waist=["Belt of Ten Storms"],
-    legs=["Empowered Leggings"],
-    feet=["Greaves of Ten Storms"],
-    wrist=["Bracers of Ten Storms"],
-    hands=["Gauntlets of Ten Storms"],
-    fingers=["Pure Elementium Band","Fordring's Seal"],
-    trinkets=["Briarwood Reed","Zandalarian Hero Charm"],
-    back=["Hide of the Wild"],
-    mh=["Jin'do's Hexxer"],
-    oh=["Lei of the Lifegiver"],
-    th=[],
-    ranged=[],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Ghazan",
-    spec_class=SpecClass.RESTO_SHAMAN,
-    head=["Helmet of Ten Storms"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Wild Growth Spaulders"],
-    chest=["Breastplate of Ten Storms"],
-    waist=["Belt of Ten Storms"],
-    legs=["Salamander Scale Pants"],
-    feet=["Greaves of Ten Storms"],
-    wrist=["Bracers of Ten Storms"],
-    hands=["Gauntlets of Ten Storms"],
-    fingers=["Cauterizing Band","Primalist's Band"],
-    trinkets=["Mindtap Talisman","Zandalarian Hero Charm"],
-    back=["Shroud of Pure Thought"],
-    mh=["Aurastone Hammer"],
-    oh=["Malistar's Defender"],
-    th=[],
-    ranged=[],
-    zg_enchants=0,
-    )
-# Warlock
-bpc.addChar(
-    name="Dietolive",
-    spec_class=SpecClass.ANY_WARLOCK,
-    head=["Mish'undare, Circlet of the Mind Flayer"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Nemesis Spaulders"],
-    chest=["Bloodvine Vest"],
-    waist=["Sash of Whispered Secrets"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Nemesis Bracers"],
-    hands=["Felcloth Gloves"],
-    fingers=["Band of Forced Concentration","Band of Dark Dominion"],
-    trinkets=["Neltharion's Tear","Zandalarian Hero Charm"],
-    back=["Cloak of Consumption"],
-    mh=["Azuresong Mageblade"],
-    oh=["Tome of Shadow Force"],
-    th=[],
-    ranged=["Wizard's Hand of Wrath"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Ultimecia",
-    spec_class=SpecClass.ANY_WARLOCK,
-    head=["Mish'undare, Circlet of the Mind Flayer"],
-    neck=["Choker of the Fire Lord"],
-    shoulder=["Nemesis Spaulders"],
-    chest=["Bloodvine Vest"],
-    waist=["Nemesis Belt"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Nemesis Bracers"],
-    hands=["Ebony Flame Gloves"],
-    fingers=["Ring of Spell Power","Dragonslayer's Signet"],
-    trinkets=["Neltharion's Tear","Zandalarian Hero Charm"],
-    back=["Cloak of the Brood Lord"],
-    mh=[],
-    oh=[],
-    th=["Staff of Dominance"],
-    ranged=["Touch of Chaos"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Gaunz",
-    spec_class=SpecClass.ANY_WARLOCK,
-    head=["Nemesis Skullcap"],
-    neck=["Choker of Enlightenment"],
-    shoulder=["Nemesis Spaulders"],
-    chest=["Bloodvine Vest"],
-    waist=["Nemesis Belt"],
-    legs=["Bloodvine Leggings"],
-    feet=["Bloodvine Boots"],
-    wrist=["Bracers of Arcane Accuracy"],
-    hands=["Ebony Flame Gloves"],
-    fingers=["Band of Forced Concentration","Band of Dark Dominion"],
-    trinkets=["Neltharion's Tear","Zandalarian Hero Charm"],
-    back=["Cloak of Consumption"],
-    mh=["Azuresong Mageblade"],
-    oh=["Jin'do's Bag of Whammies"],
-    th=[],
-    ranged=["Skul's Ghastly Touch"],
-    zg_enchants=2,
-    )
-# DPS Warrior
-bpc.addChar(
-    name="Akecheta",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Lionheart Helm"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Drake Talon Pauldrons"],
-    chest=["Malfurion's Blessed Bulwark"],
-    waist=["Onslaught Girdle"],
-    legs=["Abyssal Plate Legplates of Striking"],
-    feet=["Chromatic Boots"],
-    wrist=["Wristguards of Stability"],
-    hands=["Edgemaster's Handguards"],
-    fingers=["Quick Strike Ring","Seal of the Gurubashi Berserker"],
-    trinkets=["Hand of Justice","Drake Fang Talisman"],
-    back=["Might of the Tribe"],
-    mh=["Crul'shorukh, Edge of Chaos"],
-    oh=["Brutality Blade"],
-    th=[],
-    ranged=["Striker's Mark"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Flatzz",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Lionheart Helm"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Drake Talon Pauldrons"],
-    chest=["Savage Gladiator Chain"],
-    waist=["Zandalar Vindicator's Belt"],
-    legs=["Eldritch Reinforced Legplates"],
-    feet=["Chromatic Boots"],
-    wrist=["Zandalar Vindicator's Armguards"],
-    hands=["Edgemaster's Handguards"],
-    fingers=["Quick Strike Ring","Don Julio's Band"],
-    trinkets=["Hand of Justice","Blackhand's Breadth"],
-    back=["Cloak of Draconic Might"],
-    mh=["Deathbringer"],
-    oh=["Core Hound Tooth"],
-    th=[],
-    ranged=["Striker's Mark"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Chango",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Lionheart Helm"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Drake Talon Pauldrons"],
-    chest=["Savage Gladiator Chain"],
-    waist=["Onslaught Girdle"],
-    legs=["Legionnaire's Plate Leggings"],
-    feet=["Chromatic Boots"],
-    wrist=["Zandalar Vindicator's Armguards"],
-    hands=["Flameguard Gauntlets"],
-    fingers=["Quick Strike Ring","Don Julio's Band"],
-    trinkets=["Hand of Justice","Drake Fang Talisman"],
-    back=["Cape of the Black Baron"],
-    mh=["Crul'shorukh, Edge of Chaos"],
-    oh=["Doom's Edge"],
-    th=[],
-    ranged=["Blastershot Launcher"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Dohvyk",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Lionheart Helm"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Drake Talon Pauldrons"],
-    chest=["Savage Gladiator Chain"],
-    waist=["Zandalar Vindicator's Belt"],
-    legs=["Bloodsoaked Legplates"],
-    feet=["Boots of the Shadow Flame"],
-    wrist=["Battleborn Armbraces"],
-    hands=["Flameguard Gauntlets"],
-    fingers=["Quick Strike Ring","Master Dragonslayer's Ring"],
-    trinkets=["Hand of Justice","Blackhand's Breadth"],
-    back=["Zulian Tigerhide Cloak"],
-    mh=[],
-    oh=[],
-    th=["Bonereaver's Edge"],
-    ranged=["Satyr's Bow"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Furckinstein",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Crown of Destruction"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Champion's Plate Shoulders"],
-    chest=["Runed Bloodstained Hauberk"],
-    waist=["Onslaught Girdle"],
-    legs=["Legionnaire's Plate Leggings"],
-    feet=["Chromatic Boots"],
-    wrist=["Zandalar Vindicator's Armguards"],
-    hands=["Sacrificial Gauntlets"],
-    fingers=["Quick Strike Ring","Don Julio's Band"],
-    trinkets=["Drake Fang Talisman","Blackhand's Breadth"],
-    back=["Cloak of Firemaw"],
-    mh=[],
-    oh=[],
-    th=["Obsidian Edged Blade"],
-    ranged=["Gurubashi Dwarf Destroyer"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Dirty",
-    spec_class=SpecClass.FURY_WARRIOR,
-    head=["Lionheart Helm"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Black Dragonscale Shoulders"],
-    chest=["Black Dragonscale Breastplate"],
-    waist=["Zandalar Vindicator's Belt"],
-    legs=["Black Dragonscale Leggings"],
-    feet=["Black Dragonscale Boots"],
-    wrist=["Zandalar Vindicator's Armguards"],
-    hands=["Flameguard Gauntlets"],
-    fingers=["Quick Strike Ring","Don Julio's Band"],
-    trinkets=["Blackhand's Breadth","Diamond Flask"],
-    back=["Zulian Tigerhide Cloak"],
-    mh=["Warblade of the Hakkari (MH)"],
-    oh=["Warblade of the Hakkari (OH)"],
-    th=[],
-    ranged=["Blastershot Launcher"],
-    zg_enchants=0,
-    )
-# Tank
-bpc.addChar(
-    name="Crox",
-    spec_class=SpecClass.PROT_THREAT_WARRIOR,
-    head=["Helm of Endless Rage"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Drake Talon Pauldrons"],
-    chest=["Savage Gladiator Chain"],
-    waist=["Zandalar Vindicator's Belt"],
-    legs=["Legplates of Wrath"],
-    feet=["Core Forged Greaves"],
-    wrist=["Wristguards of True Flight"],
-    hands=["Edgemaster's Handguards"],
-    fingers=["Master Dragonslayer's Ring","Band of Accuria"],
-    trinkets=["Drake Fang Talisman","Ramstein's Lightning Bolts"],
-    back=["Elementium Threaded Cloak"],
-    mh=["Thunderfury, Blessed Blade of the Windseeker"],
-    oh=["Elementium Reinforced Bulwark"],
-    th=[],
-    ranged=["Striker's Mark"],
-    zg_enchants=0,
-    )
-bpc.addChar(
-    name="Bandakar",
-    spec_class=SpecClass.PROT_THREAT_WARRIOR,
-    head=["Helm of Wrath"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Warlord's Plate Shoulders"],
-    chest=["Warlord's Plate Armor"],
-    waist=["Waistband of Wrath"],
-    legs=["General's Plate Leggings"],
-    feet=["General's Plate Boots"],
-    wrist=["Wristguards of True Flight"],
-    hands=["General's Plate Gauntlets"],
-    fingers=["Quick Strike Ring","Band of Accuria"],
-    trinkets=["Blackhand's Breadth","Hand of Justice"],
-    back=["Dragon's Blood Cape"],
-    mh=["Crul'shorukh, Edge of Chaos"],
-    oh=["Elementium Reinforced Bulwark"],
-    th=[],
-    ranged=["Striker's Mark"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Guliveris",
-    spec_class=SpecClass.PROT_THREAT_WARRIOR,
-    head=["Helm of Wrath"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Warlord's Plate Shoulders"],
-    chest=["Breastplate of Wrath"],
-    waist=["Waistband of Wrath"],
-    legs=["Legplates of Wrath"],
-    feet=["Sabatons of Wrath"],
-    wrist=["Wristguards of True Flight"],
-    hands=["Gauntlets of Might"],
-    fingers=["Master Dragonslayer's Ring","Don Julio's Band"],
-    trinkets=["Blackhand's Breadth","Lifegiving Gem"],
-    back=["Shifting Cloak"],
-    mh=["Perdition's Blade"],
-    oh=["Doom's Edge"],
-    th=[],
-    ranged=["Satyr's Bow"],
-    zg_enchants=2,
-    )
-bpc.addChar(
-    name="Pemberstone",
-    spec_class=SpecClass.FERAL_TANK_DRUID,
-    head=["Foror's Eyepatch"],
-    neck=["Onyxia Tooth Pendant"],
-    shoulder=["Abyssal Leather Shoulders"],
-    chest=["Malfurion's Blessed Bulwark"],
-    waist=["Belt of Preserved Heads"],
-    legs=["Abyssal Leather Leggings"],
-    feet=["Boots of the Shadow Flame"],
-    wrist=["Wristguards of Stability"],
-    hands=["Aged Core Leather Gloves"],
-    fingers=["Circle of Applied Force","Band of Accuria"],
-    trinkets=["Mark of Tyranny","Rune of the Guard Captain"],
-    back=["Dragon's Blood Cape"],
-    mh=[],
-    oh=[],
-    th=["Blessed Qiraji War Hammer"],
-    ranged=[],
-    zg_enchants=0,
-    )
-
-# add loot items to boss loot tables
-# Onyxia
-boss_name = "Onyxia"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Onyxia Tooth Pendant",
-    slot=Slot.NECK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:64,
-        SpecClass.FURY_WARRIOR:52,
-        SpecClass.PROT_THREAT_WARRIOR:62,
-        SpecClass.FERAL_TANK_DRUID:111,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonslayer's Signet",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:16,
-        SpecClass.FIRE_MAGE:14,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Helm of Wrath",
-    slot=Slot.HEAD,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:104,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Cover",
-    slot=Slot.HEAD,
-    drop_chance_list=[18.55],
-    ep_map={
-        SpecClass.RESTO_DRUID:62,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nemesis Skullcap",
-    slot=Slot.HEAD,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:36,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Helmet of Ten Storms",
-    slot=Slot.HEAD,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:56,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Halo of Transcendence",
-    slot=Slot.HEAD,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:105,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Shard of the Scale",
-    slot=Slot.TRINKET,
-    drop_chance_list=[5.71],
-    ep_map={
-        SpecClass.RESTO_DRUID:48,
-        SpecClass.HOLY_PRIEST:56,
-        SpecClass.RESTO_SHAMAN:96,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Deathbringer",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[5.86],
-    ep_map={
-        SpecClass.FURY_WARRIOR:935,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Vis'kag the Bloodletter",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[5.70],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:903,
-
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Helm",
-    slot=Slot.HEAD,
-    drop_chance_list=[29.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:104,
-    },
-    )  
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Netherwind Crown",
-    slot=Slot.HEAD,
-    drop_chance_list=[19.55],
-    ep_map={
-        SpecClass.FIRE_MAGE:37,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sapphiron Drape",
-    slot=Slot.BACK,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:17,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Hood",
-    slot=Slot.HEAD,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:95,
-    },
-    )
-
-# Lucifron
-boss_name = "Lucifron"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cenarion Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[22.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:38,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Choker of Enlightenment",
-    slot=Slot.NECK,
-    drop_chance_list=[23.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:20,
-        SpecClass.ANY_WARLOCK:21,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gauntlets of Might",
-    slot=Slot.HANDS,
-    drop_chance_list=[30.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:72,
-    },
-    )
-
-# Magmadar
-boss_name = "Magmadar"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nightslayer Pants",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:97,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Striker's Mark",
-    slot=Slot.RANGED,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:40,
-        SpecClass.FURY_WARRIOR:42,
-        SpecClass.PROT_THREAT_WARRIOR:49,
-    },
-    )
-
-# Gehennas
-boss_name = "Gehennas"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nightslayer Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[32.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:65,
-    },
-    )
-
-# Garr
-boss_name = "Garr"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Aurastone Hammer",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:43,
-        SpecClass.RESTO_SHAMAN:67,
-        SpecClass.HOLY_PRIEST:54,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Earthfury Helmet",
-    slot=Slot.HEAD,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:86,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Arcanist Crown",
-    slot=Slot.HEAD,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:38,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Brutality Blade",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[19.00],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:897,
-        SpecClass.FURY_WARRIOR:894,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gutgore Ripper",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[19.00],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:798,
-        SpecClass.FURY_WARRIOR:798,
-    },
-    )
-
-# Golemagg the Incinerator
-boss_name = "Golemagg the Incinerator"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Staff of Dominance",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[20.00],
-    ep_map={
-        SpecClass.FIRE_MAGE:59,
-        SpecClass.ANY_WARLOCK:63,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Blastershot Launcher",
-    slot=Slot.RANGED,
-    drop_chance_list=[25.00],
-    ep_map={
-        SpecClass.FURY_WARRIOR:20,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Azuresong Mageblade",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[20.00],
-    ep_map={
-        SpecClass.FIRE_MAGE:54,
-        SpecClass.ANY_WARLOCK:56,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nightslayer Chestpiece",
-    slot=Slot.CHEST,
-    drop_chance_list=[20.00],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:89,
-    },
-    )
-
-
-# Baron Geddon
-boss_name = "Baron Geddon"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Seal of the Archmagus",
-    slot=Slot.FINGER,
-    drop_chance_list=[32.21],
-    ep_map={
-        SpecClass.RESTO_DRUID:17,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Thunderfury, Blessed Blade of the Windseeker",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[3.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:700,
-    },
-    )
-
-# Shazzrah
-boss_name = "Shazzrah"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Arcanist Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[32.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:17,
-    },
-    )
-
-# Sulfuron Harbinger
-boss_name = "Sulfuron Harbinger"
-
-# Multiple
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Fire Runed Grimoire",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[4.0,9.0,13.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:17,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Obsidian Edged Blade",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[4.0,9.0,11.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1160,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Quick Strike Ring",
-    slot=Slot.FINGER,
-    drop_chance_list=[4.0,9.0,12.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:59,
-        SpecClass.COMBAT_ROGUE:59,
-        SpecClass.FURY_WARRIOR:60,
-        SpecClass.PROT_THREAT_WARRIOR:62,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Talisman of Ephemeral Power",
-    slot=Slot.TRINKET,
-    drop_chance_list=[4.0,9.0,11.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:29,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Mana Igniting Cord",
-    slot=Slot.WAIST,
-    drop_chance_list=[4.0,9.0,11.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:40,
-        SpecClass.ANY_WARLOCK:42,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Aged Core Leather Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[7.0,7.0,7.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:40,
-        SpecClass.FERAL_TANK_DRUID:143,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Sulfuron Harbinger","Baron Geddon","Gehennas","Lucifron"],
-    loot_name="Ring of Spell Power",
-    slot=Slot.FINGER,
-    drop_chance_list=[5.0,4.0,7.0,4.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:33,
-        SpecClass.ANY_WARLOCK:33,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Sulfuron Harbinger","Shazzrah","Gehennas","Lucifron"],
-    loot_name="Salamander Scale Pants",
-    slot=Slot.LEGS,
-    drop_chance_list=[5.0,5.0,5.0,5.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:122,
-        SpecClass.RESTO_DRUID:82,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Sulfuron Harbinger","Shazzrah","Gehennas","Lucifron"],
-    loot_name="Wristguards of Stability",
-    slot=Slot.WRISTS,
-    drop_chance_list=[3.0,3.0,5.0,3.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:48,
-        SpecClass.FERAL_TANK_DRUID:98,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Golemagg the Incinerator","Garr","Magmadar"],
-    loot_name="Flameguard Gauntlets",
-    slot=Slot.HANDS,
-    drop_chance_list=[4.0,9.0,11.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:74,
-    },
-    )
-
-# Majordomo Executus
-boss_name = "Majordomo Executus"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Wild Growth Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:70,
-        SpecClass.RESTO_SHAMAN:76,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Wristguards of True Flight",
-    slot=Slot.WRISTS,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:47,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Core Forged Greaves",
-    slot=Slot.FEET,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:70, # 0 for threat
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Core Hound Tooth",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:838,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sash of Whispered Secrets",
-    slot=Slot.WAIST,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:33,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cauterizing Band",
-    slot=Slot.FINGER,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:50,
-        SpecClass.HOLY_PRIEST:60,
-        SpecClass.RESTO_SHAMAN:60,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Lok'delar, Stave of the Ancient Keepers",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[50.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:57,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Benediction",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[50.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:156,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gloves of the Hypnotic Flame",
-    slot=Slot.HANDS,
-    drop_chance_list=[24.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:36,
-    },
-    )
-
-# Ragnaros
-boss_name = "Ragnaros"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Choker of the Fire Lord",
-    slot=Slot.NECK,
-    drop_chance_list=[16.67],
-    ep_map={
-        SpecClass.RESTO_DRUID:36,
-        SpecClass.FIRE_MAGE:35,
-        SpecClass.RESTO_SHAMAN:42,
-        SpecClass.ANY_WARLOCK:36,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragon's Blood Cape",
-    slot=Slot.BACK,
-    drop_chance_list=[27.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:28,
-        SpecClass.FERAL_TANK_DRUID:108,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Onslaught Girdle",
-    slot=Slot.WAIST,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:102,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Legguards",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:81,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Legplates of Wrath",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:126,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Crown of Destruction",
-    slot=Slot.HEAD,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:84,
-        SpecClass.PROT_THREAT_WARRIOR:88,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Pants",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:105,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Band of Sulfuras",
-    slot=Slot.FINGER,
-    drop_chance_list=[19.05],
-    ep_map={
-        SpecClass.RESTO_DRUID:12,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Legguards",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:137,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of the Shrouded Mists",
-    slot=Slot.BACK,
-    drop_chance_list=[21.43],
-    ep_map={
-        SpecClass.MARKS_HUNTER:61,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Band of Accuria",
-    slot=Slot.FINGER,
-    drop_chance_list=[16.67],
-    ep_map={
-        SpecClass.MARKS_HUNTER:89,
-        SpecClass.COMBAT_ROGUE:66,
-        SpecClass.FURY_WARRIOR:58,
-        SpecClass.PROT_THREAT_WARRIOR:71,
-        SpecClass.FERAL_TANK_DRUID:122,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Leggings of Transcendence",
-    slot=Slot.LEGS,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:120,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Perdition's Blade",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[13.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:906,
-        SpecClass.PROT_THREAT_WARRIOR:437,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Malistar's Defender",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[7.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:68,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bonereaver's Edge",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1253,
-    },
-    )
-
-# MC Trash
-boss_name = "MC Trash"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Arcanist Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:18,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nightslayer Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:65,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nightslayer Bracelets",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:38,
-    },
-    )
-
-# Razorgore the Untamed
-boss_name = "Razorgore the Untamed"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:62,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nemesis Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:18,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bracers of Ten Storms",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:55,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:43,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bindings of Transcendence",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:67,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:64,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mantle of the Blackwing Cabal",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:37,
-        SpecClass.ANY_WARLOCK:38,
-
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Netherwind Bindings",
-    slot=Slot.WRISTS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:22,
-    },
-    )
-
-# Vaelastrasz the Corrupt
-boss_name = "Vaelastrasz the Corrupt"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.38],
-    ep_map={
-        SpecClass.RESTO_DRUID:50,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Waistband of Wrath",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:63,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Helm of Endless Rage",
-    slot=Slot.HEAD,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:79,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nemesis Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.38],
-    ep_map={
-        SpecClass.ANY_WARLOCK:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[23.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:75,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[23.1],
-    ep_map={
-        SpecClass.MARKS_HUNTER:84,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mind Quickening Gem",
-    slot=Slot.TRINKET,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:30,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Belt of Transcendence",
-    slot=Slot.WAIST,
-    drop_chance_list=[23.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:67,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Belt of Ten Storms",
-    slot=Slot.WAIST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:48,
-    },
-    )
-
-# Broodlord Lashlayer
-boss_name = "Broodlord Lashlayer"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:46,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sabatons of Wrath",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:84,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Lifegiving Gem",
-    slot=Slot.TRINKET,
-    drop_chance_list=[30.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Greaves of Ten Storms",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:39,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Heartstriker",
-    slot=Slot.RANGED,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:24,
-        SpecClass.FURY_WARRIOR:24,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of Transcendence",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:75,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Greaves",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:84,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bracers of Arcane Accuracy",
-    slot=Slot.WRISTS,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:36,
-        SpecClass.ANY_WARLOCK:44,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Maladath, Runed Blade of the Black Flight",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:900,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:54,
-    },
-    )
-
-# Firemaw
-boss_name = "Firemaw"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Firemaw's Clutch",
-    slot=Slot.WAIST,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:37,
-        SpecClass.ANY_WARLOCK:38,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of Firemaw",
-    slot=Slot.BACK,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:50,
-        SpecClass.FURY_WARRIOR:50,
-        SpecClass.PROT_THREAT_WARRIOR:50,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Claw of the Black Drake",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:955,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Legguards of the Fallen Crusader",
-    slot=Slot.LEGS,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:78,
-    },
-    )
-
-# Flamegor
-boss_name = "Flamegor"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Shroud of Pure Thought",
-    slot=Slot.BACK,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:82,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Circle of Applied Force",
-    slot=Slot.FINGER,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:95,
-    },
-    )
-
-# Ebonroc
-boss_name = "Ebonroc"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonbreath Hand Cannon",
-    slot=Slot.RANGED,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:27,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Drake Fang Talisman",
-    slot=Slot.TRINKET,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:92,
-        SpecClass.FURY_WARRIOR:96,
-        SpecClass.FERAL_TANK_DRUID:136,
-        SpecClass.PROT_THREAT_WARRIOR:110,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Band of Forced Concentration",
-    slot=Slot.FINGER,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:36,
-        SpecClass.ANY_WARLOCK:44,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ebony Flame Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:46,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Malfurion's Blessed Bulwark",
-    slot=Slot.CHEST,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:80,
-        SpecClass.FERAL_TANK_DRUID:279,
-    },
-    )
-
-# Three Drakes
-bpc.addLoot(
-    boss_list=["Ebonroc","Flamegor","Firemaw"],
-    loot_name="Ring of Blackrock",
-    slot=Slot.FINGER,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:51,
-        SpecClass.RESTO_DRUID:46,
-        SpecClass.RESTO_SHAMAN:73,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Ebonroc","Flamegor","Firemaw"],
-    loot_name="Rejuvenating Gem",
-    slot=Slot.TRINKET,
-    drop_chance_list=[12.0,12.0,12.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:93,
-        SpecClass.HOLY_PRIEST:98,
-        SpecClass.RESTO_SHAMAN:120,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Drake Talon Pauldrons",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:60,
-        SpecClass.PROT_THREAT_WARRIOR:61,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Stormrage Handguards",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:55,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Gauntlets of Ten Storms",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:69,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Handguards of Transcendence",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:68,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Dragonstalker's Gauntlets",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:84,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Netherwind Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:35,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Firemaw","Flamegor","Ebonroc"],
-    loot_name="Bloodfang Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[13.0,13.0,13.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:59,
-    },
-    )
-
-# Chromaggus
-boss_name = "Chromaggus"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Pauldrons",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[20.14],
-    ep_map={
-        SpecClass.RESTO_DRUID:52,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Elementium Reinforced Bulwark",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:67,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Elementium Threaded Cloak",
-    slot=Slot.BACK,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:54, # actually zero for threat...
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Chromatic Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:80,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Nemesis Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:27,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Empowered Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:102,
-        SpecClass.HOLY_PRIEST:119,
-        SpecClass.RESTO_SHAMAN:91,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[22.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:86,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ashjre'thul, Crossbow of Smiting",
-    slot=Slot.RANGED,
-    drop_chance_list=[9.67],
-    ep_map={
-        SpecClass.MARKS_HUNTER:1014,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Claw of Chromaggus",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[9.8],
-    ep_map={
-        SpecClass.FIRE_MAGE:67,
-        SpecClass.ANY_WARLOCK:69,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Angelista's Grasp",
-    slot=Slot.WAIST,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:30,
-        SpecClass.ANY_WARLOCK:45,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Pauldrons of Transcendence",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[23.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:70,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Chromatically Tempered Sword",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:991,
-        SpecClass.FURY_WARRIOR:991,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[23.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:54,
-    },
-    )
-
-# Nefarian
-boss_name = "Nefarian"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Stormrage Chestguard",
-    slot=Slot.CHEST,
-    drop_chance_list=[19.75],
-    ep_map={
-        SpecClass.RESTO_DRUID:67,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Breastplate of Wrath",
-    slot=Slot.CHEST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:112,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Breastplate of Ten Storms",
-    slot=Slot.CHEST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:60,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mish'undare, Circlet of the Mind Flayer",
-    slot=Slot.HEAD,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:67,
-        SpecClass.FIRE_MAGE:64,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Staff of the Shadow Flame",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:117,
-        SpecClass.FIRE_MAGE:114,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Lok'amir il Romathis",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[8.86],
-    ep_map={
-        SpecClass.RESTO_DRUID:93,
-        SpecClass.RESTO_SHAMAN:106,
-        SpecClass.HOLY_PRIEST:114,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Pure Elementium Band",
-    slot=Slot.FINGER,
-    drop_chance_list=[18.74],
-    ep_map={
-        SpecClass.RESTO_DRUID:61,
-        SpecClass.HOLY_PRIEST:76,
-        SpecClass.RESTO_SHAMAN:65,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Prestor's Talisman of Connivery",
-    slot=Slot.NECK,
-    drop_chance_list=[18.94],
-    ep_map={
-        SpecClass.MARKS_HUNTER:106,
-        SpecClass.COMBAT_ROGUE:75,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dragonstalker's Breastplate",
-    slot=Slot.CHEST,
-    drop_chance_list=[21.71],
-    ep_map={
-        SpecClass.MARKS_HUNTER:123,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Master Dragonslayer's Ring",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:70,
-        SpecClass.COMBAT_ROGUE:66,
-        SpecClass.FURY_WARRIOR:68,
-        SpecClass.FERAL_TANK_DRUID:108,
-        SpecClass.PROT_THREAT_WARRIOR:75,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ashkandi, Greatsword of the Brotherhood",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[9.11],
-    ep_map={
-        SpecClass.MARKS_HUNTER:86,
-        SpecClass.FURY_WARRIOR:1408,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of the Brood Lord",
-    slot=Slot.BACK,
-    drop_chance_list=[18.41],
-    ep_map={
-        SpecClass.FIRE_MAGE:31,
-        SpecClass.ANY_WARLOCK:32,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Neltharion's Tear",
-    slot=Slot.TRINKET,
-    drop_chance_list=[18.25],
-    ep_map={
-        SpecClass.FIRE_MAGE:70,
-        SpecClass.ANY_WARLOCK:83,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Robes of Transcendence",
-    slot=Slot.CHEST,
-    drop_chance_list=[21.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:107,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodfang Chestpiece",
-    slot=Slot.CHEST,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:122,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of the Shadow Flame",
-    slot=Slot.FEET,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:80,
-        SpecClass.FURY_WARRIOR:84,
-        SpecClass.FERAL_TANK_DRUID:265,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Crul'shorukh, Edge of Chaos",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1030,
-        SpecClass.PROT_THREAT_WARRIOR:507,
-    },
-    )
-
-# BWL Trash
-boss_name = "BWL Trash"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Essence Gatherer",
-    slot=Slot.RANGED,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:26,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Doom's Edge",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:870,
-        SpecClass.PROT_THREAT_WARRIOR:421,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of Draconic Might",
-    slot=Slot.RANGED,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:48,
-        SpecClass.PROT_THREAT_WARRIOR:49,
-        SpecClass.COMBAT_ROGUE:48,
-        SpecClass.FERAL_TANK_DRUID:100,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of Pure Thought",
-    slot=Slot.FEET,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:90,
-        SpecClass.RESTO_SHAMAN:76,
-        SpecClass.RESTO_DRUID:71,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Band of Dark Dominion",
-    slot=Slot.FINGER,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:35,
-    },
-    )
-
-# Jin'do the Hexxer
-boss_name = "Jin'do the Hexxer"
-bpc.addLoot(
-    boss_list=["Jin'do the Hexxer","Bloodlord Mandokir"],
-    loot_name="Primal Hakkari Idol",
-    slot=Slot.ZG_ENCHANTS,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:27,
-        SpecClass.MARKS_HUNTER:46,
-        SpecClass.FIRE_MAGE:31,
-        SpecClass.HOLY_PRIEST:38,
-        SpecClass.COMBAT_ROGUE:28,
-        SpecClass.RESTO_SHAMAN:31,
-        SpecClass.ANY_WARLOCK:18,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Jin'do's Evil Eye",
-    slot=Slot.NECK,
-    drop_chance_list=[14.4],
-    ep_map={
-        SpecClass.RESTO_DRUID:50,
-        SpecClass.HOLY_PRIEST:64,
-        SpecClass.RESTO_SHAMAN:57,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Jin'do's Hexxer",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[14.61],
-    ep_map={
-        SpecClass.RESTO_DRUID:64,
-        SpecClass.RESTO_SHAMAN:62,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodtinged Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[16.66],
-    ep_map={
-        SpecClass.FIRE_MAGE:34,
-        SpecClass.ANY_WARLOCK:41,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Jin'do's Bag of Whammies",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[14.15],
-    ep_map={
-        SpecClass.FIRE_MAGE:33,
-        SpecClass.ANY_WARLOCK:41,
-    },
-    )
-
-# High Priestess Jeklik
-boss_name = "High Priestess Jeklik"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Primalist's Band",
-    slot=Slot.FINGER,
-    drop_chance_list=[19.7],
-    ep_map={
-        SpecClass.RESTO_DRUID:21,
-        SpecClass.HOLY_PRIEST:52,
-        SpecClass.RESTO_SHAMAN:48,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Jeklik's Opaline Talisman",
-    slot=Slot.NECK,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:22,
-    },
-    )
-
-# High Priest Venoxis
-boss_name = "High Priest Venoxis"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Zulian Tigerhide Cloak",
-    slot=Slot.BACK,
-    drop_chance_list=[18.41],
-    ep_map={
-        SpecClass.MARKS_HUNTER:58,
-        SpecClass.FURY_WARRIOR:33,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Blooddrenched Footpads",
-    slot=Slot.FEET,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:58,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Runed Bloodstained Hauberk",
-    slot=Slot.CHEST,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:78,
-    },
-    )
-
-# High Priest Thekal
-boss_name = "High Priest Thekal"
-
-# High Priestess Mar'li
-boss_name = "High Priestess Mar'li"
-
-# High Priestess Arlokk
-boss_name = "High Priestess Arlokk"
-
-# Multiple
-bpc.addLoot(
-    boss_list=["Hakkar","Bloodlord Mandokir"],
-    loot_name="Warblade of the Hakkari (OH)",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[4.0,9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:796,
-    },
-    )
-bpc.addLoot(
-    boss_list=["High Priestess Arlokk","High Priestess Mar'li","High Priest Thekal","High Priest Venoxis","High Priestess Jeklik"],
-    loot_name="Band of Servitude",
-    slot=Slot.FINGER,
-    drop_chance_list=[10.0,10.0,10.0,10.0,10.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:25,
-    },
-    )
-bpc.addLoot(
-    boss_list=["High Priestess Arlokk","High Priestess Mar'li","High Priest Thekal","High Priest Venoxis","High Priestess Jeklik"],
-    loot_name="Sacrificial Gauntlets",
-    slot=Slot.HANDS,
-    drop_chance_list=[10.0,10.0,10.0,10.0,10.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:78,
-    },
-    )
-bpc.addLoot(
-    boss_list=["High Priestess Arlokk","High Priestess Mar'li","High Priest Thekal","High Priest Venoxis","High Priestess Jeklik"],
-    loot_name="Might of the Tribe",
-    slot=Slot.BACK,
-    drop_chance_list=[9.0,9.0,9.0,9.0,9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:28,
-    },
-    )
-bpc.addLoot(
-    boss_list=["High Priestess Arlokk","High Priestess Mar'li","High Priest Thekal","High Priest Venoxis","High Priestess Jeklik"],
-    loot_name="Belt of Untapped Power",
-    slot=Slot.WAIST,
-    drop_chance_list=[9.0,9.0,9.0,9.0,9.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:30,
-        SpecClass.ANY_WARLOCK:31,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Bloodlord Mandokir","High Priest Thekal","High Priest Venoxis","High Priestess Arlokk","High Priestess Jeklik","Jin'do the Hexxer","High Priestess Mar'li"],
-    loot_name="Zandalar Vindicator's Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[9.0,18.0,9.0,19.0,10.0,10.0,18.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:70,
-        SpecClass.PROT_THREAT_WARRIOR:72,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Bloodlord Mandokir","High Priest Thekal","High Priest Venoxis","High Priestess Arlokk","High Priestess Jeklik","Jin'do the Hexxer","High Priestess Mar'li"],
-    loot_name="Zandalar Vindicator's Armguards",
-    slot=Slot.WRISTS,
-    drop_chance_list=[9.0,18.0,9.0,19.0,10.0,10.0,18.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:39,
-    },
-    )
-
-# Bloodlord Mandokir
-boss_name = "Bloodlord Mandokir"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Hakkari Loa Cloak",
-    slot=Slot.BACK,
-    drop_chance_list=[17.69],
-    ep_map={
-        SpecClass.RESTO_DRUID:38,
-        SpecClass.RESTO_SHAMAN:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Primalist's Seal",
-    slot=Slot.FINGER,
-    drop_chance_list=[18.85],
-    ep_map={
-        SpecClass.RESTO_DRUID:36,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mandokir's Sting",
-    slot=Slot.RANGED,
-    drop_chance_list=[9.49],
-    ep_map={
-        SpecClass.MARKS_HUNTER:816,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Zanzil's Seal",
-    slot=Slot.FINGER,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:26,
-    },
-    )
-
-# Hakkar
-boss_name = "Hakkar"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Zandalarian Hero Charm",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:34,
-        SpecClass.HOLY_PRIEST:34,
-        SpecClass.RESTO_SHAMAN:34,
-        SpecClass.ANY_WARLOCK:17,
-        SpecClass.FIRE_MAGE:17,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Warblade of the Hakkari (MH)",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:829,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodsoaked Legplates",
-    slot=Slot.LEGS,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:72,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gurubashi Dwarf Destroyer",
-    slot=Slot.RANGED,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:30,
-        SpecClass.FURY_WARRIOR:30,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Warblade of the Hakkari",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:57,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Fang of the Faceless",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:57,
-        SpecClass.COMBAT_ROGUE:842,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of Consumption",
-    slot=Slot.BACK,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:38,
-        SpecClass.ANY_WARLOCK:45,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Touch of Chaos",
-    slot=Slot.RANGED,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:18,
-        SpecClass.ANY_WARLOCK:18,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bloodcaller",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:36,
-        SpecClass.ANY_WARLOCK:37,
-    },
-    )
-
-# Gahz'ranka
-boss_name = "Gahz'ranka"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Foror's Eyepatch",
-    slot=Slot.HEAD,
-    drop_chance_list=[13.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:88,
-        SpecClass.FURY_WARRIOR:84,
-        SpecClass.FERAL_TANK_DRUID:209,
-    },
-    )
-
-# Kurinnaxx
-boss_name = "Kurinnaxx"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Toughened Silithid Hide Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:166,
-    },
-    )
-
-# General Rajaxx
-boss_name = "General Rajaxx"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of the Vanguard",
-    slot=Slot.FEET,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:66,
-        SpecClass.FURY_WARRIOR:66,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Legplates of the Qiraji Command",
-    slot=Slot.LEGS,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:80,
-    },
-    )
-
-# Moam
-boss_name = "Moam"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Talon of Furious Concentration",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:35,
-        SpecClass.ANY_WARLOCK:36,
-    },
-    )
-
-# Buru the Gorger
-boss_name = "Buru the Gorger"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Slime Kickers",
-    slot=Slot.FEET,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:68,
-    },
-    )
-
-# Ayamiss the Hunter
-boss_name = "Ayamiss the Hunter"
-
-# Ossirian the Unscarred
-boss_name = "Ossirian the Unscarred"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Amulet of the Shifting Sands",
-    slot=Slot.NECK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:64,
-        SpecClass.HOLY_PRIEST:67,
-        SpecClass.RESTO_SHAMAN:82,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sandstorm Cloak",
-    slot=Slot.NECK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:129,
-        SpecClass.PROT_THREAT_WARRIOR:25,
-        SpecClass.FURY_WARRIOR:24,
-        SpecClass.COMBAT_ROGUE:13,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bracers of Brutality",
-    slot=Slot.WRISTS,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:54,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gloves of Dark Wisdom",
-    slot=Slot.HANDS,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:56,
-        SpecClass.HOLY_PRIEST:76,
-        SpecClass.RESTO_SHAMAN:89,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Crossbow of Imminent Doom",
-    slot=Slot.RANGED,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:37,
-        SpecClass.FURY_WARRIOR:37,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Shackles of the Unscarred",
-    slot=Slot.WRISTS,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:23,
-        SpecClass.ANY_WARLOCK:24,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Staff of the Ruins",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:90,
-        SpecClass.ANY_WARLOCK:99,
-    },
-    )
-
-# Multiple
-bpc.addLoot(
-    boss_list=["Kurinnaxx","Buru the Gorger","Ayamiss the Hunter","General Rajaxx"],
-    loot_name="Drape of Unyielding Strength",
-    slot=Slot.BACK,
-    drop_chance_list=[59.0,20.0,20.0,72.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:59,
-        SpecClass.PROT_THREAT_WARRIOR:66,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Moam","Buru the Gorger","Ayamiss the Hunter","Ossirian the Unscarred"],
-    loot_name="Gavel of Infinite Wisdom",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[70.0,22.0,16.0,64.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:117,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Moam","Ossirian the Unscarred","Ayamiss the Hunter","Buru the Gorger"],
-    loot_name="Blade of Vaulted Secrets",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[70.0,64.0,16.0,22.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:56,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Moam","Ossirian the Unscarred","Ayamiss the Hunter","Buru the Gorger"],
-    loot_name="Kris of Unspoken Names",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[70.0,64.0,16.0,22.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:61,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Kurinnaxx","General Rajaxx","Ayamiss the Hunter","Buru the Gorger"],
-    loot_name="Cloak of Veiled Shadows",
-    slot=Slot.BACK,
-    drop_chance_list=[50.0,50.0,50.0,50.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:52,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Ossirian the Unscarred","Ayamiss the Hunter","Buru the Gorger","Moam","General Rajaxx","Kurinnaxx"],
-    loot_name="Ring of Unspoken Names",
-    slot=Slot.FINGER,
-    drop_chance_list=[17.0,50.0,50.0,17.0,17.0,17.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:46,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Ossirian the Unscarred","Ayamiss the Hunter","Buru the Gorger","Moam","General Rajaxx","Kurinnaxx"],
-    loot_name="Band of Vaulted Secrets",
-    slot=Slot.FINGER,
-    drop_chance_list=[17.0,50.0,50.0,17.0,17.0,17.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:30,
-    },
-    )
-
-# AQ20 Trash
-boss_name = "AQ20 Trash"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Fury of the Forgotten Swarm",
-    slot=Slot.NECK,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:50,
-        SpecClass.FURY_WARRIOR:56,
-        SpecClass.PROT_THREAT_WARRIOR:65,
-    },
-    )
-
-# The Prophet Skeram
-boss_name = "The Prophet Skeram"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of Concentrated Hatred",
-    slot=Slot.BACK,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:61,
-        SpecClass.PROT_THREAT_WARRIOR:66,
-        SpecClass.FURY_WARRIOR:58,
-        SpecClass.FERAL_TANK_DRUID:145,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Staff of the Qiraji Prophets",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[8.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:61,
-        SpecClass.ANY_WARLOCK:63,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Leggings of Immersion",
-    slot=Slot.LEGS,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:64,
-        SpecClass.RESTO_SHAMAN:101,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Breastplate of Annihilation",
-    slot=Slot.CHEST,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:114,
-    },
-    )
-
-# Battleguard Sartura
-boss_name = "Battleguard Sartura"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Creeping Vine Helm",
-    slot=Slot.HEAD,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:87,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Thick Qirajihide Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:174,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Silithid Claw",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[8.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:938,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gloves of Enforcement",
-    slot=Slot.HANDS,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:87,
-        SpecClass.FURY_WARRIOR:96,
-        SpecClass.FERAL_TANK_DRUID:203,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sartura's Might",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:75,
-        SpecClass.RESTO_SHAMAN:88,
-        SpecClass.RESTO_DRUID:68,
-    },
-    )
-
-# Vem
-boss_name = "Vem"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Angelista's Charm",
-    slot=Slot.NECK,
-    drop_chance_list=[25.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:84,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of the Fallen Hero",
-    slot=Slot.FEET,
-    drop_chance_list=[34.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:74,
-    },
-    )
-
-# Princess Yauj
-boss_name = "Princess Yauj"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bile-Covered Gauntlets",
-    slot=Slot.HANDS,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:183,
-    },
-    )
-
-# Lord Kri
-boss_name = "Lord Kri"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Vest of Swift Execution",
-    slot=Slot.CHEST,
-    drop_chance_list=[27.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:101,
-        SpecClass.FURY_WARRIOR:83,
-        SpecClass.FERAL_TANK_DRUID:169,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ring of the Devoured",
-    slot=Slot.FINGER,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:58,
-        SpecClass.RESTO_SHAMAN:79,
-        SpecClass.RESTO_DRUID:43,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Wand of Qiraji Nobility",
-    slot=Slot.RANGED,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:19,
-        SpecClass.ANY_WARLOCK:19,
-    },
-    )
-
-# Fankriss the Unyielding
-boss_name = "Fankriss the Unyielding"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Barbed Choker",
-    slot=Slot.NECK,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:67,
-        SpecClass.FURY_WARRIOR:64,
-        SpecClass.PROT_THREAT_WARRIOR:66,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mantle of Wicked Revenge",
-    slot=Slot.NECK,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:75,
-        SpecClass.FURY_WARRIOR:62,
-        SpecClass.PROT_THREAT_WARRIOR:64,
-        SpecClass.FERAL_TANK_DRUID:199,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ancient Qiraji Ripper",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:1001,
-        SpecClass.FURY_WARRIOR:998,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Robes of the Guardian Saint",
-    slot=Slot.CHEST,
-    drop_chance_list=[19.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:138,
-        SpecClass.RESTO_DRUID:98,
-        SpecClass.HOLY_PRIEST:120,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Totem of Life",
-    slot=Slot.RANGED,
-    drop_chance_list=[7.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:30,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Scaled Sand Reaver Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:102,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Barb of the Sand Reaver",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:114,
-    },
-    )
-
-# Viscidus
-boss_name = "Viscidus"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ring of the Qiraji Fury",
-    slot=Slot.FINGER,
-    drop_chance_list=[13.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:63,
-        SpecClass.FURY_WARRIOR:60,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Sharpened Silithid Femur",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:86,
-        SpecClass.ANY_WARLOCK:87,
-    },
-    )
-
-# Princess Huhuran
-boss_name = "Princess Huhuran"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Huhuran's Stinger",
-    slot=Slot.RANGED,
-    drop_chance_list=[8.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:34,
-        SpecClass.MARKS_HUNTER:968,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Hive Defiler Wristguards",
-    slot=Slot.WRISTS,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:64,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gloves of the Messiah",
-    slot=Slot.HANDS,
-    drop_chance_list=[18.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:81,
-        SpecClass.RESTO_SHAMAN:106,
-        SpecClass.RESTO_DRUID:61,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ring of the Martyr",
-    slot=Slot.FINGER,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:69,
-        SpecClass.RESTO_SHAMAN:81,
-        SpecClass.RESTO_DRUID:66,
-    },
-    )
-
-# Twin Emperors
-boss_name = "Twin Emperors"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Deathdealer's Helm",
-    slot=Slot.HEAD,
-    drop_chance_list=[80.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:124,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ring of Emperor Vek'lor",
-    slot=Slot.FINGER,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:122,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Doomcaller's Circlet",
-    slot=Slot.HEAD,
-    drop_chance_list=[80.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:72,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Enigma Circlet",
-    slot=Slot.HEAD,
-    drop_chance_list=[80.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:77,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Amulet of Vek'nilash",
-    slot=Slot.NECK,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:41,
-        SpecClass.FIRE_MAGE:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Qiraji Execution Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:65,
-        SpecClass.FURY_WARRIOR:66,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Gloves of the Hidden Temple",
-    slot=Slot.HANDS,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:60,
-        SpecClass.FERAL_TANK_DRUID:229,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Bracelets of Royal Redemptione",
-    slot=Slot.WRISTS,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:65,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Royal Scepter of Vek'lor",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[10.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:47,
-        SpecClass.ANY_WARLOCK:55,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Boots of Epiphany",
-    slot=Slot.FEET,
-    drop_chance_list=[14.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:38,
-        SpecClass.ANY_WARLOCK:39,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Kalimdor's Revenge",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[9.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1355,
-    },
-    )
-
-# Ouro
-boss_name = "Ouro"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Larvae of the Great Worm",
-    slot=Slot.RANGED,
-    drop_chance_list=[15.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:41,
-        SpecClass.MARKS_HUNTER:1035,
-        SpecClass.FURY_WARRIOR:38,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Genesis Trousers",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:211,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Conqueror's Legguards",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:107,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Deathdealer's Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:115,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Don Rigoberto's Lost Hat",
-    slot=Slot.HEAD,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:159,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Wormscale Blocker",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:87,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Burrower Bracers",
-    slot=Slot.WRISTS,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:31,
-        SpecClass.ANY_WARLOCK:32,
-    },
-    )
-
-# C'Thun
-boss_name = "C'Thun"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of the Fallen God",
-    slot=Slot.BACK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:62,
-        SpecClass.FURY_WARRIOR:48,
-        SpecClass.PROT_THREAT_WARRIOR:49,
-        SpecClass.FERAL_TANK_DRUID:141,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Mark of C'Thun",
-    slot=Slot.NECK,
-    drop_chance_list=[20.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:116,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of Clarity",
-    slot=Slot.BACK,
-    drop_chance_list=[32.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:102,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Deathdealer's Vest",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:132,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Conqueror's Breastplate",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:92,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Amulet of the Fallen God",
-    slot=Slot.NECK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:93,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Death's Sting",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[8.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:1058,
-        SpecClass.FURY_WARRIOR:1058,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Belt of Never-ending Agony",
-    slot=Slot.WAIST,
-    drop_chance_list=[17.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:105,
-        SpecClass.FURY_WARRIOR:104,
-        SpecClass.FERAL_TANK_DRUID:224,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Scepter of the False Prophet",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[6.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:220,
-        SpecClass.RESTO_SHAMAN:228,
-        SpecClass.RESTO_DRUID:202,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Grasp of the Old God",
-    slot=Slot.WAIST,
-    drop_chance_list=[16.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:106,
-        SpecClass.RESTO_SHAMAN:124,
-        SpecClass.RESTO_DRUID:86,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Cloak of the Devoured",
-    slot=Slot.BACK,
-    drop_chance_list=[12.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:45,
-        SpecClass.ANY_WARLOCK:52,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Eyestalk Waist Cord",
-    slot=Slot.WAIST,
-    drop_chance_list=[30.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:55,
-        SpecClass.ANY_WARLOCK:56,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dark Storm Gauntlets",
-    slot=Slot.HANDS,
-    drop_chance_list=[22.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:53,
-        SpecClass.ANY_WARLOCK:61,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ring of the Fallen God",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:51,
-        SpecClass.ANY_WARLOCK:58,
-    },
-    )
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Dark Edge of Insanity",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[8.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1476,
-    },
-    )
-
-# AQ40 Trash
-boss_name = "AQ40 Trash"
-bpc.addLoot(
-    boss_list=[boss_name],
-    loot_name="Ritssyn's Ring of Chaos",
-    slot=Slot.FINGER,
-    drop_chance_list=[5.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:37,
-        SpecClass.ANY_WARLOCK:38,
-    },
-    )
-
-# Multiple
-bpc.addLoot(
-    boss_list=["Vem","Princess Yauj","Lord Kri"],
-    loot_name="Triad Girdle",
-    slot=Slot.WAIST,
-    drop_chance_list=[22.0,22.0,22.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:71,
-    },
-    )
-# Imperial Qiraji Regalia
-bpc.addLoot(
-    boss_list=["Battleguard Sartura","Vem","Princess Yauj","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro"],
-    loot_name="Blessed Qiraji Augur Staff",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[8.0,9.0,15.0,7.0,10.0,9.0,8.0,10.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:223,
-        SpecClass.RESTO_SHAMAN:262,
-        SpecClass.RESTO_DRUID:195,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Battleguard Sartura","Vem","Princess Yauj","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro"],
-    loot_name="Blessed Qiraji War Hammer",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[8.0,9.0,15.0,7.0,10.0,9.0,8.0,10.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:368,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Battleguard Sartura","Vem","Princess Yauj","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro"],
-    loot_name="Blessed Qiraji Acolyte Staff",
-    slot=Slot.TWO_HAND,
-    drop_chance_list=[8.0,9.0,15.0,7.0,10.0,9.0,8.0,10.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:121,
-        SpecClass.ANY_WARLOCK:137,
-    },
-    )
-# Imperial Qiraji Armaments
-bpc.addLoot(
-    boss_list=["Battleguard Sartura","Vem","Princess Yauj","Lord Kri","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro"],
-    loot_name="Blessed Qiraji Pugio",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[7.0,8.0,16.0,18.0,8.0,21.0,8.0,8.0,8.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:992,
-        SpecClass.FURY_WARRIOR:991,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Battleguard Sartura","Vem","Princess Yauj","Lord Kri","Fankriss the Unyielding","Viscidus","Princess Huhuran","Twin Emperors","Ouro"],
-    loot_name="Blessed Qiraji War Axe",
-    slot=Slot.MAIN_HAND,
-    drop_chance_list=[7.0,8.0,16.0,18.0,8.0,21.0,8.0,8.0,8.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1012,
-    },
-    )
-# Qiraji Bindings of Command and Qiraji Bindings of Dominance
-bpc.addLoot(
-    boss_list=["Viscidus","Princess Huhuran"],
-    loot_name="Deathdealer's Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:89,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Viscidus","Princess Huhuran"],
-    loot_name="Conqueror's Spaulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:76,
-        SpecClass.PROT_THREAT_WARRIOR:85,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Viscidus","Princess Huhuran"],
-    loot_name="Doomcaller's Mantle",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:51,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Viscidus","Princess Huhuran"],
-    loot_name="Enigma Shoulderpads",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:32,
-    },
-    )
-bpc.addLoot(
-    boss_list=["Viscidus","Princess Huhuran"],
-    loot_name="Enigma Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[100.0,100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:44,
-    },
-    )
-
-# None
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Royal Seal of Eldre'Thalas",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:44,
-        SpecClass.MARKS_HUNTER:48,
-        SpecClass.HOLY_PRIEST:47,
-        SpecClass.COMBAT_ROGUE:36,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Hide of the Wild",
-    slot=Slot.BACK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:45,
-        SpecClass.HOLY_PRIEST:54,
-        SpecClass.RESTO_SHAMAN:54,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Idol of the Moon",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:1,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Robes of the Exalted",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:75,
-        SpecClass.RESTO_SHAMAN:74,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Fordring's Seal",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:39,
-        SpecClass.HOLY_PRIEST:43,
-        SpecClass.RESTO_SHAMAN:43,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Lei of the Lifegiver",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:62,
-        SpecClass.HOLY_PRIEST:64,
-        SpecClass.RESTO_SHAMAN:71,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Verdant Footpads",
-    slot=Slot.FEET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:37,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Corehound Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:67,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Devilsaur Eye",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:32,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Blackhand's Breadth",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:57,
-        SpecClass.COMBAT_ROGUE:46,
-        SpecClass.FURY_WARRIOR:40,
-        SpecClass.PROT_THREAT_WARRIOR:44,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Don Julio's Band",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:67,
-        SpecClass.COMBAT_ROGUE:57,
-        SpecClass.FURY_WARRIOR:56,
-        SpecClass.PROT_THREAT_WARRIOR:65,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Cape of the Black Baron",
-    slot=Slot.BACK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.MARKS_HUNTER:62,
-        SpecClass.COMBAT_ROGUE:49,
-        SpecClass.FURY_WARRIOR:35,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Bloodvine Vest",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:56,
-        SpecClass.ANY_WARLOCK:70,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Bloodvine Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:51,
-        SpecClass.ANY_WARLOCK:58,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Bloodvine Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:35,
-        SpecClass.ANY_WARLOCK:43,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Band of Rumination",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:12,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Wand of Biting Cold",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:0,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Champion's Silk Cowl",
-    slot=Slot.HEAD,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:37,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Champion's Silk Mantle",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:29,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Eye of the Beast",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:24,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Tome of Fiery Arcana",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Tome of Shadow Force",
-    slot=Slot.OFF_HAND,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:34,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Darkmoon Card: Blue Dragon",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:56,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Animated Chain Necklace",
-    slot=Slot.NECK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_DRUID:36,
-        SpecClass.HOLY_PRIEST:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Glowstar Rod of Healing",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.HOLY_PRIEST:18,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Wizard's Hand of Wrath",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:10,
-        SpecClass.ANY_WARLOCK:10,
-    },
-    )   
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Satyr's Bow",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:24,
-        SpecClass.FURY_WARRIOR:23,
-        SpecClass.PROT_THREAT_WARRIOR:30,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Seal of the Gurubashi Berserker",
-    slot=Slot.FINGER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:40,
-        SpecClass.FURY_WARRIOR:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Hand of Justice",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:50,
-        SpecClass.FURY_WARRIOR:50,
-        SpecClass.PROT_THREAT_WARRIOR:50,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Mindtap Talisman",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:66,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Briarwood Reed",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.RESTO_SHAMAN:29,
-        SpecClass.ANY_WARLOCK:29,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Stormrager",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:1,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Bonecreeper Stylus",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FIRE_MAGE:12,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Zandalar Madcap's Tunic",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.COMBAT_ROGUE:90,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Felcloth Gloves",
-    slot=Slot.HANDS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:33,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Skul's Ghastly Touch",
-    slot=Slot.RANGED,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.ANY_WARLOCK:14,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Lionheart Helm",
-    slot=Slot.HEAD,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:116,
-        SpecClass.PROT_THREAT_WARRIOR:134,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Abyssal Plate Legplates of Striking",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:65,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Eldritch Reinforced Legplate",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:59,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Champion's Plate Shoulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:54,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Black Dragonscale Shoulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Savage Gladiator Chain",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:80,
-        SpecClass.PROT_THREAT_WARRIOR:85,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Black Dragonscale Breastplate",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:50,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Mugger's Belt",
-    slot=Slot.WAIST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:20,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Edgemaster's Handguards",
-    slot=Slot.HANDS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:110,
-        SpecClass.PROT_THREAT_WARRIOR:110,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Eldritch Reinforced Legplates",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:59,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Legionnaire's Plate Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:64,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Battleborn Armbraces",
-    slot=Slot.WRISTS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Diamond Flask",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:1,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Black Dragonscale Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:28,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Black Dragonscale Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FURY_WARRIOR:54,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Ramstein's Lightning Bolts",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:40,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="General's Plate Boots",
-    slot=Slot.FEET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:76,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="General's Plate Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:111,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="General's Plate Gauntlets",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:62,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Warlord's Plate Armor",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:69,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Warlord's Plate Shoulders",
-    slot=Slot.CHEST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:80,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Shifting Cloak",
-    slot=Slot.BACK,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.PROT_THREAT_WARRIOR:42,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Abyssal Leather Shoulders",
-    slot=Slot.SHOULDER,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:88,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Belt of Preserved Heads",
-    slot=Slot.WAIST,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:161,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Abyssal Leather Leggings",
-    slot=Slot.LEGS,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:92,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Mark of Tyranny",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:87,
-    },
-    )
-bpc.addLoot(
-    boss_list=["CURRENT"],
-    loot_name="Rune of the Guard Captain",
-    slot=Slot.TRINKET,
-    drop_chance_list=[100.0],
-    ep_map={
-        SpecClass.FERAL_TANK_DRUID:52,
-    },
-    ) 
-
-# do the thing
-bpc.calc()
+class RaidSession:
+
+    def __init__(self,bpc,log_path=None,contention=True):
+        # raid night around bpc: boss kills and loot given out update gear and re-rank the bosses still alive
+        # events are appended to log_path as json lines, an existing log is replayed first so a session can be resumed
+        self.bpc = bpc # BossPrioCalc whose character gear is updated
+        self.log_path = log_path # json lines event log, None to keep events in memory only
+        self.killed = [] # names of killed bosses in kill order
+        self.events = [] # list of applied event maps
+        bpc.calc(engine="loop",contention=contention)
+        if log_path is not None and os.path.exists(log_path):
+            self.replay(log_path)
+
+    def replay(self,path):
+        # apply events of a json lines log without writing them again
+        with open(path,encoding="utf-8") as f:
+            for line in f:
+                if line.strip() != "":
+                    self._apply(json.loads(line))
+        return(self.priority())
+
+    def killBoss(self,boss_name):
+        # record boss kill, returns priority of remaining bosses
+        return(self._record({"event":"kill","boss":boss_name}))
+
+    def giveLoot(self,char_name,item_name):
+        # equip item on character and recalc incrementally, returns priority of remaining bosses
+        return(self._record({"event":"loot","char":char_name,"item":item_name}))
+
+    def priority(self):
+        # list of (boss name, mean_enupm) of bosses not killed yet, best first
+        remaining = [boss for boss_name , boss in self.bpc.bosses.items() if boss_name not in self.killed]
+        remaining.sort(key=lambda boss: boss.mean_enupm,reverse=True)
+        return([(boss.name,boss.mean_enupm) for boss in remaining])
+
+    def _record(self,event):
+        # apply event, then append it to log so only valid events are persisted
+        event["time"] = time.time()
+        self._apply(event)
+        if self.log_path is not None:
+            with open(self.log_path,"a",encoding="utf-8") as f:
+                f.write(json.dumps(event) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        return(self.priority())
+
+    def _apply(self,event):
+        if event["event"] == "kill":
+            if event["boss"] not in self.bpc.bosses:
+                print("{} is not a boss".format(event["boss"]))
+                raise RuntimeError("Unknown boss")
+            if event["boss"] in self.killed:
+                print("{} is already killed".format(event["boss"]))
+                raise RuntimeError("Boss killed twice")
+            self.killed.append(event["boss"])
+        elif event["event"] == "loot":
+            if event["item"] not in self.bpc.loot_db:
+                print("{} is not in loot_db".format(event["item"]))
+                raise RuntimeError("Unknown loot_name")
+            if event["char"] not in self.bpc.raid:
+                print("{} is not in raid".format(event["char"]))
+                raise RuntimeError("Unknown character")
+            char_name = event["char"]
+            slot = self.bpc.loot_db[event["item"]].slot
+            gear = self.bpc.raid[char_name].gear[slot]
+            was_dirty = char_name in self.bpc._dirty
+            try:
+                self.bpc.equipItem(char_name,event["item"])
+                # only the new owner changed, loop engine redoes just that character
+                self.bpc.recalc()
+            except RuntimeError:
+                # e.g. item worth 0 ep for the spec in an empty slot, undo so a rejected event leaves the session as it was
+                self.bpc.setGear(char_name,slot,gear)
+                if not was_dirty:
+                    self.bpc._dirty.discard(char_name)
+                raise
+        else:
+            print("{} is not a valid session event".format(event["event"]))
+            raise RuntimeError("Unknown event")
+        self.events.append(event)
+
+class Profiler:
+
+    def __init__(self,trace=False):
+        self.stats = {} # map from phase name to [calls, total ns]
+        self.events = [] if trace else None # list of (phase name, start ns, duration ns) of every call when tracing
+
+    def wrap(self,name,func):
+        # returns func recording wall time and call count under name
+        stats = self.stats.setdefault(name,[0,0])
+        events = self.events
+        def timed(*args,**kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return(func(*args,**kwargs))
+            finally:
+                duration = time.perf_counter_ns() - start
+                stats[0] += 1
+                stats[1] += duration
+                if events is not None:
+                    events.append((name,start,duration))
+        timed.__wrapped__ = func
+        return(timed)
+
+    def summary(self):
+        # table of called phases sorted by total time, times include nested phases
+        lines = ["{:<24} {:>10} {:>12} {:>12}".format("Phase","calls","total ms","mean us")]
+        for name in sorted(self.stats,key=lambda name: self.stats[name][1],reverse=True):
+            calls , total = self.stats[name]
+            if calls > 0:
+                lines.append("{:<24} {:>10} {:>12.3f} {:>12.3f}".format(name,calls,total/1e6,total/1e3/calls))
+        return("\n".join(lines))
+
+    def writeTrace(self,path):
+        # write recorded calls as Chrome trace event json (chrome://tracing, Perfetto, speedscope)
+        if self.events is None:
+            print("profiler was enabled without trace")
+            raise RuntimeError("No trace events")
+        pid = os.getpid()
+        trace_events = [{"name":name,"ph":"X","ts":start/1e3,"dur":duration/1e3,"pid":pid,"tid":0} for name , start , duration in self.events]
+        with open(path,"w") as f:
+            json.dump({"traceEvents":trace_events,"displayTimeUnit":"ms"},f)
+
+_profiled = {} # map from profiled attribute name to (owner, original) while profiling is enabled
+
+def enableProfiling(trace=False):
+    # time every phase in PROFILE_METHODS and PROFILE_FUNCTIONS until disableProfiling, returns the Profiler
+    # timing wrappers are installed on the class and module only while enabled, so disabled profiling costs nothing
+    if len(_profiled) > 0:
+        print("profiling is already enabled")
+        raise RuntimeError("Profiling enabled twice")
+    profiler = Profiler(trace)
+    module = sys.modules[__name__]
+    for owner , names in [(BossPrioCalc,PROFILE_METHODS),(module,PROFILE_FUNCTIONS)]:
+        for name in names:
+            original = getattr(owner,name)
+            _profiled[name] = (owner,original)
+            setattr(owner,name,profiler.wrap(name,original))
+    return(profiler)
+
+def disableProfiling():
+    # restore original methods and functions
+    for name in _profiled:
+        owner , original = _profiled[name]
+        setattr(owner,name,original)
+    _profiled.clear()
+
+def _dataSignature(paths):
+    # cheap signature of data files from size and modification time
+    return([(os.path.getsize(path),os.stat(path).st_mtime_ns) for path in paths])
+
+def _dataHash(paths):
+    # content hash of data files
+    data_hash = hashlib.sha256()
+    for path in paths:
+        with open(path,"rb") as f:
+            data_hash.update(f.read())
+    return(data_hash.hexdigest())
+
+def loadBossPrioCalc(data_dir=DATA_DIR,roster_path=None,use_cache=True):
+    # build BossPrioCalc from bosses.json and loot.json in data_dir and roster (roster.json in data_dir by default)
+    # the built object is pickled next to the roster and reused while the data files are unchanged,
+    # checked by size/mtime first and by content hash when those differ
+    if roster_path is None:
+        roster_path = os.path.join(data_dir,"roster.json")
+    paths = [os.path.join(data_dir,"bosses.json"),os.path.join(data_dir,"loot.json"),roster_path]
+    cache_path = os.path.join(data_dir,"." + os.path.basename(roster_path) + ".cache")
+    signature = _dataSignature(paths)
+    data_hash = None
+
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path,"rb") as f:
+                cache_version , cache_signature , cache_hash = pickle.load(f)
+                if cache_version == CACHE_VERSION:
+                    if cache_signature != signature:
+                        data_hash = _dataHash(paths)
+                    if cache_signature == signature or cache_hash == data_hash:
+                        return(pickle.load(f))
+        except (OSError,EOFError,pickle.UnpicklingError,AttributeError,ValueError):
+            # stale or unreadable cache, rebuild below
+            pass
+
+    bpc = BossPrioCalc()
+    bpc.loadBosses(paths[0])
+    bpc.loadLoot(paths[1])
+    bpc.loadRoster(paths[2])
+
+    if use_cache:
+        if data_hash is None:
+            data_hash = _dataHash(paths)
+        try:
+            cache_path_tmp = cache_path + ".tmp"
+            with open(cache_path_tmp,"wb") as f:
+                pickle.dump((CACHE_VERSION,signature,data_hash),f)
+                pickle.dump(bpc,f,protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cache_path_tmp,cache_path)
+        except OSError:
+            # read-only data_dir, run without cache
+            pass
+
+    return(bpc)
+
+def _writeCSV(path,columns):
+    # write columns as csv, text columns decoded with one lookup per column and rows written in a single writerows
+    fields = []
+    for name , column in columns.items():
+        if isinstance(column,tuple):
+            codes , names = column
+            lookup = np.array(list(names) + [""],dtype=object) # code -1 picks the empty field
+            fields.append(lookup[codes].tolist())
+        else:
+            fields.append(np.where(np.isnan(column),None,column).tolist())
+    with open(path,"w",newline="",encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns))
+        writer.writerows(zip(*fields))
+
+def _solveAssignment(cost):
+    # minimum cost assignment of every row to a distinct column of cost matrix (rows <= columns)
+    # Hungarian method with shortest augmenting paths and potentials, inner loop over columns vectorized
+    # returns column index of each row
+    n_rows , n_cols = cost.shape
+    u = np.zeros(n_rows + 1) # row potentials
+    v = np.zeros(n_cols + 1) # column potentials, column 0 is the virtual start
+    row_of = np.zeros(n_cols + 1,dtype=int) # 1-based row assigned to column, 0 for none
+    way = np.zeros(n_cols + 1,dtype=int) # previous column on augmenting path
+    for i in range(1,n_rows + 1):
+        row_of[0] = i
+        j0 = 0
+        min_v = np.full(n_cols + 1,math.inf)
+        used = np.zeros(n_cols + 1,dtype=bool)
+        while row_of[j0] != 0:
+            used[j0] = True
+            i0 = row_of[j0]
+            free = ~used[1:]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free & (reduced < min_v[1:])
+            min_v[1:][better] = reduced[better]
+            way[1:][better] = j0
+            j1 = int(np.argmin(np.where(free,min_v[1:],math.inf))) + 1
+            delta = min_v[j1]
+            u[row_of[used]] += delta
+            v[used] -= delta
+            min_v[1:][free] -= delta
+            j0 = j1
+        # flip assignments along augmenting path
+        while j0 != 0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    col_of = np.zeros(n_rows,dtype=int)
+    for j in range(1,n_cols + 1):
+        if row_of[j] != 0:
+            col_of[row_of[j] - 1] = j - 1
+    return(col_of)
+
+_batch_bpc = None # BossPrioCalc attached to the shared snapshot in each evaluateRosters worker
+
+def _batchInit(snapshot_path):
+    # open shared loot database snapshot once per worker process
+    global _batch_bpc
+    _batch_bpc = BossPrioCalc()
+    _batch_bpc.attachSnapshot(LootSnapshot(snapshot_path))
+
+def _batchWorker(key,roster,contention):
+    # calc one roster of evaluateRosters with the numpy engine
+    # printed messages are captured so they cannot end up in the stdout of the caller (e.g. json lines of bpc_cli batch),
+    # they are part of the error of a failed roster and go to stderr otherwise
+    bpc = _batch_bpc
+    bpc.clearRaid()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            if isinstance(roster,str):
+                bpc.loadRoster(roster)
+            else:
+                bpc.addRoster(roster)
+            bpc.calc(engine="numpy",contention=contention)
+    except Exception as e:
+        # any bad roster (e.g. TypeError from addChar for a missing or extra gear field) is reported, never stops the batch
+        error = "{}: {}".format(type(e).__name__,e)
+        if len(output.getvalue().strip()) > 0:
+            error += " ({})".format("; ".join(output.getvalue().strip().splitlines()))
+        return(key,{"error":error})
+    sys.stderr.write(output.getvalue())
+    return(key,{boss_name:(bpc.bosses[boss_name].mean_enu,bpc.bosses[boss_name].mean_enupm) for boss_name in bpc.bosses})
+
+def _simulateWorker(drop_chance,drop_boss,drop_value,boss_max,n_lockouts,seed):
+    # roll n_lockouts kills of every boss, returning per boss sum, sum of squares and histogram of realized upgrade
+    rng = np.random.default_rng(seed)
+    n_bosses = len(boss_max)
+    # map from (boss,item) drop entry to upgrade realized for its boss
+    drop_map = np.zeros((len(drop_boss),n_bosses),dtype=np.float32)
+    drop_map[np.arange(len(drop_boss)),drop_boss] = drop_value
+    drop_chance = drop_chance.astype(np.float32)
+    bin_scale = np.zeros(n_bosses)
+    np.divide(SIM_BINS,boss_max,out=bin_scale,where=boss_max > 0)
+    bin_offset = np.arange(n_bosses)*SIM_BINS
+
+    total = np.zeros(n_bosses)
+    total_sq = np.zeros(n_bosses)
+    hist = np.zeros(n_bosses*SIM_BINS,dtype=np.int64)
+    done = 0
+    while done < n_lockouts:
+        n = min(SIM_CHUNK,n_lockouts - done)
+        dropped = rng.random((n,len(drop_chance)),dtype=np.float32) < drop_chance
+        realized = (dropped.astype(np.float32) @ drop_map).astype(np.float64) # lockout x boss
+        total += realized.sum(axis=0)
+        total_sq += (realized**2).sum(axis=0)
+        bins = np.minimum((realized*bin_scale).astype(np.int64),SIM_BINS - 1) + bin_offset
+        hist += np.bincount(bins.ravel(),minlength=n_bosses*SIM_BINS)
+        done += n
+
+    return(total,total_sq,hist)
+
+if __name__ == "__main__":
+    # run as script, same as bpc_cli
+    import bpc_cli
+    sys.exit(bpc_cli.main())
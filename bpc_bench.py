@@ -0,0 +1,151 @@
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import boss_priority_calc as bpc_engine
+from boss_priority_calc import Slot, Raid, RaidToBossMap
+
+BENCH_SIZES = [(32,338),(320,3380),(1000,10000),(3000,30000),(10000,100000)] # (characters, items), first is today's raid and loot_db
+BENCH_ENGINES = ["loop","numpy"]
+BENCH_TIMEOUT_S = 600 # max seconds per (size, engine) case before it is reported as timed out
+# loop engine does ~2M evaluations per s, larger cases (10000x100000 is 1.1e9) are reported as skipped instead of run
+BENCH_LOOP_MAX_EVALS = 200000000
+
+# map from addChar gear argument to slot, finger and trinket get two items
+GEAR_ARGS = [("head",Slot.HEAD),("neck",Slot.NECK),("shoulder",Slot.SHOULDER),("chest",Slot.CHEST),("waist",Slot.WAIST),("legs",Slot.LEGS),
+    ("feet",Slot.FEET),("wrist",Slot.WRISTS),("hands",Slot.HANDS),("fingers",Slot.FINGER),("trinkets",Slot.TRINKET),("back",Slot.BACK),
+    ("mh",Slot.MAIN_HAND),("oh",Slot.OFF_HAND),("th",Slot.TWO_HAND),("ranged",Slot.RANGED)]
+
+def makeSynthetic(n_chars,n_items,seed=0):
+    # build BossPrioCalc with the real bosses, n_items random loot and n_chars random characters
+    # every character wears CURRENT items and owns a few random raid drops so all engine paths are exercised
+    rng = np.random.default_rng(seed)
+    bpc = bpc_engine.BossPrioCalc()
+    for raid in range(Raid.SIZE):
+        for boss_name in RaidToBossMap[raid]:
+            bpc.addBoss(boss_name,Raid(raid),float(rng.uniform(5,20)))
+    boss_names = list(bpc.bosses)
+    # specs without BiS ep cannot be normalized
+    specs = [spec_class for spec_class in bpc.ep_bis if bpc.ep_bis[spec_class] > 0]
+    slots = [slot for arg , slot in GEAR_ARGS]
+
+    def randomEP():
+        n_specs = int(rng.integers(1,4))
+        return({specs[i]:int(rng.integers(10,150)) for i in rng.choice(len(specs),n_specs,replace=False)})
+
+    # CURRENT items first so worn gear gets low ids, worn items need ep for every spec
+    current = {}
+    for slot in slots:
+        current[slot] = []
+        for i in range(4):
+            loot_name = "Current {} {}".format(slot.name,i)
+            bpc.addLoot(["CURRENT"],loot_name,slot,[100],{spec_class:int(rng.integers(10,100)) for spec_class in specs})
+            current[slot].append(loot_name)
+
+    # ZG enchants are counted, not worn, and looked up by name like in the real loot_db
+    bpc.addLoot(["Jin'do the Hexxer","Bloodlord Mandokir"],"Primal Hakkari Idol",Slot.ZG_ENCHANTS,[100.0,100.0],randomEP())
+
+    spec_loot = {spec_class:[] for spec_class in specs} # map from SpecClass to raid loot names with ep for it
+    for i in range(n_items - len(slots)*4 - 1):
+        loot_name = "Item {}".format(i)
+        n_bosses = 1 if rng.random() < 0.9 else 2
+        boss_list = [boss_names[b] for b in rng.choice(len(boss_names),n_bosses,replace=False)]
+        drop_chance_list = [float(rng.uniform(5,25)) for boss in boss_list]
+        ep_map = randomEP()
+        bpc.addLoot(boss_list,loot_name,slots[int(rng.integers(len(slots)))],drop_chance_list,ep_map)
+        for spec_class in ep_map:
+            spec_loot[spec_class].append(loot_name)
+
+    for c in range(n_chars):
+        spec_class = specs[int(rng.integers(len(specs)))]
+        char_args = {}
+        for arg , slot in GEAR_ARGS:
+            n_worn = 2 if slot == Slot.FINGER or slot == Slot.TRINKET else 1
+            char_args[arg] = [current[slot][i] for i in rng.choice(4,n_worn,replace=False)]
+        # owned raid drops with ep for the spec, added to the gear list of their slot
+        for i in rng.choice(len(spec_loot[spec_class]),min(3,len(spec_loot[spec_class])),replace=False):
+            loot = bpc.loot_db[spec_loot[spec_class][i]]
+            arg = [arg for arg , slot in GEAR_ARGS if slot == loot.slot][0]
+            char_args[arg] = char_args[arg] + [loot.name]
+        bpc.addChar("Char {}".format(c),spec_class,zg_enchants=int(rng.integers(0,3)),**char_args)
+
+    return(bpc)
+
+def countEvaluations(bpc):
+    # character-boss-item evaluations of one calc, every character against every loot table entry of every boss
+    return(len(bpc.raid)*sum(len(boss.loot_table) for boss in bpc.bosses.values()))
+
+def runCase(n_chars,n_items,engine,contention=True,repeat=3,seed=0,loop_max_evals=BENCH_LOOP_MAX_EVALS):
+    # time building synthetic data and calc in this process, returns result map
+    # peak_rss_mb is the peak of the whole process so run each case in a fresh interpreter (see runBench)
+    start = time.perf_counter()
+    bpc = makeSynthetic(n_chars,n_items,seed)
+    build_s = time.perf_counter() - start
+    evals = countEvaluations(bpc)
+    if engine == "loop" and evals > loop_max_evals:
+        return({"chars":n_chars,"items":n_items,"engine":engine,"contention":contention,"evaluations":evals,
+            "error":"skipped, {} evaluations over loop limit {}".format(evals,loop_max_evals)})
+
+    calc_s = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        bpc.calc(engine=engine,contention=contention)
+        calc_s.append(time.perf_counter() - start)
+
+    return({
+        "chars":n_chars,
+        "items":n_items,
+        "bosses":len(bpc.bosses),
+        "engine":engine,
+        "contention":contention,
+        "evaluations":evals,
+        "build_s":build_s,
+        "calc_s":min(calc_s),
+        "evals_per_s":evals/min(calc_s),
+        "peak_rss_mb":resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024, # kB on linux
+    })
+
+def runBench(sizes=BENCH_SIZES,engines=BENCH_ENGINES,contention=True,repeat=3,seed=0,timeout=BENCH_TIMEOUT_S,loop_max_evals=BENCH_LOOP_MAX_EVALS):
+    # run every (size, engine) case in its own interpreter so peak memory is per case, yields result maps
+    # failed, skipped and timed out cases are reported with an error instead of stopping the suite
+    for n_chars , n_items in sizes:
+        for engine in engines:
+            args = json.dumps([n_chars,n_items,engine,contention,repeat,seed,loop_max_evals])
+            code = "import json,sys,bpc_bench; json.dump(bpc_bench.runCase(*json.loads(sys.argv[1])),sys.stdout)"
+            case = {"chars":n_chars,"items":n_items,"engine":engine,"contention":contention}
+            try:
+                proc = subprocess.run([sys.executable,"-c",code,args],cwd=os.path.dirname(os.path.abspath(__file__)),
+                    capture_output=True,text=True,timeout=timeout)
+            except subprocess.TimeoutExpired:
+                case["error"] = "timeout after {} s".format(timeout)
+                yield case
+                continue
+            if proc.returncode != 0:
+                lines = proc.stderr.strip().splitlines()
+                case["error"] = lines[-1] if len(lines) > 0 else "exit code {}".format(proc.returncode)
+                yield case
+                continue
+            yield json.loads(proc.stdout)
+
+def benchInfo():
+    # environment of a bench run so results of different versions and machines can be told apart
+    info = {
+        "python":platform.python_version(),
+        "numpy":np.__version__,
+        "machine":platform.machine(),
+        "cpus":os.cpu_count(),
+        "commit":None,
+    }
+    try:
+        proc = subprocess.run(["git","rev-parse","--short","HEAD"],cwd=os.path.dirname(os.path.abspath(__file__)),capture_output=True,text=True)
+        if proc.returncode == 0:
+            info["commit"] = proc.stdout.strip()
+    except OSError:
+        pass
+    return(info)
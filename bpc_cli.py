@@ -0,0 +1,313 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import boss_priority_calc as bpc_engine
+import bpc_bench
+
+IMPORT_BUDGET_S = 0.3 # max seconds importing the engine may add to interpreter startup
+
+def _loadCalc(args):
+    # load BossPrioCalc from data files given on command line and run calc
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    cache = None if args.no_result_cache else bpc_engine.ResultCache()
+    bpc.calc(engine=args.engine,contention=not args.no_contention,cache=cache)
+    return(bpc)
+
+def _cmdCalc(args):
+    # print bosses sorted by mean_enupm
+    bpc = _loadCalc(args)
+    bosses = sorted(bpc.bosses.values(),key=lambda boss: boss.mean_enupm,reverse=True)
+    print("{:<28} {:<5} {:>10} {:>10}".format("Boss","Raid","mean_enu","mean_enupm"))
+    for boss in bosses:
+        print("{:<28} {:<5} {:>10.4f} {:>10.5f}".format(boss.name,boss.raid.name,boss.mean_enu,boss.mean_enupm))
+    return(0)
+
+def _cmdSchedule(args):
+    # print kill order and stopping point for one raid or best route over all raids within time budget
+    bpc = _loadCalc(args)
+    if args.raid is None:
+        boss_names , mean_enu , clear_time = bpc.optimizeRoute(args.budget)
+    else:
+        boss_names , mean_enu , clear_time = bpc.scheduleRaid(bpc_engine.Raid[args.raid],time_budget=args.budget,min_enupm=args.min_enupm)
+    for boss_name in boss_names:
+        boss = bpc.bosses[boss_name]
+        print("{:<28} {:<5} {:>6.1f} min {:>10.5f}".format(boss_name,boss.raid.name,boss.clear_time,boss.mean_enupm))
+    print("total mean_enu {:.4f} in {:.1f} min".format(mean_enu,clear_time))
+    return(0)
+
+def _cmdPlan(args):
+    # print raids and bosses to run each week within weekly raid hours
+    bpc = _loadCalc(args)
+    plan , total = bpc.planLockouts(args.hours,n_weeks=args.weeks)
+    for week , (runs , mean_enu , clear_time) in enumerate(plan):
+        print("week {}: mean_enu {:.4f} in {:.1f} h".format(week + 1,mean_enu,clear_time/60))
+        for raid , start , boss_names in runs:
+            print("    {:<5} lockout from day {:>3}: {}".format(raid.name,start,", ".join(boss_names)))
+    print("total mean_enu {:.4f}".format(total))
+    return(0)
+
+def _roleBounds(bounds):
+    # parse ROLE=N arguments to map from Role to count
+    role_bounds = {}
+    for bound in bounds:
+        role_name , n = bound.split("=")
+        role_bounds[bpc_engine.Role[role_name.upper()]] = int(n)
+    return(role_bounds)
+
+def _cmdRoster(args):
+    # print best raid of size characters picked from the roster file used as bench
+    bpc = _loadCalc(args)
+    char_names , mean_enu = bpc.selectRoster(size=args.size,boss_names=args.boss,role_min=_roleBounds(args.role_min),role_max=_roleBounds(args.role_max),fixed=args.fixed)
+    for char_name in char_names:
+        char = bpc.raid[char_name]
+        print("{:<16} {:<20} {:<7}".format(char_name,char.spec_class.name,bpc_engine.SpecToRole[char.spec_class].name))
+    print("{} of {} characters, mean_enu {:.4f}".format(len(char_names),len(bpc.raid),mean_enu))
+    return(0)
+
+def _cmdPlot(args):
+    # plot mean_enupm per boss to window or file
+    bpc = _loadCalc(args)
+    bpc.plot(path=args.output)
+    return(0)
+
+def _cmdExport(args):
+    # write memory-mappable loot database snapshot
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    bpc.exportSnapshot(args.path)
+    print("wrote snapshot of {} items and {} bosses to {}".format(len(bpc.loot_db),len(bpc.bosses),args.path))
+    return(0)
+
+def _cmdAssign(args):
+    # print optimal assignment of the items dropped by one boss kill
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    char_names = [char_name for char_name in bpc.raid if char_name not in args.absent]
+    assignment , total = bpc.assignLoot(args.boss,drops=args.item,char_names=char_names,max_items=args.max_items)
+    print("{:<40} {:<16} {:>8}".format("Item","Character","upgrade"))
+    for loot_name , char_name , upgrade in assignment:
+        print("{:<40} {:<16} {:>8.3f}".format(loot_name,char_name or "-",upgrade))
+    print("{:<40} {:<16} {:>8.3f}".format("total","",total))
+    return(0)
+
+def _cmdSession(args):
+    # read raid night events from stdin and print remaining boss priority after each
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    session = bpc_engine.RaidSession(bpc,log_path=args.log,contention=not args.no_contention)
+    print("commands: kill <boss name> | loot <character> <item name> | prio | quit")
+    priority = session.priority()
+    for line in sys.stdin:
+        words = line.split()
+        if len(words) == 0:
+            continue
+        try:
+            if words[0] == "kill":
+                priority = session.killBoss(" ".join(words[1:]))
+            elif words[0] == "loot" and len(words) >= 3:
+                priority = session.giveLoot(words[1]," ".join(words[2:]))
+            elif words[0] == "quit":
+                break
+            elif words[0] != "prio":
+                print("unknown command: {}".format(line.strip()))
+                continue
+        except RuntimeError:
+            # message already printed, session is unchanged
+            continue
+        for boss_name , mean_enupm in priority[:args.top]:
+            print("{:<28} {:>10.5f}".format(boss_name,mean_enupm))
+    return(0)
+
+def _cmdTable(args):
+    # write per (boss, character, item) upgrade rows and per boss rows as columnar table
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    bpc.exportTable(args.path,contention=not args.no_contention)
+    print("wrote upgrade table to {}".format(args.path))
+    return(0)
+
+def _cmdSimulate(args):
+    # print Monte Carlo spread of realized upgrade per boss
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    sim = bpc.simulate(args.lockouts,n_workers=args.workers,seed=args.seed)
+    print("{:<28} {:>10} {:>10} {:>10} {:>10} {:>10}".format("Boss","mean","std","p5","p50","p95"))
+    for boss_name in sorted(sim,key=lambda boss_name: sim[boss_name]["mean"],reverse=True):
+        stats = sim[boss_name]
+        print("{:<28} {:>10.4f} {:>10.4f} {:>10.4f} {:>10.4f} {:>10.4f}".format(boss_name,stats["mean"],stats["std"],stats["p5"],stats["p50"],stats["p95"]))
+    return(0)
+
+def measureImport(repeat=5):
+    # median seconds importing the engine adds to a bare interpreter, each run in a fresh process
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable,"-c",code],check=True,cwd=os.path.dirname(os.path.abspath(bpc_engine.__file__)))
+        return(time.perf_counter() - start)
+
+    base = statistics.median([run("pass") for i in range(repeat)])
+    total = statistics.median([run("import boss_priority_calc") for i in range(repeat)])
+    return(total - base)
+
+def _cmdStartup(args):
+    # measure engine import time in fresh interpreters, fail when median is over budget
+    import_s = measureImport(args.repeat)
+    print("engine import: {:.3f} s (budget {:.3f} s)".format(import_s,args.budget))
+    if import_s > args.budget:
+        print("engine import is over budget")
+        return(1)
+    return(0)
+
+def _cmdBatch(args):
+    # calc every roster file against the shared loot database, print one json line per roster as it finishes
+    bpc_engine.verbose = args.verbose
+    bpc = bpc_engine.loadBossPrioCalc(data_dir=args.data_dir,roster_path=args.roster,use_cache=not args.no_cache)
+    n_failed = 0
+    for i , result in bpc.evaluateRosters(args.rosters,n_workers=args.workers,contention=not args.no_contention):
+        roster_path = args.rosters[i]
+        if "error" in result:
+            n_failed += 1
+            print(json.dumps({"roster":roster_path,"error":result["error"]}),flush=True)
+            continue
+        bosses = {boss_name:{"mean_enu":mean_enu,"mean_enupm":mean_enupm} for boss_name , (mean_enu , mean_enupm) in result.items()}
+        print(json.dumps({"roster":roster_path,"bosses":bosses}),flush=True)
+    return(1 if n_failed > 0 else 0)
+
+def _cmdBench(args):
+    # run synthetic scaling benchmark, print one json result per case and write full report
+    sizes = [tuple(int(n) for n in size.split("x")) for size in args.sizes.split(",")]
+    report = {"info":bpc_bench.benchInfo(),"results":[]}
+    for result in bpc_bench.runBench(sizes=sizes,engines=args.engine or bpc_bench.BENCH_ENGINES,contention=not args.no_contention,repeat=args.repeat,seed=args.seed,timeout=args.timeout,
+            loop_max_evals=args.loop_max_evals):
+        print(json.dumps(result),flush=True)
+        report["results"].append(result)
+    if args.output is not None:
+        with open(args.output,"w") as f:
+            json.dump(report,f,indent=4)
+    return(0)
+
+def _parser():
+    # build command line parser
+    data = argparse.ArgumentParser(add_help=False)
+    data.add_argument("--data-dir",default=bpc_engine.DATA_DIR,help="directory with bosses.json, loot.json and roster.json")
+    data.add_argument("--roster",default=None,help="roster json file (default: roster.json in data dir)")
+    data.add_argument("--no-cache",action="store_true",help="do not read or write the compiled data cache")
+    data.add_argument("--verbose",action="store_true",help="print every upgrade found")
+    data.add_argument("--profile",action="store_true",help="print wall time and call count per calculation phase")
+    data.add_argument("--trace",default=None,help="write per call timing as Chrome trace json to file")
+
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument("--engine",choices=["loop","numpy"],default="loop",help="calculation engine")
+    engine.add_argument("--no-contention",action="store_true",help="credit every drop to every character instead of its best recipient")
+    engine.add_argument("--no-result-cache",action="store_true",help="always recalculate instead of reusing results of identical inputs")
+
+    parser = argparse.ArgumentParser(prog="boss_priority_calc",description="Calculate the average upgrade for a raid from each boss.")
+    commands = parser.add_subparsers(dest="command")
+
+    cmd = commands.add_parser("calc",parents=[data,engine],help="print bosses ranked by mean_enupm")
+    cmd.set_defaults(func=_cmdCalc)
+
+    cmd = commands.add_parser("schedule",parents=[data,engine],help="kill order and stopping point respecting boss dependencies")
+    cmd.add_argument("--raid",choices=[raid.name for raid in bpc_engine.Raid if raid != bpc_engine.Raid.SIZE],default=None,help="schedule one raid (default: best route over all raids)")
+    cmd.add_argument("--budget",type=float,default=math.inf,help="minutes available")
+    cmd.add_argument("--min-enupm",type=float,default=0.0,help="stop one raid when further kills give less mean_enu per minute")
+    cmd.set_defaults(func=_cmdSchedule)
+
+    cmd = commands.add_parser("plan",parents=[data,engine],help="raids and bosses to run each week within weekly raid hours")
+    cmd.add_argument("--hours",type=float,required=True,help="raid hours per week")
+    cmd.add_argument("--weeks",type=int,default=4,help="weeks to plan")
+    cmd.set_defaults(func=_cmdPlan)
+
+    cmd = commands.add_parser("roster",parents=[data,engine],help="pick the raid from a larger bench under role bounds")
+    cmd.add_argument("--size",type=int,default=40,help="raid spots")
+    cmd.add_argument("--role-min",action="append",default=[],help="ROLE=N minimum characters of role (TANK, HEALER, MELEE, RANGED), repeat for several")
+    cmd.add_argument("--role-max",action="append",default=[],help="ROLE=N maximum characters of role, repeat for several")
+    cmd.add_argument("--fixed",action="append",default=[],help="character always picked, repeat for several")
+    cmd.add_argument("--boss",action="append",default=None,help="planned boss, repeat for several (default: all bosses)")
+    cmd.set_defaults(func=_cmdRoster)
+
+    cmd = commands.add_parser("plot",parents=[data,engine],help="plot mean_enupm per boss")
+    cmd.add_argument("-o","--output",default=None,help="write plot to file (png, svg, ...) instead of showing it")
+    cmd.set_defaults(func=_cmdPlot)
+
+    cmd = commands.add_parser("export",parents=[data],help="write loot database snapshot arrays")
+    cmd.add_argument("path",help="snapshot directory")
+    cmd.set_defaults(func=_cmdExport)
+
+    cmd = commands.add_parser("assign",parents=[data],help="assign the items of one boss kill to raiders for the biggest total upgrade")
+    cmd.add_argument("boss",help="boss name")
+    cmd.add_argument("--item",action="append",default=None,help="dropped item, repeat for several (default: whole loot table)")
+    cmd.add_argument("--absent",action="append",default=[],help="character not present, repeat for several")
+    cmd.add_argument("--max-items",type=int,default=1,help="items per character per kill")
+    cmd.set_defaults(func=_cmdAssign)
+
+    cmd = commands.add_parser("session",parents=[data],help="live raid night: read kill/loot events from stdin and re-rank remaining bosses")
+    cmd.add_argument("--log",default=None,help="json lines event log, replayed on start and appended to")
+    cmd.add_argument("--top",type=int,default=5,help="bosses to print after each event")
+    cmd.add_argument("--no-contention",action="store_true",help="credit every drop to every character instead of its best recipient")
+    cmd.set_defaults(func=_cmdSession)
+
+    cmd = commands.add_parser("table",parents=[data],help="write upgrade results as csv, parquet or arrow table")
+    cmd.add_argument("path",help="output file, format from extension (.csv, .parquet, .arrow)")
+    cmd.add_argument("--no-contention",action="store_true",help="credit every drop to every character instead of its best recipient")
+    cmd.set_defaults(func=_cmdTable)
+
+    cmd = commands.add_parser("simulate",parents=[data],help="Monte Carlo spread of realized upgrade per boss")
+    cmd.add_argument("-n","--lockouts",type=int,default=100000,help="number of simulated lockouts")
+    cmd.add_argument("-w","--workers",type=int,default=None,help="worker processes (default: one per core)")
+    cmd.add_argument("--seed",type=int,default=0,help="random seed")
+    cmd.set_defaults(func=_cmdSimulate)
+
+    cmd = commands.add_parser("batch",parents=[data],help="calc many roster files in a process pool, one json line per roster")
+    cmd.add_argument("rosters",nargs="+",help="roster json files")
+    cmd.add_argument("-w","--workers",type=int,default=None,help="worker processes (default: one per core)")
+    cmd.add_argument("--no-contention",action="store_true",help="credit every drop to every character instead of its best recipient")
+    cmd.set_defaults(func=_cmdBatch)
+
+    cmd = commands.add_parser("bench",help="time calc on synthetic rosters and loot tables of growing size")
+    cmd.add_argument("--sizes",default=",".join("{}x{}".format(*size) for size in bpc_bench.BENCH_SIZES),help="comma separated CHARSxITEMS cases")
+    cmd.add_argument("--engine",action="append",choices=["loop","numpy"],default=None,help="engine to time, repeat for several (default: all)")
+    cmd.add_argument("--no-contention",action="store_true",help="credit every drop to every character instead of its best recipient")
+    cmd.add_argument("--repeat",type=int,default=3,help="calc runs per case, fastest is reported")
+    cmd.add_argument("--seed",type=int,default=0,help="random seed of synthetic data")
+    cmd.add_argument("--timeout",type=float,default=bpc_bench.BENCH_TIMEOUT_S,help="seconds per case before it is reported as timed out")
+    cmd.add_argument("--loop-max-evals",type=int,default=bpc_bench.BENCH_LOOP_MAX_EVALS,help="skip loop engine cases with more evaluations")
+    cmd.add_argument("-o","--output",default=None,help="write json report with environment info to file")
+    cmd.set_defaults(func=_cmdBench)
+
+    cmd = commands.add_parser("startup",help="check engine import time against budget")
+    cmd.add_argument("--budget",type=float,default=IMPORT_BUDGET_S,help="budget in seconds")
+    cmd.add_argument("--repeat",type=int,default=5,help="interpreter runs to take the median of")
+    cmd.set_defaults(func=_cmdStartup)
+
+    return(parser)
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        # no command keeps the original script behavior: verbose calc and plot window
+        args = parser.parse_args(["plot","--verbose"])
+
+    profiler = None
+    if getattr(args,"profile",False) or getattr(args,"trace",None) is not None:
+        profiler = bpc_engine.enableProfiling(trace=args.trace is not None)
+    try:
+        ret = args.func(args)
+    finally:
+        if profiler is not None:
+            bpc_engine.disableProfiling()
+    if profiler is not None:
+        if args.profile:
+            print(profiler.summary(),file=sys.stderr)
+        if args.trace is not None:
+            profiler.writeTrace(args.trace)
+    return(ret)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+import os
+import sys
+
+# modules live in the repository root, not in an installed package
+sys.path.insert(0,os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import boss_priority_calc as bpc_engine
+
+@pytest.fixture
+def bpc():
+    # fresh BossPrioCalc from the data files, never shared through the load cache
+    return(bpc_engine.loadBossPrioCalc(use_cache=False))
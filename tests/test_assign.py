@@ -0,0 +1,57 @@
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+import boss_priority_calc as bpc_engine
+
+def test_solve_assignment_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for n_rows , n_cols in [(1,1),(2,3),(3,3),(4,6),(5,5),(5,7)]:
+        for trial in range(10):
+            cost = rng.integers(-5,5,(n_rows,n_cols)).astype(float)
+            cols = bpc_engine._solveAssignment(cost)
+            assert len(set(cols.tolist())) == n_rows
+            best = min(sum(cost[i,perm[i]] for i in range(n_rows)) for perm in itertools.permutations(range(n_cols),n_rows))
+            assert cost[np.arange(n_rows),cols].sum() == pytest.approx(best)
+
+def test_assign_loot_matches_brute_force(bpc):
+    bpc.calc()
+    boss_name = max(bpc.bosses,key=lambda boss_name: len(bpc.bosses[boss_name].loot_table))
+    drops = list(bpc.bosses[boss_name].loot_table)[:5]
+    # raiders with most upgrades from the boss so items compete
+    char_names = sorted(bpc.raid,key=lambda char_name: len(bpc._upgrades[boss_name][char_name]),reverse=True)[:4]
+    caps = {char_names[0]:2}
+    assignment , total = bpc.assignLoot(boss_name,drops,char_names,caps=caps)
+
+    value = {}
+    for char_name in char_names:
+        for loot_name , char_name_best , upgrade in bpc.assignLoot(boss_name,drops,[char_name],max_items=len(drops))[0]:
+            value[(loot_name,char_name)] = upgrade
+    best = 0.0
+    for owners in itertools.product([None] + char_names,repeat=len(drops)):
+        if any(owners.count(char_name) > caps.get(char_name,1) for char_name in char_names):
+            continue
+        best = max(best,sum(value[(loot_name,char_name)] for loot_name , char_name in zip(drops,owners) if char_name is not None))
+    assert total == pytest.approx(best)
+    assert total == pytest.approx(sum(upgrade for loot_name , char_name , upgrade in assignment))
+
+def test_assign_loot_full_raid_is_fast(bpc):
+    bpc.calc()
+    boss_name = max(bpc.bosses,key=lambda boss_name: len(bpc.bosses[boss_name].loot_table))
+    times = []
+    for i in range(5):
+        start = time.perf_counter()
+        bpc.assignLoot(boss_name)
+        times.append(time.perf_counter() - start)
+    assert min(times) < 0.01
+
+def test_assign_loot_with_zero_drop_chance(bpc):
+    bpc.calc()
+    boss_name = "Nefarian"
+    assignment , total = bpc.assignLoot(boss_name)
+    loot_name , char_name , upgrade = next(entry for entry in assignment if entry[1] is not None)
+    # item that did drop is still assignable after its chance is set to 0
+    bpc.setLootDropChance(loot_name,[boss_name],[0.0])
+    assert bpc.assignLoot(boss_name,[loot_name])[0] == [(loot_name,char_name,pytest.approx(upgrade))]
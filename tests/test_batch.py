@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_batch_stdout_is_json_lines(tmp_path):
+    with open(os.path.join(ROOT,"data","roster.json")) as f:
+        roster = json.load(f)
+    bad = [dict(char) for char in roster]
+    bad[0]["head"] = ["Not An Item"]
+    # missing gear field, addChar raises TypeError
+    missing = [dict(char) for char in roster]
+    del missing[0]["ranged"]
+    bad_path = str(tmp_path/"bad.json")
+    missing_path = str(tmp_path/"missing.json")
+    good_path = str(tmp_path/"good.json")
+    with open(bad_path,"w") as f:
+        json.dump(bad,f)
+    with open(missing_path,"w") as f:
+        json.dump(missing,f)
+    with open(good_path,"w") as f:
+        json.dump(roster,f)
+
+    proc = subprocess.run([sys.executable,"bpc_cli.py","batch","--no-cache","--workers","1",bad_path,missing_path,good_path],
+        capture_output=True,text=True,cwd=ROOT)
+    results = {}
+    for line in proc.stdout.splitlines():
+        result = json.loads(line)
+        results[result["roster"]] = result
+    assert proc.returncode == 1
+    assert "items not in loot_db" in results[bad_path]["error"]
+    assert results[missing_path]["error"].startswith("TypeError")
+    assert "bosses" in results[good_path]
@@ -0,0 +1,11 @@
+import bpc_bench
+
+def test_run_case_reports_throughput():
+    result = bpc_bench.runCase(32,338,"numpy",repeat=1)
+    assert result["evaluations"] > 0
+    assert result["evals_per_s"] > 0
+
+def test_run_case_skips_large_loop_case():
+    result = bpc_bench.runCase(32,338,"loop",repeat=1,loop_max_evals=1)
+    assert "error" in result
+    assert "calc_s" not in result
@@ -0,0 +1,29 @@
+import pytest
+
+import boss_priority_calc as bpc_engine
+
+def test_result_key_changes_with_inputs(bpc):
+    keys = [bpc.resultKey()]
+    assert bpc.resultKey() == keys[0]
+    assert bpc.resultKey(contention=False) != keys[0]
+    loot_name = next(loot_name for loot_name in bpc.loot_db if len(bpc.loot_bosses[loot_name]) > 0)
+    loot = bpc.loot_db[loot_name]
+    bpc.setLootEP(loot_name,{spec_class:ep + 1 for spec_class , ep in enumerate(loot.ep_map) if ep != 0})
+    keys.append(bpc.resultKey())
+    bpc.setLootDropChance(loot_name,[bpc.loot_bosses[loot_name][0]],[1.5])
+    keys.append(bpc.resultKey())
+    bpc.setGear("Milku",bpc_engine.Slot.HEAD,[loot_name])
+    keys.append(bpc.resultKey())
+    bpc.equipItem("Milku","Primal Hakkari Idol")
+    keys.append(bpc.resultKey())
+    assert len(set(keys)) == len(keys)
+
+def test_result_cache_misses_after_edit(bpc,tmp_path):
+    cache = bpc_engine.ResultCache(str(tmp_path))
+    bpc.calc(cache=cache)
+    loot_name = next(loot_name for loot_name in bpc.loot_db if len(bpc.loot_bosses[loot_name]) > 0)
+    bpc.setLootDropChance(loot_name,[bpc.loot_bosses[loot_name][0]],[0.0])
+    assert cache.get(bpc.resultKey()) is None
+    cached = {boss_name:boss.mean_enu for boss_name , boss in bpc.calc(cache=cache).items()}
+    fresh = {boss_name:boss.mean_enu for boss_name , boss in bpc.calc().items()}
+    assert cached == pytest.approx(fresh)
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+import boss_priority_calc as bpc_engine
+from boss_priority_calc import Slot, SpecClass
+
+def bossResults(bpc):
+    return({boss_name:(boss.mean_enu,boss.mean_enupm,dict(boss.enu)) for boss_name , boss in bpc.bosses.items()})
+
+@pytest.mark.parametrize("contention",[True,False])
+def test_numpy_matches_loop(bpc,contention):
+    bpc.calc(engine="loop",contention=contention)
+    loop = bossResults(bpc)
+    bpc.calc(engine="numpy",contention=contention)
+    numpy = bossResults(bpc)
+    for boss_name in loop:
+        assert numpy[boss_name][0] == pytest.approx(loop[boss_name][0],abs=1e-12)
+        assert numpy[boss_name][1] == pytest.approx(loop[boss_name][1],abs=1e-12)
+        for char_name in loop[boss_name][2]:
+            assert numpy[boss_name][2][char_name] == pytest.approx(loop[boss_name][2][char_name],abs=1e-12)
+
+def test_some_boss_has_upgrades(bpc):
+    bpc.calc()
+    assert max(boss.mean_enu for boss in bpc.bosses.values()) > 0
+
+def test_owned_items_are_not_upgrades(bpc):
+    bpc.calc(engine="loop")
+    for boss_name , upgrades in bpc._upgrades.items():
+        for char_name , upgrade in upgrades.items():
+            char = bpc.raid[char_name]
+            for loot_id in upgrade:
+                assert loot_id not in char.gear_set[bpc.loot_by_id[loot_id].slot]
+
+def test_equipped_upgrade_is_dropped(bpc):
+    bpc.calc(engine="loop")
+    boss_name , char_name , loot_id = next((boss_name,char_name,loot_id) for boss_name , upgrades in bpc._upgrades.items()
+        for char_name , upgrade in upgrades.items() for loot_id in upgrade if bpc.loot_by_id[loot_id].slot != Slot.ZG_ENCHANTS)
+    bpc.equipItem(char_name,bpc.loot_by_id[loot_id].name)
+    bpc.calc(engine="loop")
+    assert loot_id not in bpc._upgrades[boss_name][char_name]
+
+@pytest.mark.parametrize("engine",["loop","numpy"])
+@pytest.mark.parametrize("slot",[Slot.FINGER,Slot.HEAD])
+def test_worn_zero_ep_item_raises(bpc,engine,slot):
+    char = bpc.raid["Milku"]
+    loot_name = next(loot_name for loot_name , loot in bpc.loot_db.items() if loot.slot == slot and loot.ep_map[char.spec_class] == 0)
+    # worst of two rings is replaced, so one 0 ep ring is enough, other slots keep the best item
+    items = [loot_name] + char.gear[slot][:1] if slot == Slot.FINGER else [loot_name]
+    bpc.setGear("Milku",slot,items)
+    with pytest.raises(RuntimeError):
+        bpc.calc(engine=engine)
+
+def test_numpy_blocks_match_single_block(bpc,monkeypatch):
+    bpc.calc(engine="numpy")
+    single = bossResults(bpc)
+    # a few items per block
+    monkeypatch.setattr(bpc_engine,"NUMPY_BLOCK_CELLS",7*len(bpc.raid))
+    bpc.calc(engine="numpy")
+    blocked = bossResults(bpc)
+    for boss_name in single:
+        assert blocked[boss_name][0] == pytest.approx(single[boss_name][0],abs=1e-12)
+        for char_name in single[boss_name][2]:
+            assert blocked[boss_name][2][char_name] == pytest.approx(single[boss_name][2][char_name],abs=1e-12)
+
+def assertRecalcMatchesCalc(bpc,contention):
+    bpc.recalc()
+    incremental = bossResults(bpc)
+    bpc.calc(engine="loop",contention=contention)
+    full = bossResults(bpc)
+    for boss_name in full:
+        assert incremental[boss_name][0] == pytest.approx(full[boss_name][0],abs=1e-9)
+        assert incremental[boss_name][1] == pytest.approx(full[boss_name][1],abs=1e-9)
+        for char_name in full[boss_name][2]:
+            assert incremental[boss_name][2][char_name] == pytest.approx(full[boss_name][2][char_name],abs=1e-9)
+
+@pytest.mark.parametrize("contention",[True,False])
+def test_recalc_after_loot_edits_matches_calc(bpc,contention):
+    rng = np.random.default_rng(0)
+    bpc.calc(engine="loop",contention=contention)
+    loot_names = [loot_name for loot_name in bpc.loot_db if len(bpc.loot_bosses[loot_name]) > 0]
+    boss_names = list(bpc.bosses)
+    for edit in range(40):
+        loot = bpc.loot_db[loot_names[int(rng.integers(len(loot_names)))]]
+        if rng.random() < 0.5:
+            # new ep for the specs that already value the item, so worn items stay above 0 ep
+            ep_map = {spec_class:int(rng.integers(1,150)) for spec_class in range(SpecClass.SIZE) if loot.ep_map[spec_class] != 0}
+            bpc.setLootEP(loot.name,ep_map)
+        else:
+            # chance from a boss that already drops it or a new one, 0 included
+            boss_list = [bpc.loot_bosses[loot.name][0],boss_names[int(rng.integers(len(boss_names)))]]
+            bpc.setLootDropChance(loot.name,boss_list,[float(rng.choice([0.0,rng.uniform(1,30)])) for boss in boss_list])
+        if edit % 5 == 4:
+            assertRecalcMatchesCalc(bpc,contention)
+
+def test_drop_chance_of_current_item_is_ignored(bpc):
+    bpc.calc()
+    loot_name = next(loot_name for loot_name in bpc.loot_db if len(bpc.loot_bosses[loot_name]) > 0)
+    boss_name = bpc.loot_bosses[loot_name][0]
+    bpc.setLootDropChance(loot_name,["CURRENT",boss_name],[100.0,5.0])
+    assert bpc.loot_bosses[loot_name] == [boss_name]
+    assert bpc.bosses[boss_name].loot_drop_chance[loot_name] == 5.0
+    assertRecalcMatchesCalc(bpc,True)
+
+@pytest.mark.parametrize("contention",[True,False])
+def test_recalc_after_gear_edits_matches_calc(bpc,contention):
+    rng = np.random.default_rng(1)
+    bpc.calc(engine="loop",contention=contention)
+    char_names = list(bpc.raid)
+    for edit in range(40):
+        char_name = char_names[int(rng.integers(len(char_names)))]
+        spec_class = bpc.raid[char_name].spec_class
+        # only items worth ep for the spec, worn items at 0 ep are rejected by calc
+        loot_names = [loot_name for loot_name , loot in bpc.loot_db.items() if loot.ep_map[spec_class] != 0]
+        loot = bpc.loot_db[loot_names[int(rng.integers(len(loot_names)))]]
+        if loot.slot == Slot.ZG_ENCHANTS or rng.random() < 0.5:
+            bpc.equipItem(char_name,loot.name)
+        else:
+            bpc.setGear(char_name,loot.slot,[loot.name])
+        assert char_name in bpc._dirty
+        if edit % 5 == 4:
+            bpc.recalc()
+            assert len(bpc._dirty) == 0
+            assertRecalcMatchesCalc(bpc,contention)
@@ -0,0 +1,14 @@
+import boss_priority_calc as bpc_engine
+
+def test_calc_counted_once_with_result_cache(bpc,tmp_path):
+    cache = bpc_engine.ResultCache(str(tmp_path))
+    profiler = bpc_engine.enableProfiling()
+    try:
+        bpc.calc(cache=cache) # miss
+        assert profiler.stats["calc"][0] == 1
+        assert profiler.stats["_calcLoop"][0] == 1
+        bpc.calc(cache=cache) # hit
+        assert profiler.stats["calc"][0] == 2
+        assert profiler.stats["_calcLoop"][0] == 1
+    finally:
+        bpc_engine.disableProfiling()
@@ -0,0 +1,53 @@
+import copy
+import itertools
+
+import pytest
+
+import bpc_bench
+from boss_priority_calc import SpecToRole
+
+def raidMeanEnu(bpc,char_names,contention):
+    # summed mean_enu of a raid of char_names, from the per loot upgrades of the whole bench calc
+    total = 0.0
+    for boss_name , upgrades in bpc._upgrades.items():
+        if contention:
+            loot_ids = set(loot_id for char_name in char_names for loot_id in upgrades[char_name])
+            total += sum(max(upgrades[char_name].get(loot_id,0.0) for char_name in char_names) for loot_id in loot_ids)
+        else:
+            total += sum(sum(upgrades[char_name].values()) for char_name in char_names)
+    return(total/len(char_names))
+
+def calcMeanEnu(bpc,char_names,contention):
+    # summed mean_enu of a full calc of the raid of char_names only
+    bpc = copy.deepcopy(bpc)
+    for char_name in list(bpc.raid):
+        if char_name not in char_names:
+            del bpc.raid[char_name]
+    bpc.calc(contention=contention)
+    return(sum(boss.mean_enu for boss in bpc.bosses.values()))
+
+@pytest.mark.parametrize("contention",[True,False])
+@pytest.mark.parametrize("seed",range(4))
+def test_select_roster_matches_brute_force(seed,contention):
+    bpc = bpc_bench.makeSynthetic(11,150,seed)
+    bpc.calc(contention=contention)
+    size = 6
+    role = {char_name:SpecToRole[char.spec_class] for char_name , char in bpc.raid.items()}
+    roles = sorted(set(role.values()))
+    bounds = [({},{}),({roles[0]:1},{}),({},{roles[0]:1,roles[-1]:2}),({roles[0]:1,roles[-1]:1},{roles[0]:2})]
+    for role_min , role_max in bounds:
+        feasible = []
+        for char_names in itertools.combinations(bpc.raid,size):
+            count = {r:sum(1 for char_name in char_names if role[char_name] == r) for r in roles}
+            if all(count[r] >= n for r , n in role_min.items()) and all(count[r] <= n for r , n in role_max.items()):
+                feasible.append(raidMeanEnu(bpc,char_names,contention))
+        char_names , mean_enu = bpc.selectRoster(size,role_min=role_min,role_max=role_max)
+        assert mean_enu == pytest.approx(max(feasible))
+        # reported mean_enu is what a calc of the picked raid gives
+        assert mean_enu == pytest.approx(calcMeanEnu(bpc,char_names,contention))
+
+def test_select_roster_after_numpy_calc(bpc):
+    # numpy engine keeps no per loot upgrades, they are redone from current gear
+    bpc.calc(engine="numpy")
+    char_names , mean_enu = bpc.selectRoster(20)
+    assert mean_enu == pytest.approx(calcMeanEnu(bpc,char_names,True))
@@ -0,0 +1,103 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from boss_priority_calc import Raid, RaidBossDeps, RaidResetDays, RaidToBossMap
+
+def randomBossValues(bpc,seed,raids=None):
+    # random mean_enu per boss so solver results do not hinge on the shipped data, bosses outside raids are worth nothing
+    rng = np.random.default_rng(seed)
+    for boss in bpc.bosses.values():
+        boss.mean_enu = float(rng.uniform(0,1)) if raids is None or boss.raid in raids else 0.0
+        boss.mean_enupm = boss.mean_enu/boss.clear_time
+
+def closedBossSets(raid):
+    # every boss set of raid that holds the prerequisites of its bosses
+    boss_list = RaidToBossMap[raid]
+    for n in range(len(boss_list) + 1):
+        for boss_set in itertools.combinations(boss_list,n):
+            if all(dep in boss_set for boss_name in boss_set for dep in RaidBossDeps[raid].get(boss_name,[])):
+                yield(boss_set)
+
+@pytest.mark.parametrize("seed",range(3))
+def test_schedule_raid_matches_brute_force(bpc,seed):
+    randomBossValues(bpc,seed)
+    for raid in range(Raid.SIZE):
+        for time_budget , min_enupm in [(math.inf,0.0),(60.0,0.0),(120.0,0.005),(math.inf,0.01)]:
+            boss_names , mean_enu , clear_time = bpc.scheduleRaid(raid,time_budget,min_enupm)
+            best = max(sum(bpc.bosses[boss_name].mean_enu - min_enupm*bpc.bosses[boss_name].clear_time for boss_name in boss_set)
+                for boss_set in closedBossSets(raid) if sum(bpc.bosses[boss_name].clear_time for boss_name in boss_set) <= time_budget)
+            assert mean_enu - min_enupm*clear_time == pytest.approx(best)
+            assert clear_time <= time_budget
+            # kill order follows the dependencies
+            for i , boss_name in enumerate(boss_names):
+                assert all(dep in boss_names[:i] for dep in RaidBossDeps[raid].get(boss_name,[]))
+
+@pytest.mark.parametrize("seed",range(3))
+def test_optimize_route_matches_brute_force(bpc,seed):
+    raids = [Raid.BWL,Raid.AQ20]
+    randomBossValues(bpc,seed,raids)
+    for time_budget in [30.0,90.0,180.0,1000.0]:
+        boss_names , mean_enu , clear_time = bpc.optimizeRoute(time_budget)
+        best = 0.0
+        for boss_sets in itertools.product(*[list(closedBossSets(raid)) for raid in raids]):
+            boss_set = [boss_name for raid_set in boss_sets for boss_name in raid_set]
+            if sum(bpc.bosses[boss_name].clear_time for boss_name in boss_set) <= time_budget:
+                best = max(best,sum(bpc.bosses[boss_name].mean_enu for boss_name in boss_set))
+        assert mean_enu == pytest.approx(best)
+        assert clear_time <= time_budget + 1e-9
+
+def weekBest(bpc,lockouts,time_budget):
+    # best summed mean_enu of running each lockout of one week with one of its raid's route options within time_budget
+    best = 0.0
+    for choice in itertools.product(*[bpc._raidRouteOptions(raid) for raid , start in lockouts]):
+        if sum(option[0] for option in choice) <= time_budget + 1e-9:
+            best = max(best,sum(option[1] for option in choice))
+    return(best)
+
+@pytest.mark.parametrize("seed",range(15))
+def test_plan_lockouts_matches_brute_force(bpc,seed):
+    raids = [Raid.ONY,Raid.BWL,Raid.ZG]
+    randomBossValues(bpc,seed,raids)
+    # value on the first bosses only keeps the route options, and so the brute force, small
+    for raid in raids:
+        for boss_name in RaidToBossMap[raid][3:]:
+            bpc.bosses[boss_name].mean_enu = 0.0
+    rng = np.random.default_rng(seed)
+    n_weeks = 2
+    weekly_hours = [float(rng.choice([0.5,1.0,1.5])) for week in range(n_weeks)]
+    next_reset = {Raid.ZG:int(rng.integers(1,4)),Raid.ONY:int(rng.integers(1,6))} if seed % 2 == 1 else None
+    plan , total = bpc.planLockouts(weekly_hours,n_weeks=n_weeks,next_reset=next_reset)
+
+    # every lockout (raid, start day) with the weeks it overlaps
+    lockouts = []
+    for raid in raids:
+        days = RaidResetDays[raid]
+        start = (next_reset or {}).get(raid,days) - days
+        while start < 7*n_weeks:
+            weeks = [week for week in range(n_weeks) if start < 7*(week + 1) and start + days > 7*week]
+            lockouts.append(((raid,start),weeks))
+            start += days
+    memo = {}
+    best = 0.0
+    for weeks in itertools.product(*[[None] + lockout_weeks for lockout , lockout_weeks in lockouts]):
+        value = 0.0
+        for week in range(n_weeks):
+            run = tuple(lockouts[i][0] for i in range(len(lockouts)) if weeks[i] == week)
+            if (week,run) not in memo:
+                memo[(week,run)] = weekBest(bpc,run,60*weekly_hours[week])
+            value += memo[(week,run)]
+        best = max(best,value)
+    assert total == pytest.approx(best)
+
+    # plan itself is consistent: each lockout run once, in a week it overlaps, within the week's hours
+    run_lockouts = [(raid,start) for runs , mean_enu , clear_time in plan for raid , start , boss_names in runs]
+    assert len(run_lockouts) == len(set(run_lockouts))
+    for week , (runs , mean_enu , clear_time) in enumerate(plan):
+        assert clear_time <= 60*weekly_hours[week] + 1e-9
+        assert mean_enu == pytest.approx(sum(bpc.bosses[boss_name].mean_enu for raid , start , boss_names in runs for boss_name in boss_names))
+        for raid , start , boss_names in runs:
+            assert week in dict(lockouts)[(raid,start)]
+    assert total == pytest.approx(sum(mean_enu for runs , mean_enu , clear_time in plan))
@@ -0,0 +1,34 @@
+import pytest
+
+import boss_priority_calc as bpc_engine
+from boss_priority_calc import Slot
+
+def test_rejected_loot_leaves_session_unchanged(bpc,tmp_path):
+    log_path = str(tmp_path/"session.jsonl")
+    session = bpc_engine.RaidSession(bpc,log_path=log_path)
+    char = bpc.raid["Milku"]
+    gear = [list(items) if isinstance(items,list) else items for items in char.gear]
+    priority = session.priority()
+
+    # worth 0 ep for the spec, in a slot the character has nothing in
+    with pytest.raises(RuntimeError):
+        session.giveLoot("Milku","Staff of Dominance")
+    assert char.gear == gear
+    assert "Milku" not in bpc._dirty
+    assert session.priority() == priority
+    assert session.events == []
+
+    # next valid event still applies and only it is logged
+    loot_name = next(bpc.loot_by_id[loot_id].name for upgrades in bpc._upgrades.values() for loot_id in upgrades["Milku"]
+        if bpc.loot_by_id[loot_id].slot != Slot.ZG_ENCHANTS)
+    session.giveLoot("Milku",loot_name)
+    assert loot_name in char.gear[bpc.loot_db[loot_name].slot]
+    assert len(session.events) == 1
+    with open(log_path) as f:
+        assert len(f.read().splitlines()) == 1
+
+def test_loot_for_unknown_character_is_rejected(bpc):
+    session = bpc_engine.RaidSession(bpc)
+    with pytest.raises(RuntimeError):
+        session.giveLoot("Nobody","Staff of Dominance")
+    assert session.events == []
@@ -0,0 +1,10 @@
+import pytest
+
+def test_simulate_rejects_no_lockouts(bpc):
+    for n_lockouts in (0,-1):
+        with pytest.raises(RuntimeError):
+            bpc.simulate(n_lockouts,n_workers=1)
+
+def test_simulate_single_lockout(bpc):
+    sim = bpc.simulate(1,n_workers=1)
+    assert set(sim) == set(bpc.bosses)
@@ -0,0 +1,31 @@
+import json
+import os
+
+import pytest
+
+import boss_priority_calc as bpc_engine
+
+def test_snapshot_matches_loot_db(bpc,tmp_path):
+    bpc.exportSnapshot(str(tmp_path))
+    snapshot_bpc = bpc_engine.BossPrioCalc()
+    snapshot_bpc.attachSnapshot(bpc_engine.LootSnapshot(str(tmp_path)))
+    with open(os.path.join(bpc_engine.DATA_DIR,"roster.json"),encoding="utf-8") as f:
+        snapshot_bpc.addRoster(json.load(f))
+
+    for contention in [True,False]:
+        bpc.calc(engine="numpy",contention=contention)
+        snapshot_bpc.calc(engine="numpy",contention=contention)
+        assert list(snapshot_bpc.bosses) == list(bpc.bosses)
+        for boss_name , boss in bpc.bosses.items():
+            snapshot_boss = snapshot_bpc.bosses[boss_name]
+            assert snapshot_boss.mean_enu == pytest.approx(boss.mean_enu,abs=1e-12)
+            assert snapshot_boss.mean_enupm == pytest.approx(boss.mean_enupm,abs=1e-12)
+            for char_name in boss.enu:
+                assert snapshot_boss.enu[char_name] == pytest.approx(boss.enu[char_name],abs=1e-12)
+
+def test_snapshot_rejects_loop_engine(bpc,tmp_path):
+    bpc.exportSnapshot(str(tmp_path))
+    snapshot_bpc = bpc_engine.BossPrioCalc()
+    snapshot_bpc.attachSnapshot(bpc_engine.LootSnapshot(str(tmp_path)))
+    with pytest.raises(RuntimeError):
+        snapshot_bpc.calc(engine="loop")
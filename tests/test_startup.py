@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+import bpc_cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_import_within_budget():
+    assert bpc_cli.measureImport(repeat=5) <= bpc_cli.IMPORT_BUDGET_S
+
+def test_import_has_no_side_effects():
+    # no output, no plotting library and no calc on import
+    code = "import sys, boss_priority_calc; assert 'matplotlib' not in sys.modules"
+    proc = subprocess.run([sys.executable,"-c",code],capture_output=True,text=True,cwd=ROOT)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout == ""
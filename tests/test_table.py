@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+import boss_priority_calc as bpc_engine
+
+def itemRows(columns):
+    # item rows as sorted (boss, char, item, enu) tuples, independent of row order
+    item_rows = columns["row"][0] == 0
+    return(sorted(zip(columns["boss"][0][item_rows].tolist(),columns["char"][0][item_rows].tolist(),
+        columns["item"][0][item_rows].tolist(),np.round(columns["enu"][item_rows],12).tolist())))
+
+def test_upgrade_columns_match_calc(bpc):
+    columns = bpc.upgradeColumns()
+    bpc.calc(engine="numpy")
+    boss_rows = columns["row"][0] == 1
+    for boss_code , enu in zip(columns["boss"][0][boss_rows],columns["enu"][boss_rows]):
+        assert enu == pytest.approx(bpc.bosses[columns["boss"][1][boss_code]].mean_enu,abs=1e-12)
+
+def test_upgrade_columns_blocks_match_single_block(bpc,monkeypatch):
+    single = bpc.upgradeColumns()
+    # a few items per block
+    monkeypatch.setattr(bpc_engine,"NUMPY_BLOCK_CELLS",7*len(bpc.raid))
+    blocked = bpc.upgradeColumns()
+    assert itemRows(blocked) == itemRows(single)
+    boss_rows = single["row"][0] == 1
+    assert blocked["enu"][boss_rows] == pytest.approx(single["enu"][boss_rows],abs=1e-12)